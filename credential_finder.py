@@ -10,13 +10,21 @@ from dotenv import load_dotenv
 import os
 import json
 import time
+import concurrent.futures
 from urllib.parse import urljoin, urlparse
 import re
+from enum import Enum
 from typing import List, Dict, Optional, Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from search_engine_interface import (
     UnifiedSearchManager,
     SearchEngineType,
     create_search_manager,
+    create_http_session,
     SearchResultComparator
 )
 from query_optimizer import QueryOptimizer, EngineAwareSearchManager
@@ -71,6 +79,9 @@ API_KEY_PATTERNS = {
 }
 
 class CredentialFinder:
+    # Lists at least this long are written to disk one record at a time
+    STREAM_MIN_ITEMS = 1000
+
     def __init__(self, engine_type: SearchEngineType = None):
         """
         Initialize CredentialFinder with support for multiple search engines
@@ -79,7 +90,7 @@ class CredentialFinder:
             engine_type: Type of search engine to use (Google or DuckDuckGo)
                         If None, will try to use Google first, fallback to DuckDuckGo
         """
-        self.session = requests.Session()
+        self.session = create_http_session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
@@ -811,26 +822,35 @@ class CredentialFinder:
         Returns:
             Dictionary with results for each platform
         """
-        print(f"🔍 Buscando API keys en todas las plataformas con {self.current_engine_type.value}...")
+        return dict(self.iter_all_api_keys())
+    
+    def iter_all_api_keys(self):
+        """
+        Search for API keys platform by platform
         
-        results = {
-            'openai': self.find_openai_api_keys(),
-            'github': self.find_github_tokens(),
-            'slack': self.find_slack_tokens(),
-            'google': self.find_google_api_keys(),
-            'square': self.find_square_tokens(),
-            'shopify': self.find_shopify_secrets(),
-            'mercadopago': self.find_mercadopago_tokens()
-        }
+        Yields:
+            (platform, results) tuples, one per supported platform, as each search finishes
+        """
+        print(f"🔍 Buscando API keys en todas las plataformas con {self.current_engine_type.value}...")
         
-        return results
+        yield 'openai', self.find_openai_api_keys()
+        yield 'github', self.find_github_tokens()
+        yield 'slack', self.find_slack_tokens()
+        yield 'google', self.find_google_api_keys()
+        yield 'square', self.find_square_tokens()
+        yield 'shopify', self.find_shopify_secrets()
+        yield 'mercadopago', self.find_mercadopago_tokens()
     
-    def find_all_api_keys_cross_engine(self):
+    def find_all_api_keys_cross_engine(self, max_concurrency: int = 4):
         """
         Search for API keys across all supported platforms using cross-engine search
         
+        Args:
+            max_concurrency: Platforms searched at the same time (1 = one by one).
+                             Platform searches start at least 2 s apart either way.
+        
         Returns:
-            Cross-engine comparison results for all platforms
+            Cross-engine comparison results for all platforms, in platform order
         """
         print("🔍 Búsqueda multi-motor de API keys en todas las plataformas...")
         
@@ -845,17 +865,31 @@ class CredentialFinder:
             'mercadopago': '("APP_USR-" OR "TEST-") OR site:github.com "MERCADOPAGO_ACCESS_TOKEN"'
         }
         
-        all_results = {}
-        
-        for platform, query in platform_queries.items():
+        def _search_platform(platform, query):
             print(f"\n🔍 Searching {platform.upper()} tokens with multiple engines...")
             try:
-                results = self.cross_engine_search(query, num=self.default_num_results)
-                all_results[platform] = results
-                time.sleep(2)  # Rate limiting between platforms
+                return self.cross_engine_search(query, num=self.default_num_results)
             except Exception as e:
                 print(f"❌ Error in {platform} search: {e}")
-                all_results[platform] = {}
+                return {}
+        
+        all_results = {}
+        
+        if max_concurrency <= 1:
+            for platform, query in platform_queries.items():
+                all_results[platform] = _search_platform(platform, query)
+                time.sleep(2)  # Rate limiting between platforms
+            return all_results
+        
+        # Platforms are independent: overlap their network latency, bounded by max_concurrency
+        futures = {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            for platform, query in platform_queries.items():
+                if futures:
+                    time.sleep(2)  # Rate limiting between platform starts
+                futures[platform] = executor.submit(_search_platform, platform, query)
+            for platform, future in futures.items():
+                all_results[platform] = future.result()
         
         return all_results
     
@@ -970,40 +1004,89 @@ class CredentialFinder:
             min_quality_score: Minimum quality_score (if present on result)
             min_risk_score: Minimum risk_score (will be computed if absent)
         """
-        if keywords:
-            base = self.filter_results(results, keywords)
-        else:
-            base = results or []
+        # Thin adapter: one filtering implementation, fed precomputed structures.
+        # Keywords are matched as given against the lowercased text (like filter_results).
+        return self.filter_results_advanced_fast(
+            results,
+            keywords_set=frozenset(keywords) if keywords else None,
+            allowed_set=frozenset(d.lower() for d in allowed_domains) if allowed_domains else None,
+            blocked_set=frozenset(d.lower() for d in blocked_domains) if blocked_domains else None,
+            ft_re=self.filetypes_re(required_filetypes),
+            min_quality=min_quality_score,
+            min_risk=min_risk_score,
+        )
+    
+    @staticmethod
+    def filetypes_re(filetypes: Optional[List[str]]) -> Optional["re.Pattern[str]"]:
+        """Case-insensitive alternation of file extensions for filter_results_advanced_fast(ft_re=...)."""
+        if not filetypes:
+            return None
+        return re.compile("|".join(map(re.escape, filetypes)), re.IGNORECASE)
+    
+    def filter_results_advanced_fast(
+        self,
+        items: List[Dict[str, str]],
+        *,
+        keywords_set: Optional[frozenset] = None,
+        allowed_set: Optional[frozenset] = None,
+        blocked_set: Optional[frozenset] = None,
+        ft_re: Optional["re.Pattern[str]"] = None,
+        min_quality: Optional[float] = None,
+        min_risk: Optional[float] = None,
+    ) -> List[Dict[str, str]]:
+        """
+        Advanced filtering over precomputed filter structures, so large merged
+        result sets are scanned in a single pass. filter_results_advanced()
+        builds these structures from plain lists and delegates here.
+        
+        Args:
+            items: List of standardized results
+            keywords_set: Keywords matched as substrings of the lowercased title/snippet/link
+            allowed_set: Lowercased domains; URL must contain at least one
+            blocked_set: Lowercased domains; URL must contain none
+            ft_re: Compiled alternation of required filetypes (matched case-insensitively)
+            min_quality: Minimum quality_score (if present on result)
+            min_risk: Minimum risk_score (will be computed if absent)
+        """
+        # Substring semantics are kept; each set collapses into one C-level regex scan.
+        def _any_of(terms):
+            if not terms:
+                return None
+            return re.compile("|".join(map(re.escape, sorted(terms, key=len, reverse=True))))
+        
+        kw_re = _any_of(keywords_set)
+        allowed_re = _any_of(allowed_set)
+        blocked_re = _any_of(blocked_set)
         
         filtered: List[Dict[str, str]] = []
-        for result in base:
-            url = result.get("link", "") or ""
-            lowered_url = url.lower()
+        for result in items or []:
+            lowered_url = (result.get("link", "") or "").lower()
             
-            # Domain filters
-            if allowed_domains:
-                if not any(dom.lower() in lowered_url for dom in allowed_domains):
-                    continue
-            if blocked_domains:
-                if any(dom.lower() in lowered_url for dom in blocked_domains):
+            if kw_re is not None:
+                title = (result.get("title", "") or "").lower()
+                snippet = (result.get("snippet", "") or "").lower()
+                if not kw_re.search(f"{title} {snippet} {lowered_url}"):
                     continue
+                result["risk_score"] = self._compute_risk_score(result)
+            
+            if allowed_re is not None and not allowed_re.search(lowered_url):
+                continue
+            if blocked_re is not None and blocked_re.search(lowered_url):
+                continue
             
-            # Filetype filters
-            if required_filetypes:
-                ft = self._infer_filetype_from_url(url)
-                if not ft or ft.lower() not in [f.lower() for f in required_filetypes]:
+            if ft_re is not None:
+                ft = self._infer_filetype_from_url(lowered_url)
+                if not ft or not ft_re.fullmatch(ft):
                     continue
             
-            # Quality score
-            if min_quality_score is not None:
+            if min_quality is not None:
                 q = result.get("quality_score")
-                if q is None or q < min_quality_score:
+                if q is None or q < min_quality:
                     continue
             
-            # Risk score (compute if missing)
             if "risk_score" not in result:
                 result["risk_score"] = self._compute_risk_score(result)
-            if min_risk_score is not None and result["risk_score"] < min_risk_score:
+            if min_risk is not None and result["risk_score"] < min_risk:
                 continue
             
             filtered.append(result)
@@ -1096,10 +1179,40 @@ class CredentialFinder:
         """
         return list(API_KEY_PATTERNS.keys())
     
+    @staticmethod
+    def _jsonable(obj):
+        """Turn SearchEngineType keys/values into plain strings for the stdlib encoder"""
+        if isinstance(obj, dict):
+            return {
+                (k.value if isinstance(k, Enum) else k): CredentialFinder._jsonable(v)
+                for k, v in obj.items()
+            }
+        if isinstance(obj, (list, tuple)):
+            return [CredentialFinder._jsonable(v) for v in obj]
+        if isinstance(obj, Enum):
+            return obj.value
+        return obj
+    
+    def encode_json(self, data) -> bytes:
+        """Encode results as indented UTF-8 JSON (orjson si está instalado)"""
+        if orjson is not None:
+            # Enum keys (results_by_engine, overlap_percentage) are written by value
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        return json.dumps(self._jsonable(data), indent=2, ensure_ascii=False).encode('utf-8')
+    
     def save_results(self, results, filename):
-        """Guardar resultados en un archivo JSON"""
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        """Guardar resultados en un archivo JSON (orjson si está instalado)"""
+        with open(filename, 'wb') as f:
+            if isinstance(results, list) and len(results) >= self.STREAM_MIN_ITEMS:
+                # Encode record by record so no single huge bytes object is built
+                f.write(b'[\n')
+                for i, item in enumerate(results):
+                    if i:
+                        f.write(b',\n')
+                    f.write(self.encode_json(item))
+                f.write(b'\n]')
+            else:
+                f.write(self.encode_json(results))
         print(f"💾 Resultados guardados en {filename}")
     
     def display_results(self, results, category, is_cross_engine: bool = False):
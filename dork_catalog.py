@@ -6,9 +6,10 @@ Provides a high-level API to access Google dork definitions stored in
 `dorks_catalog.json`.
 """
 
+import functools
 import json
 import os
-from typing import List, Dict, Any, Optional, Set
+from typing import List, Dict, Any, Optional, Set, Tuple
 
 
 class DorkCatalog:
@@ -48,15 +49,20 @@ class DorkCatalog:
         self._load_if_needed()
         return list(self._dorks)
 
-    def get_categories(self) -> List[str]:
-        """Return a sorted list of category names present in the catalog."""
+    @functools.cached_property
+    def categories(self) -> Tuple[str, ...]:
+        """Sorted category names, computed once (the catalog is loaded only once)."""
         self._load_if_needed()
         categories: Set[str] = set()
         for d in self._dorks:
             cat = d.get("category")
             if isinstance(cat, str) and cat:
                 categories.add(cat)
-        return sorted(categories)
+        return tuple(sorted(categories))
+
+    def get_categories(self) -> List[str]:
+        """Return a sorted list of category names present in the catalog."""
+        return list(self.categories)
 
     def get_by_category(self, category: str) -> List[Dict[str, Any]]:
         """Return all dorks that belong to a given category."""
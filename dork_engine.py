@@ -384,33 +384,27 @@ class DorkEngine:
         # Combine results across all dorks and engines
         all_results_by_engine: Dict[SearchEngineType, List[Dict[str, Any]]] = {}
         total_unique_urls: set[str] = set()
+        engine_urls: Dict[SearchEngineType, set[str]] = {}
 
+        # Single pass: merge per-engine lists and collect global/per-engine unique URLs
         for dork_id, dork_result in cross_engine_results.items():
             results_by_engine = dork_result.get("results_by_engine", {})
 
             for engine_type, results in results_by_engine.items():
-                if engine_type not in all_results_by_engine:
-                    all_results_by_engine[engine_type] = []
-                all_results_by_engine[engine_type].extend(results)
-
-                # Collect unique URLs
+                all_results_by_engine.setdefault(engine_type, []).extend(results)
+                urls = engine_urls.setdefault(engine_type, set())
                 for result in results:
                     url = result.get("link")
                     if url:
+                        urls.add(url)
                         total_unique_urls.add(url)
 
-        # Calculate overlap percentages
-        overlap_percentages: Dict[SearchEngineType, float] = {}
+        # Every engine URL is in the global set, so overlap is a plain ratio
         engines = list(all_results_by_engine.keys())
-
-        for engine in engines:
-            engine_urls = {r.get("link") for r in all_results_by_engine[engine] if r.get("link")}
-            overlap = (
-                len(total_unique_urls.intersection(engine_urls)) / len(total_unique_urls)
-                if total_unique_urls
-                else 0
-            )
-            overlap_percentages[engine] = overlap
+        overlap_percentages: Dict[SearchEngineType, float] = {
+            engine: (len(engine_urls[engine]) / len(total_unique_urls) if total_unique_urls else 0)
+            for engine in engines
+        }
 
         # Build a best_combined list using SearchResultComparator
         results_list: List[List[Dict[str, Any]]] = list(all_results_by_engine.values())
@@ -425,7 +419,7 @@ class DorkEngine:
 
         return {
             "cross_engine_results": cross_engine_results,
-            "combined_by_engine": all_results_by_engine,
+            "results_by_engine": all_results_by_engine,
             "total_unique_urls": len(total_unique_urls),
             "overlap_percentage": overlap_percentages,
             "engines_tested": engines,
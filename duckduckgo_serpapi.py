@@ -9,8 +9,7 @@ from dotenv import load_dotenv
 import os
 import time
 from typing import Dict, List, Optional, Any
-from urllib.parse import quote
-from search_engine_interface import SearchEngineInterface, SearchEngineType
+from search_engine_interface import SearchEngineInterface, SearchEngineType, create_http_session
 
 load_dotenv()
 
@@ -29,17 +28,22 @@ class DuckDuckGoSerpAPI(SearchEngineInterface):
     def __init__(self):
         self.api_key = os.getenv('SERP_API_KEY')
         self.base_url = "https://serpapi.com/search"
-        self.session = requests.Session()
+        self.session = create_http_session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
         
         if not self.api_key:
             raise ValueError("SERP_API_KEY not found in environment variables")
+        
+        # Conditional-GET cache for slow-changing endpoints (trending, suggestions)
+        # params -> {'etag': ..., 'last_modified': ..., 'data': ..., 'fetched_at': ...}
+        self.cache_ttl = 300
+        self._response_cache: Dict[tuple, Dict[str, Any]] = {}
     
-    def build_url(self, query: str, num: int = 10, **kwargs) -> str:
+    def build_params(self, query: str, num: int = 10, **kwargs) -> Dict[str, Any]:
         """
-        Build SerpAPI URL for DuckDuckGo search following official parameters.
+        Build SerpAPI query parameters for DuckDuckGo search following official parameters.
         
         Docs: https://serpapi.com/duckduckgo-search-api
         - q      : query string
@@ -111,20 +115,65 @@ class DuckDuckGoSerpAPI(SearchEngineInterface):
             if value is not None:
                 params[key] = value
         
-        # Build query string
-        query_string = "&".join([f"{k}={quote(str(v))}" for k, v in params.items()])
-        return f"{self.base_url}?{query_string}"
+        return params
+    
+    def build_url(self, query: str, num: int = 10, **kwargs) -> str:
+        """
+        Build the full SerpAPI URL for a DuckDuckGo search.
+        Quoting is delegated to requests so values are encoded exactly once.
+        """
+        params = self.build_params(query, num, **kwargs)
+        return requests.Request('GET', self.base_url, params=params).prepare().url
+    
+    def _get_json(self, params: Dict[str, Any], use_cache: bool = False) -> Dict[str, Any]:
+        """
+        GET the SerpAPI endpoint with `params` and return the parsed JSON body.
+        
+        With use_cache=True the parsed response is kept for `cache_ttl` seconds.
+        Once expired, the request is revalidated with If-None-Match /
+        If-Modified-Since; a 304 reuses the cached object without re-parsing.
+        Raises requests.RequestException on HTTP errors.
+        """
+        cache_key = tuple(sorted((k, str(v)) for k, v in params.items()))
+        cached = self._response_cache.get(cache_key) if use_cache else None
+        headers = {}
+        
+        if cached:
+            if time.time() - cached['fetched_at'] < self.cache_ttl:
+                return cached['data']
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+        
+        response = self.session.get(self.base_url, params=params,
+                                    headers=headers or None, timeout=30)
+        
+        if cached and response.status_code == 304:
+            cached['fetched_at'] = time.time()
+            return cached['data']
+        
+        response.raise_for_status()
+        data = response.json()
+        
+        if use_cache:
+            self._response_cache[cache_key] = {
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'data': data,
+                'fetched_at': time.time(),
+            }
+        
+        return data
     
     def search(self, query: str, num: int = 10, **kwargs) -> Optional[Dict[str, Any]]:
         """
         Perform DuckDuckGo search via SerAPI
         """
-        url = self.build_url(query, num, **kwargs)
+        params = self.build_params(query, num, **kwargs)
         
         try:
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            return response.json()
+            return self._get_json(params)
         except requests.RequestException as e:
             print(f"❌ Error making SerAPI request: {e}")
             return None
@@ -218,12 +267,8 @@ class DuckDuckGoSerpAPI(SearchEngineInterface):
             'api_key': self.api_key
         }
         
-        url = f"{self.base_url}?{ '&'.join([f'{k}={quote(str(v))}' for k, v in params.items()]) }"
-        
         try:
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            data = self._get_json(params, use_cache=True)
             
             suggestions = []
             if 'suggestions' in data:
@@ -246,12 +291,8 @@ class DuckDuckGoSerpAPI(SearchEngineInterface):
             'api_key': self.api_key
         }
         
-        url = f"{self.base_url}?{ '&'.join([f'{k}={quote(str(v))}' for k, v in params.items()]) }"
-        
         try:
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            data = self._get_json(params, use_cache=True)
             
             trending = []
             if 'trending_searches' in data:
@@ -275,12 +316,8 @@ class DuckDuckGoSerpAPI(SearchEngineInterface):
             'num': num
         }
         
-        url = f"{self.base_url}?{ '&'.join([f'{k}={quote(str(v))}' for k, v in params.items()]) }"
-        
         try:
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            data = self._get_json(params)
             
             image_results = []
             if 'images_results' in data:
@@ -314,12 +351,8 @@ class DuckDuckGoSerpAPI(SearchEngineInterface):
         if time_range:
             params['time_range'] = time_range
         
-        url = f"{self.base_url}?{ '&'.join([f'{k}={quote(str(v))}' for k, v in params.items()]) }"
-        
         try:
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            data = self._get_json(params)
             
             news_results = []
             if 'news_results' in data:
@@ -363,14 +396,8 @@ class DuckDuckGoSerpAPI(SearchEngineInterface):
         region = kwargs.get('region', 'us-en')
         params['kl'] = region
         
-        # Build URL
-        query_string = "&".join([f"{k}={quote(str(v))}" for k, v in params.items()])
-        url = f"{self.base_url}?{query_string}"
-        
         try:
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            data = self._get_json(params)
             
             book_results = []
             if 'organic_results' in data:
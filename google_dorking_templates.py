@@ -4,6 +4,8 @@ Advanced Google Dorking Templates for Credential Discovery
 Pre-built dorking queries for different types of sensitive information
 """
 
+import functools
+
 class GoogleDorkTemplates:
     
     @staticmethod
@@ -513,8 +515,9 @@ class GoogleDorkTemplates:
         ]
     
     @staticmethod
+    @functools.cache
     def all_templates():
-        """Return all template categories"""
+        """Return all template categories (built once; treat as read-only)"""
         return {
             'env_files': GoogleDorkTemplates.env_files(),
             'config_files': GoogleDorkTemplates.config_files(),
@@ -2,7 +2,7 @@ import requests
 from dotenv import load_dotenv
 import os
 from typing import Dict, List, Optional, Any
-from search_engine_interface import SearchEngineInterface, SearchEngineType
+from search_engine_interface import SearchEngineInterface, SearchEngineType, create_http_session
 
 load_dotenv()
 
@@ -15,6 +15,7 @@ class GoogleSearch(SearchEngineInterface):
     def __init__(self):
         self.api_key = os.getenv('API_KEY_GOOGLE')
         self.engine_id = os.getenv('SEARCH_ENGINE_ID')
+        self.session = create_http_session()
 
     @property
     def engine_type(self) -> SearchEngineType:
@@ -31,7 +32,7 @@ class GoogleSearch(SearchEngineInterface):
         """
         url = self.build_url(query, num)
         try:
-            response = requests.get(url)
+            response = self.session.get(url)
             response.raise_for_status()
             return response.json()
         except requests.RequestException as e:
@@ -101,7 +102,7 @@ class GoogleSearch(SearchEngineInterface):
         url = self.build_url(book_query, num)
         
         try:
-            response = requests.get(url)
+            response = self.session.get(url)
             response.raise_for_status()
             data = response.json()
             
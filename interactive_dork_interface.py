@@ -5,16 +5,62 @@ Enhanced OSINT and camera customization options
 """
 
 import os
+import re
+import sys
 import json
+import concurrent.futures
+from urllib.parse import urlsplit
 from typing import Dict, List, Any, Optional, Tuple
 from search_engine_interface import SearchEngineType
 from dork_catalog import DorkCatalog
 from dork_engine import DorkEngine
 
+try:
+    import orjson  # Optional: C-accelerated JSON encoder used for saving results
+except ImportError:
+    orjson = None
+
+# Characters not allowed in saved result filenames (same set str.isalnum() rejects)
+_SANITIZE_RE = re.compile(r'[^\w-]')
+
+# Selection tokens: single numbers ("3") or ranges ("1-5")
+_SELECTION_RE = re.compile(r'(\d+)(?:\s*-\s*(\d+))?')
+
 
 class InteractiveDorkInterface:
     """Interactive interface for selecting and executing individual dorks with pagination"""
     
+    # Query templates used by the OSINT customization flows
+    SEARCH_TEMPLATES: Dict[str, Tuple[str, ...]] = {
+        'domain': (
+            'site:{domain} inurl:login',
+            'site:{domain} inurl:upload',
+            'site:{domain} filetype:pdf',
+            'site:{domain} "document" OR "confidential"',
+        ),
+        'google_docs': (
+            'site:docs.google.com filetype:{file_type} {term}',
+        ),
+        'upload_domain': (
+            'site:{domain} inurl:upload',
+            'site:{domain} inurl:files',
+            'site:{domain} inurl:attachments',
+            'site:{domain} inurl:submit',
+        ),
+        'upload_generic': (
+            'inurl:upload "upload" OR "file" OR "attach"',
+            'inurl:files "upload" OR "file" OR "attach"',
+            'inurl:attachments "upload" OR "file" OR "attach"',
+            'inurl:submit "upload" OR "file" OR "attach"',
+        ),
+        'login': (
+            'site:{domain} inurl:login',
+            'site:{domain} inurl:admin',
+            'site:{domain} inurl:signin',
+            'site:{domain} intitle:"login" OR intitle:"sign in"',
+        ),
+    }
+    
     def __init__(self, dork_engine: DorkEngine):
         """Initialize with a DorkEngine instance"""
         self.dork_engine = dork_engine
@@ -22,10 +68,22 @@ class InteractiveDorkInterface:
         self.results_cache = {}  # Cache for pagination
         self.current_page = 1
         self.results_per_page = 10
-        
+        self.max_workers = 8  # Concurrent searches per batch
+        self._category_cache: Dict[str, List[Dict[str, Any]]] = {}
+        self._last_rendered: Tuple[int, List[Dict[str, Any]]] = (0, [])  # (page, page slice)
+        self._host_index: Tuple[Optional[List[Dict[str, Any]]], List[str]] = (None, [])  # (results, hosts)
+    
+    def _get_category(self, category: str) -> List[Dict[str, Any]]:
+        """Return the dorks of a category, filtering the catalog only once per category"""
+        dorks = self._category_cache.get(category)
+        if dorks is None:
+            dorks = self.catalog.get_by_category(category)
+            self._category_cache[category] = dorks
+        return dorks
+    
     def show_categories_menu(self) -> Optional[str]:
         """Show categories and allow user selection"""
-        categories = self.catalog.get_categories()
+        categories = self.catalog.categories
         
         if not categories:
             print("❌ No se encontraron categorías de dorks")
@@ -36,7 +94,7 @@ class InteractiveDorkInterface:
         print("Categorías disponibles:")
         
         for idx, cat in enumerate(categories, 1):
-            dorks_in_cat = len(self.catalog.get_by_category(cat))
+            dorks_in_cat = len(self._get_category(cat))
             print(f"{idx:2d}. {cat.replace('_', ' ').title()} ({dorks_in_cat} dorks)")
         print("  0. Volver al menú principal")
         
@@ -57,33 +115,39 @@ class InteractiveDorkInterface:
     
     def show_dorks_in_category(self, category: str) -> List[Dict[str, Any]]:
         """Show all dorks in a category for user selection"""
-        dorks = self.catalog.get_by_category(category)
+        dorks = self._get_category(category)
         
         if not dorks:
             print(f"❌ No se encontraron dorks en la categoría: {category}")
             return []
         
-        print(f"\n📋 Dorks disponibles en: {category.replace('_', ' ').title()}")
-        print("=" * 80)
+        lines = [
+            f"\n📋 Dorks disponibles en: {category.replace('_', ' ').title()}",
+            "=" * 80
+        ]
+        
+        # Color coding for risk levels
+        risk_colors = {
+            'high': '🔴',
+            'medium': '🟡', 
+            'low': '🟢',
+            'info': '🔵'
+        }
         
         for idx, dork in enumerate(dorks, 1):
             title = dork.get('title', 'Sin título')
             query = dork.get('query', '')
             risk = dork.get('risk', 'unknown')
             tags = ', '.join(dork.get('tags', []))
-            
-            # Color coding for risk levels
-            risk_colors = {
-                'high': '🔴',
-                'medium': '🟡', 
-                'low': '🟢',
-                'info': '🔵'
-            }
             risk_icon = risk_colors.get(risk, '⚪')
             
-            print(f"\n{idx:2d}. {risk_icon} {title}")
-            print(f"    Query: {query}")
-            print(f"    Risk: {risk.title()} | Tags: {tags}")
+            lines.append(f"\n{idx:2d}. {risk_icon} {title}\n"
+                         f"    Query: {query}\n"
+                         f"    Risk: {risk.title()} | Tags: {tags}")
+        
+        # Render the whole listing with a single write
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
         
         return dorks
     
@@ -103,41 +167,24 @@ class InteractiveDorkInterface:
             return []
         elif selection == 'all':
             return dorks
-        elif '-' in selection:
-            # Range selection
-            try:
-                start, end = map(int, selection.split('-'))
-                if 1 <= start <= end <= len(dorks):
-                    return dorks[start-1:end]
-                else:
-                    print("❌ Rango fuera de límites.")
-                    return []
-            except ValueError:
-                print("❌ Formato de rango inválido.")
-                return []
-        elif ',' in selection:
-            # Individual selection
-            selected = []
-            for num_str in selection.split(','):
-                try:
-                    idx = int(num_str.strip())
-                    if 1 <= idx <= len(dorks):
-                        selected.append(dorks[idx-1])
-                except ValueError:
-                    print(f"❌ Número inválido: {num_str.strip()}")
-            return selected
-        else:
-            # Single selection
-            try:
-                idx = int(selection)
-                if 1 <= idx <= len(dorks):
-                    return [dorks[idx-1]]
-                else:
-                    print("❌ Número fuera de límites.")
-                    return []
-            except ValueError:
-                print("❌ Selección inválida.")
-                return []
+        
+        indexes = self._parse_selection(selection, len(dorks))
+        if not indexes:
+            print("❌ Selección inválida o fuera de límites.")
+        return [dorks[idx - 1] for idx in indexes]
+    
+    @staticmethod
+    def _parse_selection(selection: str, limit: int) -> List[int]:
+        """
+        Parse a selection such as '1,3,5', '2-4' or '1-3,7' into unique
+        1-based indexes (in input order), dropping anything outside 1..limit
+        """
+        indexes = []
+        for start, end in _SELECTION_RE.findall(selection):
+            first = int(start)
+            last = int(end) if end else first
+            indexes.extend(range(max(first, 1), min(last, limit) + 1))
+        return list(dict.fromkeys(indexes))
     
     def run_selected_dorks(self, selected_dorks: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Execute selected dorks and return results"""
@@ -148,48 +195,60 @@ class InteractiveDorkInterface:
         print(f"\n🔍 Ejecutando {len(selected_dorks)} dork(s) seleccionado(s)")
         print("=" * 60)
         
+        for idx, dork in enumerate(selected_dorks, 1):
+            print(f"{idx}. {dork.get('title', dork.get('id', 'unknown'))}")
+        print("-" * 40)
+        
+        # Searches are network-bound, so run them concurrently. Progress is
+        # printed as each one finishes; aggregation keeps the selection order.
+        outcomes: List[Tuple[List[Dict[str, Any]], Optional[str]]] = [([], None)] * len(selected_dorks)
+        max_workers = min(self.max_workers, len(selected_dorks))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.dork_engine.run_dork, dork, num=10): idx
+                for idx, dork in enumerate(selected_dorks)
+            }
+            for future in concurrent.futures.as_completed(futures):
+                idx = futures[future]
+                dork = selected_dorks[idx]
+                title = dork.get('title', dork.get('id', 'unknown'))
+                try:
+                    results = future.result()
+                    outcomes[idx] = (results, None)
+                    print(f"   ✅ {idx + 1}. {title}: {len(results)} resultados encontrados")
+                except Exception as e:
+                    outcomes[idx] = ([], str(e))
+                    print(f"   ❌ {idx + 1}. {title}: Error: {e}")
+        
         all_results = []
         results_by_dork = {}
         
-        for idx, dork in enumerate(selected_dorks, 1):
+        for dork, (results, error) in zip(selected_dorks, outcomes):
             dork_id = dork.get('id', 'unknown')
-            title = dork.get('title', dork_id)
-            
-            print(f"\n{idx}. Ejecutando: {title}")
-            print("-" * 40)
-            
-            try:
-                results = self.dork_engine.run_dork(dork, num=10, verbose=True)
-                results_by_dork[dork_id] = {
-                    'dork': dork,
-                    'results': results,
-                    'count': len(results)
-                }
-                all_results.extend(results)
-                print(f"   ✅ {len(results)} resultados encontrados")
-                
-            except Exception as e:
-                print(f"   ❌ Error: {e}")
-                results_by_dork[dork_id] = {
-                    'dork': dork,
-                    'results': [],
-                    'count': 0,
-                    'error': str(e)
-                }
+            results_by_dork[dork_id] = {
+                'dork': dork,
+                'results': results,
+                'count': len(results)
+            }
+            if error:
+                results_by_dork[dork_id]['error'] = error
+            all_results.extend(results)
+        
+        unique_results = self.dork_engine.deduplicate_results(all_results)
         
         # Cache results for pagination
         self.results_cache = {
-            'all_results': self.dork_engine.deduplicate_results(all_results),
+            'all_results': unique_results,
             'results_by_dork': results_by_dork,
             'selected_dorks': selected_dorks
         }
         self.current_page = 1
         
         return {
-            'all_results': self.dork_engine.deduplicate_results(all_results),
+            'all_results': unique_results,
             'results_by_dork': results_by_dork,
             'total_found': len(all_results),
-            'unique_found': len(self.dork_engine.deduplicate_results(all_results))
+            'unique_found': len(unique_results)
         }
     
     def show_results_with_pagination(self, results_data: Dict[str, Any]) -> bool:
@@ -203,28 +262,32 @@ class InteractiveDorkInterface:
         
         total_results = len(all_results)
         total_pages = (total_results + self.results_per_page - 1) // self.results_per_page
+        self._last_rendered = (0, [])
         
         while True:
-            # Calculate page range
+            # Calculate page range; only re-slice when the page actually changed
             start_idx = (self.current_page - 1) * self.results_per_page
-            end_idx = min(start_idx + self.results_per_page, total_results)
-            page_results = all_results[start_idx:end_idx]
+            if self._last_rendered[0] == self.current_page:
+                page_results = self._last_rendered[1]
+            else:
+                end_idx = min(start_idx + self.results_per_page, total_results)
+                page_results = all_results[start_idx:end_idx]
+                self._last_rendered = (self.current_page, page_results)
             
-            print(f"\n📊 Resultados de Dorks Interactivos")
-            print("=" * 80)
-            print(f"Página {self.current_page} de {total_pages} | Total: {total_results} resultados únicos")
-            print("-" * 80)
+            lines = [
+                f"\n📊 Resultados de Dorks Interactivos",
+                "=" * 80,
+                f"Página {self.current_page} de {total_pages} | Total: {total_results} resultados únicos",
+                "-" * 80
+            ]
             
             # Show results for current page
-            for idx, result in enumerate(page_results, start_idx + 1):
-                title = result.get('title', 'Sin título')
-                link = result.get('link', 'N/A')
-                snippet = result.get('snippet', 'Sin descripción')[:100] + "..." if len(result.get('snippet', '')) > 100 else result.get('snippet', 'Sin descripción')
-                quality_score = result.get('quality_score', 0.0)
-                
-                print(f"\n{idx}. {title}")
-                print(f"   URL: {link}")
-                print(f"   Calidad: {quality_score:.2f} | Snippet: {snippet}")
+            lines.extend(self._format_result(idx, result)
+                         for idx, result in enumerate(page_results, start_idx + 1))
+            
+            # Render the whole page with a single write
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
             
             # Show pagination controls
             print(f"\n📄 Navegación (Página {self.current_page}/{total_pages}):")
@@ -271,8 +334,11 @@ class InteractiveDorkInterface:
             elif choice == 'f':
                 filtered_results = self._filter_results(all_results)
                 if filtered_results:
-                    results_data['all_results'] = filtered_results
+                    results_data['all_results'] = all_results = filtered_results
+                    total_results = len(all_results)
+                    total_pages = (total_results + self.results_per_page - 1) // self.results_per_page
                     self.current_page = 1
+                    self._last_rendered = (0, [])
                     print(f"✅ Filtrado completado. {len(filtered_results)} resultados.")
                 continue
             elif choice == 'c':
@@ -280,10 +346,18 @@ class InteractiveDorkInterface:
             else:
                 print("❌ Opción inválida.")
     
+    @staticmethod
+    def _format_result(idx: int, result: Dict[str, Any]) -> str:
+        """Format one result entry for the paginated listing"""
+        raw_snippet = result.get('snippet') or 'Sin descripción'
+        snippet = raw_snippet[:100] + "..." if len(raw_snippet) > 100 else raw_snippet
+        return (f"\n{idx}. {result.get('title', 'Sin título')}\n"
+                f"   URL: {result.get('link', 'N/A')}\n"
+                f"   Calidad: {result.get('quality_score', 0.0):.2f} | Snippet: {snippet}")
+    
     def _show_results_by_dork(self, results_by_dork: Dict[str, Any]):
         """Show results organized by dork"""
-        print("\n📊 Resultados por Dork")
-        print("=" * 50)
+        lines = ["\n📊 Resultados por Dork", "=" * 50]
         
         for dork_id, dork_data in results_by_dork.items():
             dork = dork_data['dork']
@@ -291,15 +365,28 @@ class InteractiveDorkInterface:
             count = dork_data['count']
             title = dork.get('title', dork_id)
             
-            print(f"\n🔍 {title} ({dork_id})")
-            print(f"   Resultados: {count}")
+            lines.append(f"\n🔍 {title} ({dork_id})")
+            lines.append(f"   Resultados: {count}")
             
             if results:
                 for i, result in enumerate(results[:3], 1):  # Show top 3 per dork
                     link = result.get('link', 'N/A')
-                    print(f"   {i}. {link}")
+                    lines.append(f"   {i}. {link}")
                 if count > 3:
-                    print(f"   ... y {count - 3} más")
+                    lines.append(f"   ... y {count - 3} más")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+    
+    @staticmethod
+    def _write_json(data: Any, filepath: str):
+        """Write data as indented UTF-8 JSON, using orjson when it is installed"""
+        if orjson is not None:
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
     
     def _save_results(self, results_data: Dict[str, Any]):
         """Save results to JSON file"""
@@ -307,12 +394,11 @@ class InteractiveDorkInterface:
         if not filename:
             filename = "interactive_dork_results"
         
-        safe_filename = "".join(c if c.isalnum() or c in ("-", "_") else "_" for c in filename)
+        safe_filename = _SANITIZE_RE.sub('_', filename)
         filepath = f"{safe_filename}.json"
         
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(results_data, f, indent=2, ensure_ascii=False)
+            self._write_json(results_data, filepath)
             print(f"✅ Resultados guardados en: {filepath}")
         except Exception as e:
             print(f"❌ Error guardando archivo: {e}")
@@ -326,44 +412,65 @@ class InteractiveDorkInterface:
         domain_filter = input("Dominio (opcional): ").strip()
         min_quality = input("Calidad mínima (0.0-1.0, opcional): ").strip()
         
-        filtered = results
-        
-        # Filter by keywords
-        if keywords:
-            keyword_list = [k.strip().lower() for k in keywords.split(',')]
-            filtered = [r for r in filtered if any(
-                k in r.get('title', '').lower() or 
-                k in r.get('snippet', '').lower() 
-                for k in keyword_list
-            )]
-        
-        # Filter by domain
-        if domain_filter:
-            domain_filter = domain_filter.lower()
-            filtered = [r for r in filtered if domain_filter in r.get('link', '').lower()]
+        keyword_list = tuple(k.strip().lower() for k in keywords.split(',')) if keywords else ()
+        domain_filter = domain_filter.lower()
         
-        # Filter by minimum quality
+        min_q = None
         if min_quality:
             try:
                 min_q = float(min_quality)
-                filtered = [r for r in filtered if r.get('quality_score', 0.0) >= min_q]
             except ValueError:
                 print("⚠️  Calidad mínima inválida, ignorando filtro.")
         
-        return filtered
+        def _match(r: Dict[str, Any], host: str) -> bool:
+            # Each field is lower-cased at most once; cheap checks run first
+            if min_q is not None and r.get('quality_score', 0.0) < min_q:
+                return False
+            if domain_filter and domain_filter not in host:
+                return False
+            if keyword_list:
+                blob = f"{r.get('title', '')} {r.get('snippet', '')}".lower()
+                return any(k in blob for k in keyword_list)
+            return True
+        
+        hosts = self._get_hosts(results) if domain_filter else [''] * len(results)
+        return [r for r, host in zip(results, hosts) if _match(r, host)]
+    
+    def _get_hosts(self, results: List[Dict[str, Any]]) -> List[str]:
+        """Return the lower-cased hostname of every result, cached per result list"""
+        cached_results, hosts = self._host_index
+        if cached_results is not results:
+            hosts = []
+            for r in results:
+                try:
+                    hosts.append(urlsplit(r.get('link') or '').hostname or '')
+                except ValueError:
+                    hosts.append('')
+            self._host_index = (results, hosts)
+        return hosts
     
     def interactive_camera_mode(self):
         """Enhanced interactive mode for camera dorks"""
         print("\n📹 Modo Cámaras Interactivo")
         print("=" * 50)
         
-        camera_dorks = self.catalog.get_by_category('cameras')
-        
-        # Group by camera type
-        axis_dorks = [d for d in camera_dorks if 'axis' in d.get('tags', [])]
-        sony_dorks = [d for d in camera_dorks if 'sony' in d.get('tags', [])]
-        liveapplet_dorks = [d for d in camera_dorks if 'liveapplet' in d.get('tags', [])]
-        other_dorks = [d for d in camera_dorks if d not in axis_dorks and d not in sony_dorks and d not in liveapplet_dorks]
+        camera_dorks = self._get_category('cameras')
+        
+        # Group by camera type in one pass (a dork may belong to several groups)
+        groups: Dict[str, List[Dict[str, Any]]] = {'axis': [], 'sony': [], 'liveapplet': [], 'other': []}
+        for d in camera_dorks:
+            tags = set(d.get('tags', ()))
+            placed = False
+            for key in ('axis', 'sony', 'liveapplet'):
+                if key in tags:
+                    groups[key].append(d)
+                    placed = True
+            if not placed:
+                groups['other'].append(d)
+        axis_dorks = groups['axis']
+        sony_dorks = groups['sony']
+        liveapplet_dorks = groups['liveapplet']
+        other_dorks = groups['other']
         
         print("Categorías de cámaras disponibles:")
         print("1. AXIS Cameras (AXIS specific dorks)")
@@ -422,31 +529,14 @@ class InteractiveDorkInterface:
         
         if selection == 'all':
             return dorks
-        elif ',' in selection:
-            selected = []
-            for num_str in selection.split(','):
-                try:
-                    idx = int(num_str.strip())
-                    if 1 <= idx <= min(10, len(dorks)):
-                        selected.append(dorks[idx-1])
-                except ValueError:
-                    pass
-            return selected
-        else:
-            try:
-                idx = int(selection)
-                if 1 <= idx <= min(10, len(dorks)):
-                    return [dorks[idx-1]]
-            except ValueError:
-                pass
-        return []
+        return [dorks[idx - 1] for idx in self._parse_selection(selection, min(10, len(dorks)))]
     
     def interactive_osint_mode(self):
         """Enhanced interactive mode for OSINT dorks"""
         print("\n🔍 Modo OSINT Interactivo")
         print("=" * 50)
         
-        osint_dorks = self.catalog.get_by_category('osint')
+        osint_dorks = self._get_category('osint')
         
         print("Tipos de OSINT disponibles:")
         print("1. Dominios educativos (.edu)")
@@ -479,6 +569,10 @@ class InteractiveDorkInterface:
             if continue_search not in ['s', 'si', 'y', 'yes']:
                 break
     
+    def _build_queries(self, template_name: str, **params: str) -> List[str]:
+        """Fill every query of a SEARCH_TEMPLATES entry with the given parameters"""
+        return [template.format(**params) for template in self.SEARCH_TEMPLATES[template_name]]
+    
     def _customize_domain_search(self, domain_ext: str, category_name: str):
         """Customize domain-based OSINT search"""
         print(f"\n🎯 Búsqueda en {category_name}")
@@ -489,12 +583,7 @@ class InteractiveDorkInterface:
             return
         
         # Build custom query
-        search_types = [
-            f"site:{domain}{domain_ext} inurl:login",
-            f"site:{domain}{domain_ext} inurl:upload", 
-            f"site:{domain}{domain_ext} filetype:pdf",
-            f"site:{domain}{domain_ext} \"document\" OR \"confidential\""
-        ]
+        search_types = self._build_queries('domain', domain=f"{domain}{domain_ext}")
         
         print(f"\nTipos de búsqueda para {domain}{domain_ext}:")
         for idx, query in enumerate(search_types, 1):
@@ -505,14 +594,8 @@ class InteractiveDorkInterface:
         if selection == 'all':
             selected_queries = search_types
         else:
-            selected_queries = []
-            for num_str in selection.split(','):
-                try:
-                    idx = int(num_str.strip())
-                    if 1 <= idx <= len(search_types):
-                        selected_queries.append(search_types[idx-1])
-                except ValueError:
-                    pass
+            selected_queries = [search_types[idx - 1]
+                                for idx in self._parse_selection(selection, len(search_types))]
         
         if selected_queries:
             self._execute_custom_queries(selected_queries, f"OSINT - {category_name}")
@@ -539,9 +622,8 @@ class InteractiveDorkInterface:
         
         queries = []
         for term in search_terms.split(','):
-            term = term.strip()
             for file_type in selected_types:
-                queries.append(f"site:docs.google.com filetype:{file_type} {term}")
+                queries.extend(self._build_queries('google_docs', file_type=file_type, term=term.strip()))
         
         self._execute_custom_queries(queries, "Google Docs OSINT")
     
@@ -551,17 +633,13 @@ class InteractiveDorkInterface:
         print("=" * 35)
         
         target_domains = input("Dominios objetivo (separados por coma, opcional): ").strip()
-        upload_types = ["upload", "files", "attachments", "submit"]
         
         queries = []
         if target_domains:
             for domain in target_domains.split(','):
-                domain = domain.strip()
-                for upload_type in upload_types:
-                    queries.append(f"site:{domain} inurl:{upload_type}")
+                queries.extend(self._build_queries('upload_domain', domain=domain.strip()))
         else:
-            for upload_type in upload_types:
-                queries.append(f"inurl:{upload_type} \"upload\" OR \"file\" OR \"attach\"")
+            queries = self._build_queries('upload_generic')
         
         self._execute_custom_queries(queries, "Upload Pages OSINT")
     
@@ -598,12 +676,7 @@ class InteractiveDorkInterface:
                     if not base_domain:
                         return
                 
-                queries = [
-                    f"site:{base_domain} inurl:login",
-                    f"site:{base_domain} inurl:admin",
-                    f"site:{base_domain} inurl:signin",
-                    f"site:{base_domain} intitle:\"login\" OR intitle:\"sign in\""
-                ]
+                queries = self._build_queries('login', domain=base_domain)
                 
                 self._execute_custom_queries(queries, f"Login Portals - {domain_name}")
         except ValueError:
@@ -634,24 +707,45 @@ class InteractiveDorkInterface:
         print(f"\n🚀 Ejecutando {len(queries)} consultas para: {search_name}")
         print("=" * 60)
         
-        all_results = []
-        
         for idx, query in enumerate(queries, 1):
-            print(f"\n{idx}. Ejecutando: {query}")
-            try:
-                results = self.dork_engine.search_manager.search(query, num=10)
-                all_results.extend(results)
-                print(f"   ✅ {len(results)} resultados")
-            except Exception as e:
-                print(f"   ❌ Error: {e}")
+            print(f"{idx}. {query}")
+        print("-" * 40)
+        
+        results_per_query: List[List[Dict[str, Any]]] = [[] for _ in queries]
+        max_workers = min(self.max_workers, len(queries)) or 1
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.dork_engine.search_manager.search, query, num=10): idx
+                for idx, query in enumerate(queries)
+            }
+            for future in concurrent.futures.as_completed(futures):
+                idx = futures[future]
+                try:
+                    results = future.result() or []
+                    results_per_query[idx] = results
+                    print(f"   ✅ {idx + 1}. {len(results)} resultados")
+                except Exception as e:
+                    print(f"   ❌ {idx + 1}. Error: {e}")
+        
+        # Deduplicate by link while merging, without building the full list first
+        seen = set()
+        unique_results = []
+        total_found = 0
+        for results in results_per_query:
+            total_found += len(results)
+            for r in results:
+                link = r.get('link')
+                if link and link not in seen:
+                    seen.add(link)
+                    unique_results.append(r)
         
         # Show results with pagination
-        if all_results:
+        if total_found:
             results_data = {
-                'all_results': self.dork_engine.deduplicate_results(all_results),
+                'all_results': unique_results,
                 'results_by_dork': {},
-                'total_found': len(all_results),
-                'unique_found': len(self.dork_engine.deduplicate_results(all_results))
+                'total_found': total_found,
+                'unique_found': len(unique_results)
             }
             self.show_results_with_pagination(results_data)
         else:
@@ -741,8 +835,7 @@ class InteractiveDorkInterface:
                 if save in ['s', 'si', 'y', 'yes']:
                     filename = input("Nombre del archivo: ").strip() or "multi_engine_results"
                     try:
-                        with open(f"{filename}.json", 'w', encoding='utf-8') as f:
-                            json.dump(comparison, f, indent=2, ensure_ascii=False)
+                        self._write_json(comparison, f"{filename}.json")
                         print(f"✅ Guardado en: {filename}.json")
                     except Exception as e:
                         print(f"❌ Error guardando: {e}")
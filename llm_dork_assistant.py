@@ -12,13 +12,686 @@ small helper methods that the rest of the toolkit can call to:
 
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures
+import functools
+import hashlib
+import importlib.util
+import io
+import json
+import math
 import os
-from typing import Any, Dict, List, Optional
+import re
+import sys
+import threading
+import time
+import unicodedata
+from collections import Counter, OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
-from groq import Groq
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
 
-# Default model can be overridden via environment
-DEFAULT_GROQ_MODEL = os.getenv("GROQ_MODEL", "moonshotai/kimi-k2-instruct-0905")
+if TYPE_CHECKING:
+    import httpx
+
+
+@functools.cache
+def _groq() -> Any:
+    """Import the Groq SDK on first use; it drags in httpx and pydantic."""
+    import groq
+    return groq
+
+
+@functools.cache
+def default_groq_model() -> str:
+    """Default model, overridable via GROQ_MODEL (read on first use, after .env)."""
+    return os.getenv("GROQ_MODEL", "moonshotai/kimi-k2-instruct-0905")
+
+# System prompts, compressed by hand (~40% fewer tokens than the original
+# wording) while keeping the tokens whose exact form matters (ESPAÑOL,
+# "UN dork por línea"). DuckDuckGo compatibility is enforced locally with
+# _DDG_UNSUPPORTED instead of spending prompt tokens on it.
+_SYS_GEN_PROMPT = (
+    "Experto en Google dorking y OSINT. Propón 1-5 dorks concretos para la "
+    "descripción dada. Responde en ESPAÑOL, texto plano, "
+    "UN dork por línea, sin explicaciones."
+)
+_SYS_EXPLAIN_PROMPT = (
+    "Analista de seguridad experto en Google dorking. Explica breve y "
+    "claramente QUÉ busca el dork, qué activos o datos suele revelar y su "
+    "nivel de riesgo para el objetivo. Responde en ESPAÑOL."
+)
+_SYS_RELATED_PROMPT = (
+    "Generador avanzado de dorks. Dado un dork, propón variantes que lo "
+    "afinen, amplíen su alcance o cubran vectores relacionados (backups, "
+    "subdominios, paneles de login...). Responde en ESPAÑOL, SOLO la lista "
+    "de dorks, UN dork por línea, sin comentarios."
+)
+
+
+# Chat messages are kept as ((role, content), ...) tuples internally: they are
+# immutable, cheap to build and hashable, so they can be used directly in
+# cache keys. _to_openai() converts them at the API boundary.
+Messages = Tuple[Tuple[str, str], ...]
+CacheKey = Tuple[str, Messages, float, int]
+
+
+def _to_openai(messages: Messages) -> List[Dict[str, str]]:
+    """Convert internal message tuples into the chat-completions format."""
+    return [{"role": role, "content": content} for role, content in messages]
+
+
+class LLMCache:
+    """In-memory LRU cache of chat completions keyed by the full request.
+
+    An optional ``backend`` exposing ``get(key)`` / ``set(key, value, expire)``
+    (for example a ``diskcache.Cache``) is consulted on memory misses and
+    written through on every ``set``; entries there expire after ``ttl``
+    seconds (None = never).
+    """
+
+    def __init__(self,
+                 maxsize: int = 256,
+                 backend: Optional[Any] = None,
+                 ttl: Optional[float] = None) -> None:
+        self.maxsize = maxsize
+        self.backend = backend
+        self.ttl = ttl
+        self._entries: "OrderedDict[CacheKey, str]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(model: str,
+                 messages: Messages,
+                 temperature: float,
+                 max_tokens: int) -> CacheKey:
+        """Build the key for a chat request.
+
+        Messages are already nested tuples, so the key is hashable as is and
+        no serialization happens on the lookup path.
+        """
+        return (model, messages, temperature, max_tokens)
+
+    @staticmethod
+    def _backend_key(key: CacheKey) -> str:
+        # hash() of str is salted per process, so the on-disk key needs a
+        # stable digest; only computed when the backend is actually used.
+        payload = json.dumps(key, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: CacheKey) -> Optional[str]:
+        """Return the cached text for ``key`` or None."""
+        text = self._entries.get(key)
+        if text is None and self.backend is not None:
+            text = self.backend.get(self._backend_key(key))
+            if text is not None:
+                self._remember(key, text)
+        if text is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return text
+
+    def set(self, key: CacheKey, text: str) -> None:
+        """Store ``text`` under ``key`` (and in the backend, if any)."""
+        self._remember(key, text)
+        if self.backend is not None:
+            self.backend.set(self._backend_key(key), text, expire=self.ttl)
+
+    @classmethod
+    def from_env(cls, maxsize: int = 256) -> "LLMCache":
+        """Cache persisted on disk unless disabled or ``diskcache`` is missing.
+
+        ``NINJUTSU_LLM_CACHE=off`` keeps the cache in memory only and
+        ``NINJUTSU_LLM_CACHE_TTL`` sets the disk expiry in seconds
+        (default: one week).
+        """
+        ttl = float(os.getenv("NINJUTSU_LLM_CACHE_TTL", "604800"))
+        return cls(maxsize=maxsize, backend=_open_disk_cache(), ttl=ttl)
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters of this process plus the number of disk entries."""
+        stats = {"hits": self.hits, "misses": self.misses, "memory": len(self._entries)}
+        if self.backend is not None:
+            stats["disk"] = len(self.backend)
+        return stats
+
+    def _remember(self, key: CacheKey, text: str) -> None:
+        self._entries[key] = text
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+@functools.lru_cache(maxsize=None)
+def _open_disk_cache() -> Optional[Any]:
+    """Shared on-disk response cache, or None when disabled/unavailable."""
+    if diskcache is None:
+        return None
+    if os.getenv("NINJUTSU_LLM_CACHE", "on").strip().lower() in {"off", "0", "false", "no"}:
+        return None
+    directory = os.path.expanduser("~/.cache/ninjutsu_llm")
+    return diskcache.Cache(directory, size_limit=int(2e9))
+
+
+def _http2_available() -> bool:
+    """httpx only speaks HTTP/2 when the optional ``h2`` package is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+def _build_http_client() -> httpx.Client:
+    """Keep-alive connection pool shared by all requests of one assistant."""
+    import httpx
+
+    transport = httpx.HTTPTransport(
+        retries=2,
+        http2=_http2_available(),
+        limits=httpx.Limits(
+            max_connections=100,
+            max_keepalive_connections=32,
+            keepalive_expiry=60.0,
+        ),
+    )
+    return httpx.Client(transport=transport, timeout=httpx.Timeout(60.0, connect=5.0))
+
+
+def _build_async_http_client() -> httpx.AsyncClient:
+    """Async equivalent of ``_build_http_client``."""
+    import httpx
+
+    transport = httpx.AsyncHTTPTransport(
+        retries=2,
+        http2=_http2_available(),
+        limits=httpx.Limits(
+            max_connections=100,
+            max_keepalive_connections=32,
+            keepalive_expiry=60.0,
+        ),
+    )
+    return httpx.AsyncClient(transport=transport, timeout=httpx.Timeout(60.0, connect=5.0))
+
+
+_WORD_RE = re.compile(r"[\w.:-]+")
+
+# Dork tokens: quoted phrases stay whole, everything else splits on whitespace
+_DORK_TOKEN_RE = re.compile(r'-?"[^"]*"|\S+')
+_OPERATOR_TOKEN_RE = re.compile(
+    r'^-?(site|inurl|allinurl|intitle|allintitle|filetype|ext|intext|allintext|cache|link|related|info):',
+    re.IGNORECASE,
+)
+MAX_DORK_TOKENS = 512
+
+
+def _trim_long_dork(dork: str, max_tokens: int = MAX_DORK_TOKENS) -> str:
+    """Shorten pathologically long dorks before sending them to the model.
+
+    Dorks within ``max_tokens`` whitespace tokens are returned unchanged.
+    Longer ones always keep operator tokens (``site:``, ``inurl:``...) and
+    quoted phrases; the remaining budget is filled with the other terms.
+    The original token order is preserved.
+    """
+    tokens = _DORK_TOKEN_RE.findall(dork)
+    if len(tokens) <= max_tokens:
+        return dork
+
+    protected = [bool(_OPERATOR_TOKEN_RE.match(t)) or t.lstrip("-").startswith('"') for t in tokens]
+    budget = max(max_tokens - sum(protected), 0)
+    kept = []
+    for token, is_protected in zip(tokens, protected):
+        if is_protected:
+            kept.append(token)
+        elif budget > 0:
+            kept.append(token)
+            budget -= 1
+    return " ".join(kept)
+
+
+# Canned explanations for dorks made only of well-known operators; these
+# are answered locally instead of spending an LLM round-trip.
+_OPERATOR_EXPLANATIONS: Dict[str, str] = {
+    "site": "Restringe los resultados al dominio {value} (incluidos sus subdominios).",
+    "inurl": "Muestra solo páginas cuya URL contiene «{value}».",
+    "intitle": "Muestra solo páginas cuyo título contiene «{value}».",
+    "intext": "Muestra solo páginas cuyo contenido incluye «{value}».",
+    "filetype": "Limita los resultados a archivos de tipo .{value}.",
+    "ext": "Limita los resultados a archivos con extensión .{value}.",
+}
+_SIMPLE_TERM = r'(-?)(site|inurl|intitle|intext|filetype|ext):("[^"]*"|\S+)'
+_SIMPLE_DORK_RE = re.compile(rf'^(?:\s*{_SIMPLE_TERM})+\s*$', re.IGNORECASE)
+_SIMPLE_TERM_RE = re.compile(_SIMPLE_TERM, re.IGNORECASE)
+
+
+def _local_explanation(dork: str) -> Optional[str]:
+    """Explain operator-only dorks without the LLM; None for anything else."""
+    if not _SIMPLE_DORK_RE.match(dork):
+        return None
+
+    lines = []
+    for negated, operator, value in _SIMPLE_TERM_RE.findall(dork):
+        operator = operator.lower()
+        text = _OPERATOR_EXPLANATIONS[operator].format(value=value.strip('"'))
+        if negated:
+            text = f"Excluye los resultados que cumplan: {text[0].lower()}{text[1:]}"
+        lines.append(f"- {negated}{operator}:{value} → {text}")
+    lines.append(
+        "Riesgo: bajo por sí solo; el impacto depende de lo que el objetivo "
+        "tenga indexado."
+    )
+    return "\n".join(lines)
+
+
+# What a prompt is *about*: two prompts are only interchangeable when these
+# match exactly, however similar the rest of the wording is.
+_QUOTED_RE = re.compile(r'"([^"]+)"|«([^»]+)»|\'([^\']+)\'')
+_HOST_RE = re.compile(r"\b(?:[a-z0-9-]+\.)+[a-z]{2,}\b|\b\d{1,3}(?:\.\d{1,3}){3}\b")
+_EXTENSION_RE = re.compile(r"(?<![\w.])\.[a-z0-9]{2,5}\b")
+_CAPITALIZED_RE = re.compile(r"(?<=\S\s)[A-Z][\w-]+")
+_KNOWN_PRODUCTS = frozenset({
+    "wordpress", "joomla", "drupal", "magento", "prestashop", "shopify", "woocommerce",
+    "moodle", "laravel", "django", "rails", "symfony", "jenkins", "gitlab", "github",
+    "bitbucket", "jira", "confluence", "sharepoint", "grafana", "kibana", "elasticsearch",
+    "phpmyadmin", "cpanel", "plesk", "webmin", "tomcat", "apache", "nginx", "iis",
+    "mysql", "postgres", "postgresql", "mongodb", "redis", "firebase", "s3", "aws",
+    "azure", "gcp", "docker", "kubernetes", "hikvision", "dahua", "axis", "webcamxp",
+    "zabbix", "nagios", "openai", "slack", "stripe", "mercadopago", "square",
+})
+
+
+@functools.lru_cache(maxsize=512)
+def _prompt_entities(text: str) -> frozenset:
+    """Targets named in a prompt: hosts/IPs, quoted strings, extensions and product names."""
+    lowered = text.lower()
+    entities = {h for h in _HOST_RE.findall(lowered)}
+    entities.update(next(g for g in m if g).lower() for m in _QUOTED_RE.findall(text))
+    entities.update(_EXTENSION_RE.findall(lowered))
+    # Mid-sentence capitalized words are usually proper nouns (products, vendors)
+    entities.update(w.lower() for w in _CAPITALIZED_RE.findall(text))
+    entities.update(w for w in _WORD_RE.findall(lowered) if w in _KNOWN_PRODUCTS)
+    return frozenset(entities)
+
+
+@functools.lru_cache(maxsize=512)
+def _prompt_vector(text: str) -> Tuple[Dict[str, int], float]:
+    """Bag-of-words vector (accent- and case-insensitive) and its L2 norm."""
+    normalized = unicodedata.normalize("NFKD", text.lower())
+    normalized = "".join(c for c in normalized if not unicodedata.combining(c))
+    counts = Counter(_WORD_RE.findall(normalized))
+    return dict(counts), math.sqrt(sum(v * v for v in counts.values()))
+
+
+class SemanticCache:
+    """Return a previous answer when a new prompt is nearly identical to a cached one.
+
+    Prompts are compared with cosine similarity over normalized word counts,
+    so rewordings that only differ in case, accents, punctuation or word
+    order hit the cache. Entries are grouped by ``namespace`` (e.g. the
+    target engine) so answers are never reused across incompatible requests,
+    and a hit also requires the same entities (domains, quoted strings, file
+    extensions, product/CMS names): "… en example.com" never answers
+    "… en victima.org", nor WordPress a Joomla request.
+    """
+
+    def __init__(self, threshold: float = 0.92, maxsize: int = 256) -> None:
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self._entries: List[Tuple[str, str, str]] = []  # (namespace, prompt, response)
+
+    @staticmethod
+    def similarity(a: str, b: str) -> float:
+        """Cosine similarity between two prompts."""
+        vec_a, norm_a = _prompt_vector(a)
+        vec_b, norm_b = _prompt_vector(b)
+        if not norm_a or not norm_b:
+            return 0.0
+        if len(vec_a) > len(vec_b):
+            vec_a, vec_b = vec_b, vec_a
+        dot = sum(count * vec_b.get(word, 0) for word, count in vec_a.items())
+        return dot / (norm_a * norm_b)
+
+    def lookup(self, prompt: str, namespace: str = "") -> Optional[str]:
+        """Return the best cached response above the threshold, if any."""
+        best_score, best_response = 0.0, None
+        entities = _prompt_entities(prompt)
+        for ns, cached_prompt, response in self._entries:
+            if ns != namespace or _prompt_entities(cached_prompt) != entities:
+                continue
+            score = self.similarity(prompt, cached_prompt)
+            if score > best_score:
+                best_score, best_response = score, response
+        return best_response if best_score >= self.threshold else None
+
+    def add(self, prompt: str, response: str, namespace: str = "") -> None:
+        """Remember ``response`` for ``prompt``, dropping the oldest entries first."""
+        self._entries.append((namespace, prompt, response))
+        if len(self._entries) > self.maxsize:
+            del self._entries[:len(self._entries) - self.maxsize]
+
+
+# Curated (prompt, dorks) pairs shipped with the tool to pre-fill the
+# semantic cache, so common requests hit it from the very first query.
+COMMON_PROMPTS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "common_prompts.jsonl")
+
+
+def warm_up_semantic_cache(cache: SemanticCache, path: str = COMMON_PROMPTS_FILE) -> int:
+    """Load the curated prompts of ``path`` into ``cache`` (no API calls).
+
+    Returns:
+        Number of entries added (0 if the file is missing or unreadable).
+    """
+    added = 0
+    try:
+        with open(path, "r", encoding="utf-8") as fh:
+            for line in fh:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                prompt = entry["prompt"]
+                _prompt_vector(prompt)  # pay the vectorization and entity-extraction cost now
+                _prompt_entities(prompt)
+                cache.add(prompt, "\n".join(entry["dorks"]), namespace=_normalize_engine(entry.get("engine")))
+                added += 1
+    except (OSError, ValueError, KeyError):
+        pass
+    return added
+
+
+# Streaming output is flushed in growing batches: the first character goes
+# out immediately (fast time-to-first-token), then 4, 16 and 32 chars, or
+# whatever has accumulated after _STREAM_FLUSH_INTERVAL seconds.
+_STREAM_FLUSH_STEPS = (1, 4, 16, 32)
+_STREAM_FLUSH_INTERVAL = 0.05
+
+
+def _write_stdout(text: str) -> None:
+    sys.stdout.write(text)
+    sys.stdout.flush()
+
+
+def _replay_interval(text: str) -> float:
+    """Delay between characters when replaying ``text``; 0 = print at once.
+
+    The rate comes from NINJUTSU_LLM_REPLAY_TPS (characters per second,
+    default 120, 0 disables replay) and a replay never lasts over ~1.5 s.
+    """
+    try:
+        tps = float(os.getenv("NINJUTSU_LLM_REPLAY_TPS", "120"))
+    except ValueError:
+        tps = 120.0
+    if tps <= 0 or not text:
+        return 0.0
+    return min(1.0 / tps, 1.5 / len(text))
+
+
+def _replay(text: str) -> None:
+    """Print a cached answer as if it were being streamed."""
+    interval = _replay_interval(text)
+    if not interval:
+        print(text)
+        return
+    for ch in text:
+        _write_stdout(ch)
+        time.sleep(interval)
+    _write_stdout("\n")
+
+
+async def _areplay(text: str) -> None:
+    """Async ``_replay``; sleeps without blocking the event loop."""
+    interval = _replay_interval(text)
+    if not interval:
+        print(text)
+        return
+    for ch in text:
+        _write_stdout(ch)
+        await asyncio.sleep(interval)
+    _write_stdout("\n")
+
+
+# Give up on a stream when Groq sends nothing for this many seconds.
+_STREAM_STALL_TIMEOUT = 30.0
+
+
+class _StreamBatcher:
+    """Accumulates streamed deltas and decides when to flush them."""
+
+    def __init__(self) -> None:
+        self.text = io.StringIO()
+        self._pending: List[str] = []
+        self._pending_len = 0
+        self._step = 0
+        self._last_flush = time.monotonic()
+
+    def feed(self, delta: str) -> str:
+        """Add ``delta``; return the text to write now ("" to keep buffering)."""
+        self.text.write(delta)
+        self._pending.append(delta)
+        if delta.isspace():
+            # Nothing visible to show yet: carry it over to the next flush
+            return ""
+        self._pending_len += len(delta)
+
+        now = time.monotonic()
+        if (self._pending_len >= _STREAM_FLUSH_STEPS[self._step]
+                or now - self._last_flush > _STREAM_FLUSH_INTERVAL):
+            self._last_flush = now
+            self._step = min(self._step + 1, len(_STREAM_FLUSH_STEPS) - 1)
+            return self._take()
+        return ""
+
+    def close(self) -> str:
+        """Return whatever is still buffered plus the final newline."""
+        self._pending.append("\n")
+        return self._take()
+
+    def _take(self) -> str:
+        out = "".join(self._pending)
+        self._pending.clear()
+        self._pending_len = 0
+        return out
+
+
+def _stream_to_stdout(completion: Any) -> str:
+    """Write a streamed completion to stdout in batches and return its text."""
+    batcher = _StreamBatcher()
+    for chunk in completion:
+        delta = chunk.choices[0].delta.content
+        if not delta:
+            continue
+        out = batcher.feed(delta)
+        if out:
+            _write_stdout(out)
+    _write_stdout(batcher.close())
+    return batcher.text.getvalue()
+
+
+async def _astream_to_stdout(completion: Any, stall_timeout: float = _STREAM_STALL_TIMEOUT) -> str:
+    """Async ``_stream_to_stdout``: network reads and terminal writes overlap.
+
+    A producer task keeps pulling deltas from the SSE stream into a queue
+    while the consumer writes batches to stdout from a worker thread, so a
+    slow terminal never holds up the connection.
+    """
+    queue: "asyncio.Queue[Optional[str]]" = asyncio.Queue()
+    loop = asyncio.get_running_loop()
+
+    async def produce() -> None:
+        chunks = completion.__aiter__()
+        try:
+            while True:
+                try:
+                    chunk = await asyncio.wait_for(chunks.__anext__(), stall_timeout)
+                except StopAsyncIteration:
+                    break
+                except asyncio.TimeoutError:
+                    raise TimeoutError(f"Groq no envió datos en {stall_timeout:.0f} s") from None
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    queue.put_nowait(delta)
+        finally:
+            queue.put_nowait(None)
+
+    producer = asyncio.create_task(produce())
+    batcher = _StreamBatcher()
+    finished = False
+    while not finished:
+        deltas = [await queue.get()]
+        while not queue.empty():
+            deltas.append(queue.get_nowait())
+        if deltas[-1] is None:
+            deltas.pop()
+            finished = True
+        out = "".join(batcher.feed(delta) for delta in deltas)
+        if finished:
+            out += batcher.close()
+        if out:
+            await loop.run_in_executor(None, _write_stdout, out)
+
+    await producer  # re-raise stalls and network errors
+    return batcher.text.getvalue()
+
+
+# Per-method output budgets: up to 5 one-line dorks, a short explanation,
+# up to 7 related dorks. Tight budgets let the server schedule requests
+# more densely. No stop sequences: the model may open with a code fence or
+# a "Dorks:" line plus a blank line, so fences and blank lines are cleaned
+# up locally instead of ending the completion.
+_GEN_MAX_TOKENS = 160
+_EXPLAIN_MAX_TOKENS = 256
+_RELATED_MAX_TOKENS = 320
+
+# Upper bound on concurrent Groq requests issued by the *_many helpers.
+MAX_CONCURRENT_REQUESTS = 8
+
+# System messages are shared so every request sends a byte-identical prefix,
+# which also lets provider-side prompt caching kick in.
+_SYS_GEN_MSG = ("system", _SYS_GEN_PROMPT)
+_SYS_EXPLAIN_MSG = ("system", _SYS_EXPLAIN_PROMPT)
+_SYS_RELATED_MSG = ("system", _SYS_RELATED_PROMPT)
+
+
+# Google-only operators that DuckDuckGo ignores or rejects
+_DDG_UNSUPPORTED = re.compile(
+    r'(?<!\S)-?(?:cache|allinurl|allintitle|allintext|link|related|info):(?:"[^"]*"|\S+)',
+    re.IGNORECASE,
+)
+
+
+def _strip_ddg_unsupported(text: str) -> str:
+    """Remove Google-only operators from each generated dork line."""
+    lines = (" ".join(_DDG_UNSUPPORTED.sub("", line).split()) for line in text.splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+def _dork_fingerprint(line: str) -> str:
+    """Canonical form of a dork: case-, spacing- and term-order-insensitive."""
+    return " ".join(sorted(_DORK_TOKEN_RE.findall(line.lower())))
+
+
+def _dedupe_dork_lines(text: str) -> str:
+    """Drop blank lines and dorks that only differ in case, spacing or order."""
+    seen = set()
+    kept = []
+    for line in text.translate(_STRIP_TABLE).splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        fingerprint = _dork_fingerprint(line)
+        if fingerprint not in seen:
+            seen.add(fingerprint)
+            kept.append(line)
+    return "\n".join(kept)
+
+
+_ALLOWED_ENGINES = frozenset({"google", "duckduckgo"})
+
+# Markdown/bullet debris the model sometimes wraps dorks in. "*" is left
+# alone on purpose: it is a valid wildcard (site:*.example.com).
+_STRIP_TABLE = str.maketrans("", "", "`•·")
+
+
+def _normalize_engine(engine: Optional[str]) -> str:
+    """Map the requested engine to one the prompts know about."""
+    engine = (engine or "google").lower().strip()
+    return engine if engine in _ALLOWED_ENGINES else "google"
+
+
+def _generation_messages(prompt: str, engine: str) -> Messages:
+    user_msg = (
+        f"Motor preferido: {engine}\n"
+        f"Descripción del objetivo: {prompt}\n\n"
+        "Responde SOLO con los dorks, sin ningún comentario extra."
+    )
+    return (_SYS_GEN_MSG, ("user", user_msg))
+
+
+def _explanation_messages(dork: str) -> Messages:
+    return (_SYS_EXPLAIN_MSG, ("user", f"Dork a analizar:\n{_trim_long_dork(dork)}"))
+
+
+def _related_messages(dork: str) -> Messages:
+    user_msg = (
+        "Dork base:\n"
+        f"{_trim_long_dork(dork)}\n\n"
+        "Genera entre 3 y 7 dorks relacionados."
+    )
+    return (_SYS_RELATED_MSG, ("user", user_msg))
+
+
+# Short explain requests go to a smaller, faster model; everything else
+# uses the assistant's main model.
+_FAST_ROUTE_MAX_CHARS = 400
+
+
+@functools.cache
+def default_fast_groq_model() -> str:
+    """Model for short, simple requests, overridable via GROQ_FAST_MODEL."""
+    return os.getenv("GROQ_FAST_MODEL", "llama-3.1-8b-instant")
+
+
+def _route(messages: Messages, model: str, fast_model: Optional[str]) -> str:
+    """Pick ``fast_model`` for short prompts and ``model`` otherwise."""
+    if fast_model and sum(len(content) for _, content in messages) < _FAST_ROUTE_MAX_CHARS:
+        return fast_model
+    return model
+
+
+def _cache_allowed(temperature: float, cacheable: Optional[bool]) -> bool:
+    """Whether an answer may be served from / stored in the response cache.
+
+    ``None`` means "only when deterministic": sampled answers (temperature > 0)
+    are cached only if the caller explicitly passes ``cacheable=True``.
+    """
+    return temperature == 0 if cacheable is None else cacheable
+
+
+def _plan_related_batch(cache: LLMCache,
+                        model: str,
+                        temperature: float,
+                        dorks: List[str]) -> Tuple[Dict[str, str], List[Tuple[str, CacheKey]]]:
+    """Split ``dorks`` into cached answers and (dork, cache key) still to fetch.
+
+    Duplicates are collapsed, so each distinct dork is requested at most once.
+    The cache is only consulted when ``_cache_allowed(temperature, None)``.
+    """
+    use_cache = _cache_allowed(temperature, None)
+    done: Dict[str, str] = {}
+    pending: List[Tuple[str, CacheKey]] = []
+    for dork in dict.fromkeys(dorks):
+        key = LLMCache.make_key(model, _related_messages(dork), temperature, _RELATED_MAX_TOKENS)
+        cached = cache.get(key) if use_cache else None
+        if cached is not None:
+            done[dork] = cached
+        else:
+            pending.append((dork, key))
+    return done, pending
+
+
+def _batch_stats(dorks: List[str], done: Dict[str, str], pending: List[Tuple[str, CacheKey]]) -> Dict[str, int]:
+    return {"original": len(dorks), "cached": len(done), "generated": len(pending)}
 
 
 class GroqDorkAssistant:
@@ -27,54 +700,84 @@ class GroqDorkAssistant:
     def __init__(self,
                  model: Optional[str] = None,
                  temperature: float = 0.4,
-                 max_tokens: int = 512) -> None:
+                 max_tokens: int = 512,
+                 cache: Optional[LLMCache] = None,
+                 semantic_cache: Optional[SemanticCache] = None,
+                 fast_model: Optional[str] = None) -> None:
         api_key = os.getenv("GROQ_API_KEY")
         if not api_key:
             raise RuntimeError("GROQ_API_KEY no está configurada en el entorno (.env).")
 
         # The Groq client picks the key from the argument or the environment.
-        self.client = Groq(api_key=api_key)
-        self.model = model or DEFAULT_GROQ_MODEL
+        # A dedicated pooled HTTP client keeps TLS connections alive between
+        # back-to-back calls.
+        self.client = _groq().Groq(api_key=api_key, http_client=_build_http_client())
+        self.model = model or default_groq_model()
+        # Used by explain_dork for short dorks; pass "" to always use ``model``
+        self.fast_model = default_fast_groq_model() if fast_model is None else fast_model
         self.temperature = temperature
         self.max_tokens = max_tokens
+        # Identical deterministic requests (temperature 0, or cacheable=True)
+        # are answered from here instead of calling Groq again.
+        self.cache = cache if cache is not None else LLMCache.from_env()
+        # Near-duplicate natural-language prompts reuse earlier generations,
+        # under the same temperature/cacheable rule.
+        self.semantic_cache = semantic_cache if semantic_cache is not None else SemanticCache()
+        self.last_batch_stats: Dict[str, int] = {}
 
     # ----------------------------
     # Low-level chat helper
     # ----------------------------
     def _chat(self,
-              messages: List[Dict[str, str]],
+              messages: Messages,
               stream: bool = False,
               max_tokens: Optional[int] = None,
-              temperature: Optional[float] = None) -> str:
+              temperature: Optional[float] = None,
+              model: Optional[str] = None,
+              cacheable: Optional[bool] = None) -> str:
         """Call Groq chat.completions and optionally stream to stdout.
 
+        ``model`` overrides ``self.model`` for this call. Responses are cached
+        by (model, messages, temperature, max_tokens) only when temperature is
+        0 or ``cacheable=True``; ``cacheable=False`` never uses the cache.
+
         Returns the full assistant text as a single string.
         """
+        model = model or self.model
+        temperature = temperature if temperature is not None else self.temperature
+        max_tokens = max_tokens if max_tokens is not None else self.max_tokens
+
+        key = None
+        if _cache_allowed(temperature, cacheable):
+            key = LLMCache.make_key(model, messages, temperature, max_tokens)
+            cached = self.cache.get(key)
+            if cached is not None:
+                if stream:
+                    _replay(cached)
+                return cached
+
         completion = self.client.chat.completions.create(
-            model=self.model,
-            messages=messages,
-            temperature=temperature if temperature is not None else self.temperature,
-            max_completion_tokens=max_tokens if max_tokens is not None else self.max_tokens,
+            model=model,
+            messages=_to_openai(messages),
+            temperature=temperature,
+            max_completion_tokens=max_tokens,
             top_p=1.0,
             stream=stream,
         )
 
         if stream:
-            chunks: List[str] = []
-            for chunk in completion:
-                delta = chunk.choices[0].delta.content or ""
-                if delta:
-                    print(delta, end="", flush=True)
-                    chunks.append(delta)
-            print()  # newline after streaming
-            return "".join(chunks).strip()
+            text = _stream_to_stdout(completion).strip()
+        else:
+            # Non-streaming response
+            try:
+                text = completion.choices[0].message.content or ""
+            except Exception:  # pragma: no cover - very defensive
+                text = ""
+            text = text.strip()
 
-        # Non-streaming response
-        try:
-            text = completion.choices[0].message.content or ""
-        except Exception:  # pragma: no cover - very defensive
-            text = ""
-        return text.strip()
+        if key is not None and text:
+            self.cache.set(key, text)
+        return text
 
     # ----------------------------
     # Public high-level methods
@@ -82,90 +785,268 @@ class GroqDorkAssistant:
     def generate_dorks_from_prompt(self,
                                   prompt: str,
                                   engine: str = "google",
-                                  stream: bool = True) -> str:
+                                  stream: bool = True,
+                                  cacheable: Optional[bool] = None) -> str:
         """Generate one or more dorks from a natural-language description.
 
         Args:
             prompt: Descripción en lenguaje natural de lo que quieres encontrar.
             engine: "google" o "duckduckgo" (solo afecta a las sugerencias).
             stream: Si True, escribe la respuesta en tiempo real por stdout.
+            cacheable: Reutilizar respuestas de prompts casi idénticos (incluidas
+                las curadas de ``warm_up_semantic_cache``). None = solo con
+                temperature 0, igual que ``_chat``.
 
         Returns:
             Texto completo devuelto por el modelo (uno o varios dorks).
         """
-        engine = (engine or "google").lower().strip()
-        if engine not in {"google", "duckduckgo"}:
-            engine = "google"
-
-        system_msg = (
-            "Eres un experto en Google dorking y OSINT. "
-            "A partir de una descripción en lenguaje natural debes proponer "
-            "entre 1 y 5 dorks concretos, optimizados para motores de búsqueda. "
-            "Si el usuario indica 'duckduckgo', evita operadores que no soporte "
-            "y simplifica la sintaxis. Responde en ESPAÑOL, en texto plano, "
-            "UN dork por línea, sin explicaciones adicionales."
-        )
+        engine = _normalize_engine(engine)
+        use_cache = _cache_allowed(self.temperature, cacheable)
 
-        user_msg = (
-            f"Motor preferido: {engine}\n"
-            f"Descripción del objetivo: {prompt}\n\n"
-            "Responde SOLO con los dorks, sin ningún comentario extra."
-        )
+        if use_cache:
+            cached = self.semantic_cache.lookup(prompt, namespace=engine)
+            if cached is not None:
+                if stream:
+                    _replay(cached)
+                return cached
 
-        messages = [
-            {"role": "system", "content": system_msg},
-            {"role": "user", "content": user_msg},
-        ]
-        return self._chat(messages, stream=stream)
+        if engine != "duckduckgo":
+            text = self._chat(_generation_messages(prompt, engine), stream=stream,
+                              max_tokens=_GEN_MAX_TOKENS, cacheable=cacheable)
+        else:
+            # Filter before showing anything, so the stream can't be used here
+            text = _strip_ddg_unsupported(self._chat(
+                _generation_messages(prompt, engine),
+                max_tokens=_GEN_MAX_TOKENS, cacheable=cacheable,
+            ))
+            if stream:
+                print(text)
+        text = text.translate(_STRIP_TABLE).strip()
+        if use_cache and text:
+            self.semantic_cache.add(prompt, text, namespace=engine)
+        return text
 
     def explain_dork(self, dork: str, stream: bool = True) -> str:
         """Explain what a dork does, what it tends to find and risk level."""
-        system_msg = (
-            "Eres un analista de seguridad experto en Google dorking. "
-            "Explica de forma breve y clara QUÉ intenta encontrar el dork, "
-            "qué tipo de activos o datos suelen aparecer y qué nivel de riesgo "
-            "puede implicar para un objetivo. Responde en ESPAÑOL."
-        )
-        user_msg = f"Dork a analizar:\n{dork}"
-        messages = [
-            {"role": "system", "content": system_msg},
-            {"role": "user", "content": user_msg},
-        ]
-        return self._chat(messages, stream=stream, max_tokens=512)
+        local = _local_explanation(dork)
+        if local is not None:
+            if stream:
+                print(local)
+            return local
+        messages = _explanation_messages(dork)
+        return self._chat(messages, stream=stream, max_tokens=_EXPLAIN_MAX_TOKENS,
+                          model=_route(messages, self.model, self.fast_model))
 
     def suggest_related_dorks(self, dork: str, stream: bool = True) -> str:
         """Suggest related/refined dorks starting from an existing one."""
-        system_msg = (
-            "Eres un generador de dorks avanzado. A partir de un dork existente, "
-            "propón variantes que: (1) afinen la búsqueda, (2) amplíen el alcance "
-            "o (3) se centren en otros vectores relacionados (por ejemplo, backups, "
-            "subdominios, paneles de login, etc.). Responde en ESPAÑOL y devuelve "
-            "SOLO la lista de dorks, un dork por línea, sin comentarios."
+        text = self._chat(_related_messages(dork), stream=stream,
+                          max_tokens=_RELATED_MAX_TOKENS)
+        return _dedupe_dork_lines(text)
+
+    def suggest_related_dorks_many(self, dorks: List[str]) -> List[str]:
+        """Suggest related dorks for several base dorks at once.
+
+        Repeated dorks are requested only once, cached answers are reused and
+        the rest are fetched concurrently (up to ``MAX_CONCURRENT_REQUESTS``).
+        Counts of the last call are kept in ``self.last_batch_stats``.
+
+        Returns:
+            One suggestion text per input dork, in the same order.
+        """
+        done, pending = _plan_related_batch(self.cache, self.model, self.temperature, dorks)
+        self.last_batch_stats = _batch_stats(dorks, done, pending)
+
+        def fetch(dork: str, key: CacheKey) -> str:
+            text = self._chat(_related_messages(dork), max_tokens=_RELATED_MAX_TOKENS,
+                              cacheable=False)
+            if text and _cache_allowed(self.temperature, None):
+                self.cache.set(key, text)
+            return text
+
+        if pending:
+            workers = min(MAX_CONCURRENT_REQUESTS, len(pending))
+            with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {executor.submit(fetch, dork, key): dork for dork, key in pending}
+                for future in concurrent.futures.as_completed(futures):
+                    done[futures[future]] = future.result()
+
+        return [_dedupe_dork_lines(done[dork]) for dork in dorks]
+
+
+class AsyncGroqDorkAssistant:
+    """Async counterpart of GroqDorkAssistant built on ``AsyncGroq``.
+
+    Useful when several requests are needed at once (e.g. generate, explain
+    and suggest for the same target): they run concurrently, so the total
+    latency is that of the slowest call. Single calls can also stream
+    (``stream=True``); ``batch`` never does, since concurrent output would
+    interleave. Caches can be shared with a GroqDorkAssistant by passing
+    the same instances.
+    """
+
+    def __init__(self,
+                 model: Optional[str] = None,
+                 temperature: float = 0.4,
+                 max_tokens: int = 512,
+                 cache: Optional[LLMCache] = None,
+                 semantic_cache: Optional[SemanticCache] = None,
+                 fast_model: Optional[str] = None) -> None:
+        api_key = os.getenv("GROQ_API_KEY")
+        if not api_key:
+            raise RuntimeError("GROQ_API_KEY no está configurada en el entorno (.env).")
+
+        self.client = _groq().AsyncGroq(api_key=api_key, http_client=_build_async_http_client())
+        self.model = model or default_groq_model()
+        # Used by explain_dork for short dorks; pass "" to always use ``model``
+        self.fast_model = default_fast_groq_model() if fast_model is None else fast_model
+        self.temperature = temperature
+        self.max_tokens = max_tokens
+        self.cache = cache if cache is not None else LLMCache.from_env()
+        self.semantic_cache = semantic_cache if semantic_cache is not None else SemanticCache()
+        self.last_batch_stats: Dict[str, int] = {}
+
+    async def _chat(self,
+                    messages: Messages,
+                    stream: bool = False,
+                    max_tokens: Optional[int] = None,
+                    temperature: Optional[float] = None,
+                    model: Optional[str] = None,
+                    cacheable: Optional[bool] = None) -> str:
+        """Async version of ``GroqDorkAssistant._chat``."""
+        model = model or self.model
+        temperature = temperature if temperature is not None else self.temperature
+        max_tokens = max_tokens if max_tokens is not None else self.max_tokens
+
+        key = None
+        if _cache_allowed(temperature, cacheable):
+            key = LLMCache.make_key(model, messages, temperature, max_tokens)
+            cached = self.cache.get(key)
+            if cached is not None:
+                if stream:
+                    await _areplay(cached)
+                return cached
+
+        completion = await self.client.chat.completions.create(
+            model=model,
+            messages=_to_openai(messages),
+            temperature=temperature,
+            max_completion_tokens=max_tokens,
+            top_p=1.0,
+            stream=stream,
         )
-        user_msg = (
-            "Dork base:\n"
-            f"{dork}\n\n"
-            "Genera entre 3 y 7 dorks relacionados."
+
+        if stream:
+            text = (await _astream_to_stdout(completion)).strip()
+        else:
+            try:
+                text = completion.choices[0].message.content or ""
+            except Exception:  # pragma: no cover - very defensive
+                text = ""
+            text = text.strip()
+
+        if key is not None and text:
+            self.cache.set(key, text)
+        return text
+
+    async def generate_dorks_from_prompt(self,
+                                         prompt: str,
+                                         engine: str = "google",
+                                         stream: bool = False,
+                                         cacheable: Optional[bool] = None) -> str:
+        """See ``GroqDorkAssistant.generate_dorks_from_prompt``."""
+        engine = _normalize_engine(engine)
+        use_cache = _cache_allowed(self.temperature, cacheable)
+
+        if use_cache:
+            cached = self.semantic_cache.lookup(prompt, namespace=engine)
+            if cached is not None:
+                if stream:
+                    await _areplay(cached)
+                return cached
+
+        if engine != "duckduckgo":
+            text = await self._chat(_generation_messages(prompt, engine), stream=stream,
+                                    max_tokens=_GEN_MAX_TOKENS, cacheable=cacheable)
+        else:
+            text = _strip_ddg_unsupported(await self._chat(
+                _generation_messages(prompt, engine),
+                max_tokens=_GEN_MAX_TOKENS, cacheable=cacheable,
+            ))
+            if stream:
+                print(text)
+        text = text.translate(_STRIP_TABLE).strip()
+        if use_cache and text:
+            self.semantic_cache.add(prompt, text, namespace=engine)
+        return text
+
+    async def explain_dork(self, dork: str, stream: bool = False) -> str:
+        """See ``GroqDorkAssistant.explain_dork``."""
+        local = _local_explanation(dork)
+        if local is not None:
+            if stream:
+                print(local)
+            return local
+        messages = _explanation_messages(dork)
+        return await self._chat(messages, stream=stream, max_tokens=_EXPLAIN_MAX_TOKENS,
+                                model=_route(messages, self.model, self.fast_model))
+
+    async def suggest_related_dorks(self, dork: str, stream: bool = False) -> str:
+        """See ``GroqDorkAssistant.suggest_related_dorks``."""
+        text = await self._chat(_related_messages(dork), stream=stream,
+                                max_tokens=_RELATED_MAX_TOKENS)
+        return _dedupe_dork_lines(text)
+
+    async def suggest_related_dorks_many(self, dorks: List[str]) -> List[str]:
+        """See ``GroqDorkAssistant.suggest_related_dorks_many``."""
+        done, pending = _plan_related_batch(self.cache, self.model, self.temperature, dorks)
+        self.last_batch_stats = _batch_stats(dorks, done, pending)
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+        async def fetch(dork: str, key: CacheKey) -> str:
+            async with semaphore:
+                text = await self._chat(_related_messages(dork), max_tokens=_RELATED_MAX_TOKENS,
+                                        cacheable=False)
+            if text and _cache_allowed(self.temperature, None):
+                self.cache.set(key, text)
+            return text
+
+        texts = await asyncio.gather(*(fetch(dork, key) for dork, key in pending))
+        done.update(zip((dork for dork, _ in pending), texts))
+        return [_dedupe_dork_lines(done[dork]) for dork in dorks]
+
+    async def batch(self, prompt: str, dork: str, engine: str = "google") -> Dict[str, str]:
+        """Generate dorks for ``prompt`` and explain/expand ``dork`` concurrently.
+
+        Returns:
+            Dict with the keys ``generated``, ``explanation`` and ``related``.
+        """
+        generated, explanation, related = await asyncio.gather(
+            self.generate_dorks_from_prompt(prompt, engine=engine),
+            self.explain_dork(dork),
+            self.suggest_related_dorks(dork),
         )
-        messages = [
-            {"role": "system", "content": system_msg},
-            {"role": "user", "content": user_msg},
-        ]
-        return self._chat(messages, stream=stream, max_tokens=512)
+        return {"generated": generated, "explanation": explanation, "related": related}
 
 
 def demo():
     """Pequeña demo en línea de comandos para probar rápidamente el asistente."""
     assistant = GroqDorkAssistant()
+    threading.Thread(target=warm_up_semantic_cache, args=(assistant.semantic_cache,), daemon=True).start()
     print("\n🤖 Asistente LLM de dorks (Groq)")
     print("=" * 60)
+    if assistant.cache.backend is not None:
+        print(f"Caché en disco: {assistant.cache.stats()['disk']} respuestas guardadas")
     while True:
         prompt = input("\nDescribe qué quieres encontrar (o Enter para salir): ").strip()
         if not prompt:
             break
         engine = input("Motor (google/duckduckgo, Enter=google): ").strip() or "google"
         print("\nDorks sugeridos:\n")
-        assistant.generate_dorks_from_prompt(prompt, engine=engine, stream=True)
+        # The curated warm-up answers are meant to be served as-is
+        assistant.generate_dorks_from_prompt(prompt, engine=engine, stream=True, cacheable=True)
+
+    stats = assistant.cache.stats()
+    print(f"\nCaché: {stats['hits']} aciertos, {stats['misses']} fallos")
 
 
 if __name__ == "__main__":
@@ -5,32 +5,314 @@ Unified interface for all credential finding and security assessment tools
 Supports both Google Custom Search and DuckDuckGo via SerAPI
 """
 
+import atexit
 import os
+import re
 import sys
 import time
 import json
+import concurrent.futures
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional, TypedDict
 
 # Import all our tools
 try:
     from credential_finder import CredentialFinder
-    from subdomain_finder import SubdomainFinder
     from report_generator import ReportGenerator
     from google_dorking_templates import GoogleDorkTemplates
     from dork_engine import DorkEngine
     from search_engine_interface import SearchEngineType
     from query_optimizer import QueryOptimizer, EngineAwareSearchManager
-    from interactive_dork_interface import InteractiveDorkInterface
-    from llm_dork_assistant import GroqDorkAssistant
-    from smart_search import SmartSearch
 except ImportError as e:
     print(f"❌ Error importing modules: {e}")
     print("Make sure all required modules are installed:")
     print("pip install requests dnspython python-dotenv")
     sys.exit(1)
 
+try:
+    from rich.console import Console  # Optional: table renderer for SmartSearch results
+    from rich.table import Table
+    from rich.text import Text
+except ImportError:
+    Console = None
+
+# Runs of anything but letters, digits and "-", underscores included, so the
+# substitution also collapses repeated "_" (accented letters are kept, as with
+# the former str.isalnum() check)
+_SANITIZE_RE = re.compile(r'(?:[^\w-]|_)+')
+# Keep generated names well below filesystem limits for long custom queries
+_MAX_FILENAME_STEM = 80
+# Answers for the y/n (s/n) prompts, compared after casefold()
+_YES = frozenset({"y", "yes", "s", "si", "sí"})
+_NO = frozenset({"n", "no"})
+# Sentinel for "key not present" when temporarily overriding a dict entry
+_MISSING = object()
+# SmartSearch tables with more rows than this are shown through the pager
+_RICH_PAGER_ROWS = 200
+
+# Static screens, built once and written with a single call each
+_BANNER = """
+╔═══════════════════════════════════════════════════════════════════╗
+║                                                                   ║
+║   🔍 KIT AVANZADO DE DESCUBRIMIENTO DE CREDENCIALES 🔍            ║
+║                               by Roska                            ║
+║   • Google Dorking + DuckDuckGo para archivos sensibles           ║
+║   • Búsqueda de credenciales multi-motor                          ║
+║   • Descubrimiento de endpoints de API                            ║
+║   • Enumeración de subdominios                                    ║
+║   • Generación automática de reportes                             ║
+║   • Evaluación y análisis de riesgo                               ║
+║   • Comparación avanzada entre motores                            ║
+║                                                                   ║
+╚═══════════════════════════════════════════════════════════════════╝
+
+"""
+
+_MENU = """
+┌─────────────────────────────────────────────────────────────────┐
+│                         MENÚ PRINCIPAL                          │
+├─────────────────────────────────────────────────────────────────┤
+│  1. 🔍 Buscador de credenciales (interactivo)                   │
+│  2. 🌐 Descubrimiento de subdominios                            │
+│  3. 📊 Plantillas de Google Dorking                             │
+│  4. 🧨 Dorks avanzados multi-motor (Google + DuckDuckGo)        │
+│  5. 📚 Búsqueda de libros PDF                                   │
+│  6. 🔄 Búsqueda cruzada entre motores                           │
+│  7. 📈 Generar reportes                                         │
+│  8. 🚀 Escaneo rápido (todas las herramientas)                  │
+│  9. ⚙️  Configuración motores                                    │
+│ 10. 📊 Comparación de rendimiento                               │
+│ 11. 📚 Ayuda y documentación                                    │
+│ 12. 🖼️  Búsquedas avanzadas (imágenes / noticias / trending)     │
+│ 13. 🧨 Dorks interactivos (selección personalizada)             │
+│ 14. 📹 Modo cámaras (dorks personalizados)                      │
+│ 15. 🔑 Búsqueda de API Keys (todas las plataformas)             │
+│ 16. 🤖 Asistente LLM de dorks (Groq)                            │
+│ 17. 🔎 SmartSearch sobre resultados locales                     │
+│ 18. ❌ Salir                                                    │
+└─────────────────────────────────────────────────────────────────┘
+
+"""
+
+_HELP_TEXT = """
+     📚 AYUDA Y DOCUMENTACIÓN
+     =========================
+     
+     VISIÓN GENERAL
+     --------------
+     Este kit te ayuda a descubrir posibles problemas de seguridad encontrando:
+     
+     • Credenciales expuestas
+     • Archivos sensibles (.env, archivos de configuración, backups)
+     • Endpoints de API y documentación
+     • Subdominios y servicios expuestos
+     
+     Lo hace combinando:
+     • Dorking multi‑motor (Google + DuckDuckGo vía SerpAPI)
+     • Búsquedas especializadas en GitHub
+     • Descubrimiento de subdominios y generación de reportes
+     
+     HERRAMIENTAS PRINCIPALES
+     ------------------------
+     • Credential Finder
+       - Búsquedas específicas de:
+         · Archivos .env
+         · Archivos de configuración
+         · Credenciales (tokens, claves, contraseñas)
+         · Endpoints de API
+       - Soporta:
+         · Un solo motor (Google o DuckDuckGo)
+         · Búsqueda multi‑motor (cross‑engine)
+         · Comparación de motores (quality_score)
+     
+     • Dork Engine
+       - Ejecuta dorks avanzados definidos en dorks_catalog.json
+       - Permite:
+         · Ejecutar categorías completas de dorks con un solo motor
+         · Ejecutar dorks en modo multi‑motor y ver resultados combinados
+         · Buscar libros y recursos PDF mediante la categoría pdf_books
+     
+     • Subdomain Finder
+       - Descubrimiento de subdominios:
+         · Fuerza bruta DNS
+         · Búsqueda en motores
+         · Transparencia de certificados
+       - Opcionalmente, escaneo básico de puertos
+     
+     • Report Generator
+       - Crea reportes en:
+         · HTML
+         · Texto plano
+         · JSON
+       - Incluye resumen de riesgo y categorización de hallazgos.
+     
+     • Master Tool (este menú)
+       - Orquesta todas las herramientas en una sola interfaz:
+     
+         1. Buscador de credenciales (interactivo)
+         2. Descubrimiento de subdominios
+         3. Plantillas de Google Dorking
+         4. Dorks avanzados multi‑motor (Google + DuckDuckGo)
+         5. Búsqueda de libros PDF
+         6. Búsqueda cruzada entre motores (credenciales/config/API)
+         7. Generación de reportes
+         8. Escaneo rápido (todas las herramientas)
+         9. Configuración global de motores
+        10. Comparación de rendimiento entre motores
+        11. Ayuda y documentación (este texto)
+        12. Búsquedas avanzadas de imágenes / noticias / trending (DuckDuckGo)
+        13. Dorks interactivos (selección personalizada)
+        14. Modo cámaras (dorks personalizados)
+        15. Búsqueda de API Keys (OpenAI, GitHub, Slack, Google, Square, Shopify)
+        16. Asistente LLM de dorks (Groq)
+        17. SmartSearch sobre resultados locales
+        18. Salir
+     
+     INTERFAZ MULTI‑MOTOR
+     --------------------
+     Bajo el menú, la lógica de búsquedas se basa en una interfaz unificada:
+     
+     • SearchEngineInterface
+       - Define el contrato para motores de búsqueda:
+         · search(), extract_results(), display_results()
+         · search_images(), search_news(), get_trending_searches()
+         · search_with_fallback() (reintentos con parámetros reducidos)
+     
+     • UnifiedSearchManager
+       - Registra motores (Google, DuckDuckGo via SerpAPI)
+       - Permite:
+         · Seleccionar el motor actual
+         · Buscar con fallback transparente
+         · Ejecutar una misma consulta en varios motores y comparar resultados
+     
+     • QueryOptimizer / EngineAwareSearchManager
+       - Analizan cada consulta y la ajustan según el motor:
+         · Limpian operadores que DuckDuckGo no soporta o no aprovecha bien
+         · Mantienen dorks avanzados ricos para Google cuando tiene sentido
+       - Se usan tanto en CredentialFinder como en DorkEngine para las búsquedas
+         multi‑motor y las comparaciones de rendimiento.
+     
+     MÉTRICAS EN LOS RESULTADOS
+     --------------------------
+     En las listas de resultados verás, además del título/URL/snippet, varias
+     métricas numéricas:
+     
+     • quality_score
+       - Indica la “calidad” aparente de cada resultado:
+         · Tiene snippet
+         · Título con sentido
+         · URL HTTPS
+         · Dominio reputado (github, docs, wikipedia, etc.)
+     
+     • risk_score
+       - Indica de forma HEURÍSTICA cuán “sensibles” parecen los datos:
+         · Tipo de fichero asociado a configs/credenciales (.env, .config, .yml, .php, .json, etc.)
+         · Palabras clave de credenciales (password, secret, token, api_key, access_key, private key, etc.)
+         · Dominio: recursos fuera de GitHub/GitLab se consideran algo más riesgosos
+     
+       Importante:
+       - Se usa sobre todo para priorizar hallazgos de credenciales/config.
+       - Si estás buscando libros PDF, risk_score NO evalúa copyright ni legalidad;
+         simplemente aplica la misma heurística técnica, que en muchos casos será baja.
+     
+     CONSEJOS DE USO
+     ---------------
+     • Para una visión rápida de un dominio:
+       - Usa el Escaneo rápido (opción 8).
+       - Revisa luego los reportes HTML/TXT/JSON que se generan automáticamente.
+     
+     • Para investigación detallada:
+       - Empieza con Descubrimiento de subdominios (opción 2).
+       - Usa Credential Finder (opción 1) para credenciales/config/APIs.
+       - Usa Dork Engine (opción 4/5) para dorks avanzados y búsqueda de libros PDF.
+     
+     • Multi‑motor:
+       - Configura el motor global en la opción 9:
+         · Google
+         · DuckDuckGo
+         · Auto‑select (elige el mejor disponible según lo configurado)
+       - Explora la opción 6 y 10 para ver cómo se comportan los motores y qué
+         cobertura ofrece cada uno.
+     
+     REQUISITOS
+     ----------
+     • Python 3.6 o superior
+     • Clave de API de Google Custom Search (para usar Google)
+     • Clave de SerpAPI (para usar DuckDuckGo vía SerpAPI)
+     • Conexión a Internet
+     • Dependencias indicadas en requirements.txt (requests, dnspython, python-dotenv, etc.)
+     
+     AVISO LEGAL Y USO ÉTICO
+     -----------------------
+     ⚠️  IMPORTANTE:
+         Usa esta herramienta SOLO en:
+         • Sistemas que te pertenezcan, o
+         • Sistemas para los que tengas permiso explícito y por escrito.
+     
+     El uso no autorizado contra sistemas de terceros es ilegal.
+     
+     Buenas prácticas:
+     • Respeta las políticas de uso y límites de cada servicio.
+     • No explotes vulnerabilidades; limítate a identificarlas.
+     • Usa los reportes para mejorar la seguridad, no para atacar.
+     • Sigue marcos de trabajo autorizados (pentesting con contrato, programas de Bug Bounty, etc.).
+     
+     PARA SABER MÁS
+     --------------
+     Consulta también el archivo README.md del proyecto, donde se detalla:
+     
+     • Arquitectura multi‑motor
+     • Catálogo de dorks avanzados
+     • Ejemplos de uso
+     • Recomendaciones adicionales y recursos externos
+     
+     by Roska
+     
+     """
+
+class CredentialFinding(TypedDict, total=False):
+    """quick_scan credential results: one list of hits per search type."""
+    env_files: List[dict]
+    config_files: List[dict]
+    credentials: List[dict]
+    api_endpoints: List[dict]
+    # subdomain -> HTTP probe result (None if unreachable); not a finding
+    per_subdomain: Dict[str, Optional[dict]]
+
+# (credentials above, subdomains above, risk level), most severe first
+_RISK_THRESHOLDS = ((20, 50, "HIGH"), (10, 20, "MEDIUM"), (0, 0, "LOW"))
+
+# Known domains for the engine comparison quality score, as one alternation
+_REPUTABLE_RE = re.compile(r'github\.com|stackoverflow\.com|docs\.|wikipedia\.org')
+
 class MasterSecurityTool:
+    # Engine info is re-read on every menu redraw; keep it for a few seconds
+    ENGINE_INFO_TTL = 5.0
+    # Trending searches change slowly; reuse them per region for a few minutes
+    TRENDING_TTL = 300.0
+    # Repeating a search within a session reuses the previous answer for this long
+    SEARCH_TTL = 600.0
+    
+    # engine_performance_comparison_menu choice -> query (None = ask for a custom one)
+    _TEST_QUERIES = {
+        '1': 'site:github.com ".env" filetype:env',
+        '2': 'site:github.com "config.json" "password"',
+        '3': 'site:github.com "api" "endpoint"',
+        '4': None
+    }
+    
+    # api_keys_search_menu choice -> (emoji, label, CredentialFinder method, output file, skip URL analysis)
+    _API_KEY_ACTIONS = {
+        '1': ('🤖', 'API Keys de OpenAI', 'find_openai_api_keys', 'openai_api_keys_results.json', False),
+        '2': ('🐙', 'Tokens de GitHub', 'find_github_tokens', 'github_tokens_results.json', False),
+        '3': ('💬', 'Tokens de Slack', 'find_slack_tokens', 'slack_tokens_results.json', False),
+        '4': ('🔍', 'API Keys de Google', 'find_google_api_keys', 'google_api_keys_results.json', True),
+        '5': ('💳', 'Tokens de Square', 'find_square_tokens', 'square_tokens_results.json', False),
+        '6': ('🛒', 'Secretos de Shopify', 'find_shopify_secrets', 'shopify_secrets_results.json', False),
+        '7': ('💰', 'Tokens de MercadoPago', 'find_mercadopago_tokens', 'mercadopago_tokens_results.json', False),
+    }
+
     def __init__(self, engine_type: SearchEngineType = None):
         """
         Initialize MasterSecurityTool with multi-engine support
@@ -39,11 +321,21 @@ class MasterSecurityTool:
             engine_type: Preferred search engine (Google or DuckDuckGo)
         """
         self.credential_finder = CredentialFinder(engine_type)
-        self.subdomain_finder = SubdomainFinder()
+        self._subdomain_finder = None  # Se inicializa bajo demanda
         self.report_generator = ReportGenerator()
         self.dork_engine = DorkEngine(engine_type)
-        self.interactive_dork_interface = InteractiveDorkInterface(self.dork_engine)
+        self._interactive_dork_interface = None  # Se inicializa bajo demanda
         self.llm_dork_assistant = None  # Se inicializa bajo demanda
+        self._engine_info_cache = {}  # name -> (expires_at, info)
+        self._trending_cache = {}  # region -> (expires_at, trends)
+        self._search_cache = {}  # (cross_engine, query, num) -> (expires_at, results)
+        
+        # One worker pool for the whole session (quick scan, probes, engine comparisons)
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=8)
+        self.dork_engine.search_manager.executor = self._executor
+        # Single writer so saves land in order while the menu keeps going
+        self._save_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        atexit.register(self.close)
         
         # Track the preferred engine
         self.preferred_engine = engine_type
@@ -55,6 +347,56 @@ class MasterSecurityTool:
         except ImportError:
             self.query_optimizer = None
     
+    def close(self):
+        """Flush pending saves and release the shared worker pools."""
+        self._save_pool.shutdown(wait=True)
+        self._executor.shutdown(wait=False)
+    
+    @contextmanager
+    def _disable_url_analysis(self):
+        """Temporarily turn off CredentialFinder's per-URL analysis (slow on large result sets)."""
+        gf = getattr(self.credential_finder, "global_filters", None)
+        if gf is None:
+            gf = self.credential_finder.global_filters = {}
+        prev = gf.get("analyze_urls", _MISSING)
+        if prev is False:
+            yield
+            return
+        # Only the one key is swapped; the rest of the filters dict is left untouched
+        gf["analyze_urls"] = False
+        try:
+            yield
+        finally:
+            # Restaurar configuración original de filtros globales
+            if prev is _MISSING:
+                gf.pop("analyze_urls", None)
+            else:
+                gf["analyze_urls"] = prev
+    
+    def _save_in_background(self, save, results, filename):
+        """Run ``save(results, filename)`` on the save pool; errors are reported when it finishes."""
+        def _report(future):
+            exc = future.exception()
+            if exc is not None:
+                print(f"\n❌ Error guardando {filename}: {exc}")
+        
+        self._save_pool.submit(save, results, filename).add_done_callback(_report)
+    
+    # Rarely used tools are imported and built on first use to keep startup fast
+    @property
+    def subdomain_finder(self):
+        if self._subdomain_finder is None:
+            from subdomain_finder import SubdomainFinder
+            self._subdomain_finder = SubdomainFinder()
+        return self._subdomain_finder
+    
+    @property
+    def interactive_dork_interface(self):
+        if self._interactive_dork_interface is None:
+            from interactive_dork_interface import InteractiveDorkInterface
+            self._interactive_dork_interface = InteractiveDorkInterface(self.dork_engine)
+        return self._interactive_dork_interface
+    
     def set_global_search_engine(self, engine_type: Optional[SearchEngineType]):
         """
         Set the global search engine preference and propagate to all tools.
@@ -62,6 +404,10 @@ class MasterSecurityTool:
         Args:
             engine_type: Search engine to set as global preference, or None to enable auto-select.
         """
+        # Any engine change (even a failed one) makes the cached info stale
+        self._engine_info_cache.clear()
+        self._trending_cache.clear()
+        self._search_cache.clear()
         try:
             # Update preferred engine (may be None for auto-select)
             self.preferred_engine = engine_type
@@ -81,6 +427,60 @@ class MasterSecurityTool:
             
         except Exception as e:
             print(f"❌ Error setting global engine: {e}")
+        finally:
+            self._engine_info_cache.clear()
+    
+    def _cached_engine_info(self, name, fetch):
+        """Return ``fetch()`` cached for ENGINE_INFO_TTL seconds (errors are not cached)."""
+        now = time.monotonic()
+        entry = self._engine_info_cache.get(name)
+        if entry and entry[0] > now:
+            return entry[1]
+        info = fetch()
+        self._engine_info_cache[name] = (now + self.ENGINE_INFO_TTL, info)
+        return info
+    
+    def _trending(self, region):
+        """Trending searches for ``region``, cached for TRENDING_TTL seconds (empty answers are not cached)."""
+        now = time.monotonic()
+        entry = self._trending_cache.get(region)
+        if entry and entry[0] > now:
+            return entry[1]
+        trends = self.credential_finder.search_manager.get_trending_searches(region)
+        if trends:
+            self._trending_cache[region] = (now + self.TRENDING_TTL, trends)
+        return trends
+    
+    def _cached_search(self, query, num, cross_engine=True):
+        """
+        ``cross_engine_search`` (or plain ``search``) through a SEARCH_TTL cache.
+
+        Empty answers (e.g. rate limits) are not cached; 'r' in the search
+        menus or an engine change clears the cache.
+        """
+        key = (cross_engine, query, num)
+        now = time.monotonic()
+        entry = self._search_cache.get(key)
+        if entry and entry[0] > now:
+            print("♻️  Resultados en caché (escribe 'r' en el menú para refrescar)")
+            return entry[1]
+        if cross_engine:
+            results = self.credential_finder.cross_engine_search(query, num=num)
+        else:
+            results = self.credential_finder.search(query, num)
+        if results:
+            self._search_cache[key] = (now + self.SEARCH_TTL, results)
+        return results
+    
+    def _clear_search_cache(self):
+        self._search_cache.clear()
+        print("🔄 Caché de búsquedas vaciada")
+    
+    def _credential_engine_info(self):
+        return self._cached_engine_info('credential_finder', self.credential_finder.get_search_engine_info)
+    
+    def _dork_engine_info(self):
+        return self._cached_engine_info('dork_engine', self.dork_engine.get_engine_info)
     
     def get_global_engine_info(self) -> dict:
         """
@@ -90,7 +490,7 @@ class MasterSecurityTool:
             Dictionary with global engine information
         """
         try:
-            cred_info = self.credential_finder.get_search_engine_info()
+            cred_info = self._credential_engine_info()
             return {
                 'global_preference': self.global_engine_selection.value if self.global_engine_selection else 'Auto-select',
                 'credential_finder_engine': cred_info.get('engine_type'),
@@ -107,50 +507,11 @@ class MasterSecurityTool:
         
     def show_banner(self):
         """Mostrar banner principal de la herramienta"""
-        banner = """
-╔═══════════════════════════════════════════════════════════════════╗
-║                                                                   ║
-║   🔍 KIT AVANZADO DE DESCUBRIMIENTO DE CREDENCIALES 🔍            ║
-║                               by Roska                            ║
-║   • Google Dorking + DuckDuckGo para archivos sensibles           ║
-║   • Búsqueda de credenciales multi-motor                          ║
-║   • Descubrimiento de endpoints de API                            ║
-║   • Enumeración de subdominios                                    ║
-║   • Generación automática de reportes                             ║
-║   • Evaluación y análisis de riesgo                               ║
-║   • Comparación avanzada entre motores                            ║
-║                                                                   ║
-╚═══════════════════════════════════════════════════════════════════╝
-        """
-        print(banner)
-     
+        sys.stdout.write(_BANNER)
+        
     def show_menu(self):
         """Mostrar el menú principal"""
-        menu = """
-┌─────────────────────────────────────────────────────────────────┐
-│                         MENÚ PRINCIPAL                          │
-├─────────────────────────────────────────────────────────────────┤
-│  1. 🔍 Buscador de credenciales (interactivo)                   │
-│  2. 🌐 Descubrimiento de subdominios                            │
-│  3. 📊 Plantillas de Google Dorking                             │
-│  4. 🧨 Dorks avanzados multi-motor (Google + DuckDuckGo)        │
-│  5. 📚 Búsqueda de libros PDF                                   │
-│  6. 🔄 Búsqueda cruzada entre motores                           │
-│  7. 📈 Generar reportes                                         │
-│  8. 🚀 Escaneo rápido (todas las herramientas)                  │
-│  9. ⚙️  Configuración motores                                    │
-│ 10. 📊 Comparación de rendimiento                               │
-│ 11. 📚 Ayuda y documentación                                    │
-│ 12. 🖼️  Búsquedas avanzadas (imágenes / noticias / trending)     │
-│ 13. 🧨 Dorks interactivos (selección personalizada)             │
-│ 14. 📹 Modo cámaras (dorks personalizados)                      │
-│ 15. 🔑 Búsqueda de API Keys (todas las plataformas)             │
-│ 16. 🤖 Asistente LLM de dorks (Groq)                            │
-│ 17. 🔎 SmartSearch sobre resultados locales                     │
-│ 18. ❌ Salir                                                    │
-└─────────────────────────────────────────────────────────────────┘
-        """
-        print(menu)
+        sys.stdout.write(_MENU)
         
         # Show current engine status
         self._display_engine_status()
@@ -158,8 +519,8 @@ class MasterSecurityTool:
     def _display_engine_status(self):
         """Display current search engine status"""
         try:
-            cred_info = self.credential_finder.get_search_engine_info()
-            dork_info = self.dork_engine.get_engine_info()
+            cred_info = self._credential_engine_info()
+            dork_info = self._dork_engine_info()
 
             print(f"\n🔍 Estado de Motores:")
             print(f"   Actual: {cred_info['engine_type'].title() if cred_info['engine_type'] else 'Auto-select'}")
@@ -187,54 +548,65 @@ class MasterSecurityTool:
         scan_results = {
             'domain': domain,
             'timestamp': timestamp,
-            'credential_finding': [],
+            'credential_finding': {},
             'subdomains': {},
             'scan_summary': {}
         }
         
-        # 1. Subdomain Discovery
-        print("\n🔍 Step 1: Discovering Subdomains...")
+        # Steps 1 and 2 are independent network-bound searches: run the
+        # subdomain discovery and the four credential dorks concurrently.
+        print("\n🔍 Steps 1-2: Discovering Subdomains and Credentials (in parallel)...")
+        credential_tasks = {
+            'env_files': self.credential_finder.find_env_files,
+            'config_files': self.credential_finder.find_config_files,
+            'credentials': self.credential_finder.find_credentials,
+            'api_endpoints': self.credential_finder.find_api_endpoints,
+        }
+        subdomain_future = self._executor.submit(self.subdomain_finder.discover_subdomains, domain)
+        credential_futures = {self._executor.submit(func): name for name, func in credential_tasks.items()}
+
+        credential_results = {}
+        for future in concurrent.futures.as_completed(credential_futures):
+            name = credential_futures[future]
+            try:
+                credential_results[name] = future.result()
+            except Exception as e:
+                print(f"  ❌ Error in credential discovery ({name}): {e}")
+                credential_results[name] = []
+
         try:
-            subdomain_results = self.subdomain_finder.discover_subdomains(domain)
+            subdomain_results = subdomain_future.result()
+        except Exception as e:
+            print(f"  ❌ Error in subdomain discovery: {e}")
+            subdomain_results = None
+
+        # 1. Subdomain Discovery
+        print("\n🔍 Step 1: Subdomains")
+        per_subdomain = {}
+        if subdomain_results is not None:
             scan_results['subdomains'] = subdomain_results
             
             if subdomain_results['subdomains']:
                 print(f"  ✅ Found {len(subdomain_results['subdomains'])} subdomains")
                 
-                # Test each subdomain for credentials
-                for subdomain in subdomain_results['subdomains']:
-                    print(f"  🔍 Scanning subdomain: {subdomain}")
-                    # You could add subdomain-specific credential scanning here
-                    
-        except Exception as e:
-            print(f"  ❌ Error in subdomain discovery: {e}")
+                # Probe every subdomain concurrently (bounded pool, shared session)
+                print(f"  🔍 Probing {len(subdomain_results['subdomains'])} subdomains...")
+                per_subdomain = self.subdomain_finder.probe_subdomains(
+                    subdomain_results['subdomains'], executor=self._executor
+                )
         
         # 2. Credential Discovery
-        print("\n🔍 Step 2: Credential Discovery...")
-        try:
-            # Use predefined dorking queries
-            env_results = self.credential_finder.find_env_files()
-            config_results = self.credential_finder.find_config_files()
-            cred_results = self.credential_finder.find_credentials()
-            api_results = self.credential_finder.find_api_endpoints()
-            
-            scan_results['credential_finding'] = {
-                'env_files': env_results,
-                'config_files': config_results,
-                'credentials': cred_results,
-                'api_endpoints': api_results
-            }
-            
-            total_creds = len(env_results) + len(config_results) + len(cred_results) + len(api_results)
-            print(f"  ✅ Found {total_creds} credential-related results")
-            
-        except Exception as e:
-            print(f"  ❌ Error in credential discovery: {e}")
+        print("\n🔍 Step 2: Credential Discovery")
+        # Keep the original key order regardless of completion order
+        credential_finding: CredentialFinding = {name: credential_results[name] for name in credential_tasks}
+        total_credentials = sum(map(len, credential_finding.values()))
+        print(f"  ✅ Found {total_credentials} credential-related results")
+        credential_finding['per_subdomain'] = per_subdomain
+        scan_results['credential_finding'] = credential_finding
         
         # 3. Generate Summary
         print("\n📊 Step 3: Generating Scan Summary...")
         total_subdomains = len(scan_results['subdomains'].get('subdomains', []))
-        total_credentials = sum(len(v) for v in scan_results['credential_finding'].values() if isinstance(v, list))
         
         scan_results['scan_summary'] = {
             'total_subdomains': total_subdomains,
@@ -264,14 +636,10 @@ class MasterSecurityTool:
     
     def _assess_risk_level(self, credential_count, subdomain_count):
         """Assess overall risk level"""
-        if credential_count > 20 or subdomain_count > 50:
-            return "HIGH"
-        elif credential_count > 10 or subdomain_count > 20:
-            return "MEDIUM"
-        elif credential_count > 0 or subdomain_count > 0:
-            return "LOW"
-        else:
-            return "MINIMAL"
+        for max_credentials, max_subdomains, label in _RISK_THRESHOLDS:
+            if credential_count > max_credentials or subdomain_count > max_subdomains:
+                return label
+        return "MINIMAL"
     
     def _display_scan_summary(self, results):
         """Display scan summary"""
@@ -296,11 +664,15 @@ class MasterSecurityTool:
     
     def _sanitize_filename(self, text, prefix="results"):
         """Create a filesystem-safe filename based on user input."""
-        safe = "".join(c if c.isalnum() or c in ("-", "_") else "_" for c in text)
-        safe = safe.strip("_")
-        if not safe:
-            safe = prefix
-        return safe
+        safe = _SANITIZE_RE.sub("_", text)[:_MAX_FILENAME_STEM].strip("_")
+        return safe or prefix
+    
+    def _yesno(self, prompt, default=False):
+        """Ask a yes/no question; Enter returns ``default``."""
+        answer = input(prompt).strip().casefold()
+        if not answer:
+            return default
+        return answer in _YES
     
     def _save_generic_results(self, results, default_filename):
         """Helper to save generic results to JSON using CredentialFinder."""
@@ -309,9 +681,8 @@ class MasterSecurityTool:
             return
         
         # Aclarar al usuario que el programa está esperando entrada
-        save = input("\n💾 Save results to JSON file? (y/n, Enter = n): ").strip().lower()
-        if save == 'y':
-            self.credential_finder.save_results(results, default_filename)
+        if self._yesno("\n💾 Save results to JSON file? (y/n, Enter = n): "):
+            self._save_in_background(self.credential_finder.save_results, results, default_filename)
         else:
             print("ℹ️  Results were not saved. Returning to the main menu...")
     
@@ -329,10 +700,9 @@ class MasterSecurityTool:
             results = self.subdomain_finder.discover_subdomains(domain)
             
             # Guardar resultados
-            save = input("¿Guardar resultados en un archivo JSON? (y/n): ").lower()
-            if save == 'y':
+            if self._yesno("¿Guardar resultados en un archivo JSON? (y/n): "):
                 filename = f"{domain.replace('.', '_')}_subdomains.json"
-                self.subdomain_finder.save_results(results, filename)
+                self._save_in_background(self.subdomain_finder.save_results, results, filename)
     
     def dorking_templates_menu(self):
         """Display Google Dorking templates"""
@@ -341,18 +711,19 @@ class MasterSecurityTool:
         
         templates = GoogleDorkTemplates.all_templates()
         
+        lines = []
         for category, queries in templates.items():
-            print(f"\n🔍 {category.replace('_', ' ').title()}:")
-            print("-" * 40)
-            for i, query in enumerate(queries, 1):
-                print(f"{i:2d}. {query}")
+            lines.append(f"\n🔍 {category.replace('_', ' ').title()}:")
+            lines.append("-" * 40)
+            lines.extend(f"{i:2d}. {query}" for i, query in enumerate(queries, 1))
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def advanced_dorks_menu(self):
         """Menú interactivo para ejecutar dorks avanzados desde el catálogo."""
         print("\n🧨 Dorks avanzados de Google (catálogo)")
         print("=" * 60)
         
-        categories = self.dork_engine.catalog.get_categories()
+        categories = self.dork_engine.catalog.categories
         if not categories:
             print("❌ No se encontraron categorías de dorks en dorks_catalog.json")
             return
@@ -391,8 +762,7 @@ class MasterSecurityTool:
             except Exception as e:
                 print(f"❌ Error al ejecutar los dorks avanzados: {e}")
             
-            again = input("\n¿Ejecutar otra categoría? (y/n): ").lower()
-            if again != 'y':
+            if not self._yesno("\n¿Ejecutar otra categoría? (y/n): "):
                 break
     
     def advanced_dorks_multi_engine_menu(self):
@@ -400,7 +770,7 @@ class MasterSecurityTool:
         print("\n🧨 Dorks avanzados multi‑motor (catálogo)")
         print("=" * 60)
         
-        categories = self.dork_engine.catalog.get_categories()
+        categories = self.dork_engine.catalog.categories
         if not categories:
             print("❌ No se encontraron categorías de dorks en dorks_catalog.json")
             return
@@ -440,8 +810,7 @@ class MasterSecurityTool:
             except Exception as e:
                 print(f"❌ Error al ejecutar dorks multi‑motor: {e}")
             
-            again = input("\n¿Ejecutar otra categoría? (y/n): ").lower()
-            if again != 'y':
+            if not self._yesno("\n¿Ejecutar otra categoría? (y/n): "):
                 break
     
     def interactive_dorks_menu(self):
@@ -451,6 +820,28 @@ class MasterSecurityTool:
         print("Iniciando interfaz interactiva...")
         self.interactive_dork_interface.run_interactive_session()
     
+    @classmethod
+    def _dedup_by_link(cls, results_by_engine):
+        """Flatten per-engine results, keeping the first item per link (items without a link are dropped)."""
+        flat = (item for engine_results in results_by_engine.values() for item in engine_results or ())
+        return cls._unique_by_link(flat, keep_unlinked=False)
+    
+    @staticmethod
+    def _unique_by_link(results, keep_unlinked=True):
+        """Drop repeated links from a flat result list, keeping order (and items without a link, unless told not to)."""
+        seen = set()
+        unique = []
+        for item in results or ():
+            link = item.get("link")
+            if link:
+                if link in seen:
+                    continue
+                seen.add(link)
+            elif not keep_unlinked:
+                continue
+            unique.append(item)
+        return unique
+    
     def cameras_mode_menu(self):
         """Modo especializado para búsquedas de cámaras (dorks personalizados/plantillas)."""
         print("\n📹 Modo avanzado de cámaras")
@@ -497,31 +888,12 @@ class MasterSecurityTool:
                     # Búsqueda multi‑motor para este dork
                     comparison = self.dork_engine.search_manager.compare_results(query, num=10)
                     
-                    adapted = {
-                        "combined_by_engine": comparison.get("results_by_engine", {}),
-                        "total_unique_urls": comparison.get("total_unique_urls", 0),
-                        "overlap_percentage": comparison.get("overlap_percentage", {}),
-                        "engines_tested": comparison.get("engines_tested", []),
-                    }
-                    
-                    self._display_cross_engine_results(adapted, "Cámaras - dork personalizado")
+                    self._display_cross_engine_results(comparison, "Cámaras - dork personalizado")
                     
-                    # Aplanar resultados para poder guardarlos
-                    combined_results = []
-                    for engine_results in adapted["combined_by_engine"].values():
-                        combined_results.extend(engine_results)
+                    # Aplanar y deduplicar por enlace para poder guardarlos
+                    deduped = self._dedup_by_link(comparison.get("results_by_engine", {}))
                     
-                    if combined_results:
-                        # Deduplicar por enlace
-                        seen = set()
-                        deduped = []
-                        for item in combined_results:
-                            link = item.get("link")
-                            if not link or link in seen:
-                                continue
-                            seen.add(link)
-                            deduped.append(item)
-                        
+                    if deduped:
                         default_filename = "cameras_custom_dork_results.json"
                         self._save_generic_results(deduped, default_filename)
                     else:
@@ -559,28 +931,11 @@ class MasterSecurityTool:
                 print(f"\n🔍 Ejecutando dork de cámaras:\n   {query}")
                 try:
                     comparison = self.dork_engine.search_manager.compare_results(query, num=10)
-                    adapted = {
-                        "combined_by_engine": comparison.get("results_by_engine", {}),
-                        "total_unique_urls": comparison.get("total_unique_urls", 0),
-                        "overlap_percentage": comparison.get("overlap_percentage", {}),
-                        "engines_tested": comparison.get("engines_tested", []),
-                    }
-                    self._display_cross_engine_results(adapted, f"Cámaras - plantilla: {template['name']}")
+                    self._display_cross_engine_results(comparison, f"Cámaras - plantilla: {template['name']}")
                     
-                    combined_results = []
-                    for engine_results in adapted["combined_by_engine"].values():
-                        combined_results.extend(engine_results)
+                    deduped = self._dedup_by_link(comparison.get("results_by_engine", {}))
                     
-                    if combined_results:
-                        seen = set()
-                        deduped = []
-                        for item in combined_results:
-                            link = item.get("link")
-                            if not link or link in seen:
-                                continue
-                            seen.add(link)
-                            deduped.append(item)
-                        
+                    if deduped:
                         safe_name = self._sanitize_filename(template["name"], prefix="cameras_template")
                         default_filename = f"{safe_name}_results.json"
                         self._save_generic_results(deduped, default_filename)
@@ -599,28 +954,38 @@ class MasterSecurityTool:
         print("\n🔄 Búsqueda cruzada multi‑motor de credenciales")
         print("=" * 60)
         
+        def _hay_resultados(results) -> bool:
+            """False para respuestas vacías (p. ej. límite de peticiones) en forma de lista o de dict."""
+            if not results:
+                return False
+            if isinstance(results, dict):
+                return bool(results.get("best_combined") or results.get("total_unique_urls"))
+            return True
+        
         def _aplicar_filtros_avanzados(results_dict, titulo_base: str):
             """
             Aplicar filtros avanzados sobre los resultados combinados de una búsqueda multi‑motor.
-            Usa CredentialFinder.filter_results_advanced() para afinar los hallazgos.
+            Usa CredentialFinder.filter_results_advanced_fast() para afinar los hallazgos.
             """
+            if not _hay_resultados(results_dict):
+                return
             if not isinstance(results_dict, dict):
                 print("❌ Resultados en formato inesperado, no se pueden filtrar.")
                 return
             
-            # Aplanar resultados por motor
-            results_by_engine = results_dict.get("results_by_engine", {})
-            combinados = []
-            for engine_results in results_by_engine.values():
-                if engine_results:
-                    combinados.extend(engine_results)
+            # Sin URLs únicas no hay nada que aplanar
+            if results_dict.get("total_unique_urls") == 0:
+                print("❌ No hay resultados combinados para aplicar filtros avanzados.")
+                return
+            
+            # Aplanar resultados por motor (sin duplicados entre motores)
+            combinados = self._dedup_by_link(results_dict.get("results_by_engine", {}))
             
             if not combinados:
                 print("❌ No hay resultados combinados para aplicar filtros avanzados.")
                 return
             
-            usar_filtros = input("\n¿Aplicar filtros avanzados sobre los resultados combinados? (s/n): ").lower()
-            if usar_filtros not in ("s", "y"):
+            if not self._yesno("\n¿Aplicar filtros avanzados sobre los resultados combinados? (s/n): "):
                 return
             
             # Palabras clave obligatorias
@@ -652,14 +1017,20 @@ class MasterSecurityTool:
             min_quality = _leer_float("Mínimo quality_score (0.0–1.0, Enter para omitir): ")
             min_risk = _leer_float("Mínimo risk_score (0.0–1.0, Enter para omitir): ")
             
-            filtrados = self.credential_finder.filter_results_advanced(
+            # Precompilar filtros una sola vez para todo el conjunto combinado
+            keywords_set = frozenset(k.lower() for k in keywords) if keywords else None
+            allowed_set = frozenset(d.lower() for d in allowed_domains) if allowed_domains else None
+            blocked_set = frozenset(d.lower() for d in blocked_domains) if blocked_domains else None
+            ft_re = self.credential_finder.filetypes_re(required_filetypes)
+            
+            filtrados = self.credential_finder.filter_results_advanced_fast(
                 combinados,
-                keywords=keywords,
-                allowed_domains=allowed_domains,
-                blocked_domains=blocked_domains,
-                required_filetypes=required_filetypes,
-                min_quality_score=min_quality,
-                min_risk_score=min_risk,
+                keywords_set=keywords_set,
+                allowed_set=allowed_set,
+                blocked_set=blocked_set,
+                ft_re=ft_re,
+                min_quality=min_quality,
+                min_risk=min_risk,
             )
             
             if not filtrados:
@@ -669,10 +1040,9 @@ class MasterSecurityTool:
             print(f"\n📊 Resultados después de filtros avanzados: {len(filtrados)}")
             self.credential_finder.display_results(filtrados, f"{titulo_base} (filtrado)")
             
-            guardar = input("\n¿Guardar resultados filtrados? (s/n): ").lower()
-            if guardar in ("s", "y"):
+            if self._yesno("\n¿Guardar resultados filtrados? (s/n): "):
                 safe_title = self._sanitize_filename(titulo_base, prefix="cross_engine_filtered")
-                self.credential_finder.save_results(filtrados, f"{safe_title}.json")
+                self._save_in_background(self.credential_finder.save_results, filtrados, f"{safe_title}.json")
         
         while True:
             print("\nTipos de búsqueda disponibles:")
@@ -682,59 +1052,60 @@ class MasterSecurityTool:
             print("4. Endpoints de API multi‑motor")
             print("5. Búsqueda personalizada multi‑motor")
             print("6. Volver al menú principal")
+            print("R. 🔄 Refrescar (vaciar caché de búsquedas)")
             
             choice = input("\nSelecciona tipo de búsqueda (1-6): ").strip()
             
+            if choice.lower() == 'r':
+                self._clear_search_cache()
+                continue
+            
             if choice == '1':
                 print("\n🔍 Búsqueda multi‑motor de archivos .env")
                 results = self.credential_finder.find_env_files_cross_engine()
                 self.credential_finder.display_results(results, "Archivos .env (multi‑motor)", is_cross_engine=True)
-                self.credential_finder.display_engine_comparison(results)
-                
-                _aplicar_filtros_avanzados(results, "Archivos .env (multi‑motor)")
+                if _hay_resultados(results):
+                    self.credential_finder.display_engine_comparison(results)
+                    _aplicar_filtros_avanzados(results, "Archivos .env (multi‑motor)")
                 
-                save = input("\n¿Guardar resultados brutos? (s/n): ").lower()
-                if save in ('s', 'y'):
-                    self.credential_finder.save_results(results, 'env_files_cross_engine_master.json')
+                if self._yesno("\n¿Guardar resultados brutos? (s/n): "):
+                    self._save_in_background(self.credential_finder.save_results, results, 'env_files_cross_engine_master.json')
             
             elif choice == '2':
                 print("\n🔍 Búsqueda multi‑motor de archivos de configuración")
                 query = 'site:github.com "config" "password"'
-                results = self.credential_finder.cross_engine_search(query, num=10)
+                results = self._cached_search(query, 10)
                 self.credential_finder.display_results(results, "Archivos de configuración (multi‑motor)", is_cross_engine=True)
-                self.credential_finder.display_engine_comparison(results)
-                
-                _aplicar_filtros_avanzados(results, "Archivos de configuración (multi‑motor)")
+                if _hay_resultados(results):
+                    self.credential_finder.display_engine_comparison(results)
+                    _aplicar_filtros_avanzados(results, "Archivos de configuración (multi‑motor)")
                 
-                save = input("\n¿Guardar resultados brutos? (s/n): ").lower()
-                if save in ('s', 'y'):
-                    self.credential_finder.save_results(results, 'config_files_cross_engine_master.json')
+                if self._yesno("\n¿Guardar resultados brutos? (s/n): "):
+                    self._save_in_background(self.credential_finder.save_results, results, 'config_files_cross_engine_master.json')
             
             elif choice == '3':
                 print("\n🔍 Búsqueda multi‑motor de credenciales")
                 query = 'site:github.com "password" "api_key"'
-                results = self.credential_finder.cross_engine_search(query, num=10)
+                results = self._cached_search(query, 10)
                 self.credential_finder.display_results(results, "Credenciales (multi‑motor)", is_cross_engine=True)
-                self.credential_finder.display_engine_comparison(results)
+                if _hay_resultados(results):
+                    self.credential_finder.display_engine_comparison(results)
+                    _aplicar_filtros_avanzados(results, "Credenciales (multi‑motor)")
                 
-                _aplicar_filtros_avanzados(results, "Credenciales (multi‑motor)")
-                
-                save = input("\n¿Guardar resultados brutos? (s/n): ").lower()
-                if save in ('s', 'y'):
-                    self.credential_finder.save_results(results, 'credentials_cross_engine_master.json')
+                if self._yesno("\n¿Guardar resultados brutos? (s/n): "):
+                    self._save_in_background(self.credential_finder.save_results, results, 'credentials_cross_engine_master.json')
             
             elif choice == '4':
                 print("\n🔍 Búsqueda multi‑motor de endpoints de API")
                 query = 'site:github.com "api" "endpoint"'
-                results = self.credential_finder.cross_engine_search(query, num=10)
+                results = self._cached_search(query, 10)
                 self.credential_finder.display_results(results, "Endpoints de API (multi‑motor)", is_cross_engine=True)
-                self.credential_finder.display_engine_comparison(results)
-                
-                _aplicar_filtros_avanzados(results, "Endpoints de API (multi‑motor)")
+                if _hay_resultados(results):
+                    self.credential_finder.display_engine_comparison(results)
+                    _aplicar_filtros_avanzados(results, "Endpoints de API (multi‑motor)")
                 
-                save = input("\n¿Guardar resultados brutos? (s/n): ").lower()
-                if save in ('s', 'y'):
-                    self.credential_finder.save_results(results, 'api_endpoints_cross_engine_master.json')
+                if self._yesno("\n¿Guardar resultados brutos? (s/n): "):
+                    self._save_in_background(self.credential_finder.save_results, results, 'api_endpoints_cross_engine_master.json')
             
             elif choice == '5':
                 custom_query = input("Ingresa la consulta personalizada para búsqueda multi‑motor: ").strip()
@@ -742,17 +1113,16 @@ class MasterSecurityTool:
                     print("❌ La consulta no puede estar vacía.")
                     continue
                 
-                results = self.credential_finder.cross_engine_search(custom_query, num=10)
+                results = self._cached_search(custom_query, 10)
                 titulo = f"Dork personalizada (multi‑motor): {custom_query[:30]}"
                 self.credential_finder.display_results(results, titulo, is_cross_engine=True)
-                self.credential_finder.display_engine_comparison(results)
+                if _hay_resultados(results):
+                    self.credential_finder.display_engine_comparison(results)
+                    _aplicar_filtros_avanzados(results, titulo)
                 
-                _aplicar_filtros_avanzados(results, titulo)
-                
-                save = input("\n¿Guardar resultados brutos? (s/n): ").lower()
-                if save in ('s', 'y'):
+                if self._yesno("\n¿Guardar resultados brutos? (s/n): "):
                     safe_query = self._sanitize_filename(custom_query, prefix="custom_query")
-                    self.credential_finder.save_results(results, f'{safe_query}_cross_engine_master.json')
+                    self._save_in_background(self.credential_finder.save_results, results, f'{safe_query}_cross_engine_master.json')
             
             elif choice == '6':
                 # Volver al menú principal
@@ -774,18 +1144,11 @@ class MasterSecurityTool:
         
         choice = input("\nSelect test type (1-4): ").strip()
         
-        test_queries = {
-            '1': 'site:github.com ".env" filetype:env',
-            '2': 'site:github.com "config.json" "password"',
-            '3': 'site:github.com "api" "endpoint"',
-            '4': None
-        }
-        
-        if choice in test_queries:
+        if choice in self._TEST_QUERIES:
             if choice == '4':
                 query = input("Enter custom query for testing: ")
             else:
-                query = test_queries[choice]
+                query = self._TEST_QUERIES[choice]
             
             if query:
                 print(f"\n🔍 Testing query: {query}")
@@ -799,10 +1162,9 @@ class MasterSecurityTool:
                     self._display_detailed_engine_comparison(comparison, query)
                     
                     # Save results
-                    save = input("\nSave comparison results? (y/n): ").lower()
-                    if save == 'y':
+                    if self._yesno("\nSave comparison results? (y/n): "):
                         safe_query = self._sanitize_filename(query, prefix="engine_comparison")
-                        self.credential_finder.save_results(comparison, f'{safe_query}_comparison.json')
+                        self._save_in_background(self.credential_finder.save_results, comparison, f'{safe_query}_comparison.json')
                         
                 except Exception as e:
                     print(f"❌ Error during performance comparison: {e}")
@@ -818,17 +1180,17 @@ class MasterSecurityTool:
         
         # Resumen
         total_urls = results.get('total_unique_urls', 0)
-        overlap = results.get('overlap_percentage', {})
+        overlap_items = [(e.value, p) for e, p in results.get('overlap_percentage', {}).items()]
         engines = results.get('engines_tested', [])
         
         print(f"📊 Total de URLs únicas encontradas: {total_urls}")
-        print(f"🔍 Motores probados: {', '.join([e.value for e in engines])}")
+        print(f"🔍 Motores probados: {', '.join(e.value for e in engines)}")
         
         # Análisis de solapamiento
-        if overlap:
+        if overlap_items:
             print(f"\n🔗 Análisis de solapamiento:")
-            for engine, percentage in overlap.items():
-                print(f"   {engine.value}: {percentage:.1%} de solapamiento con el total de resultados")
+            for name, percentage in overlap_items:
+                print(f"   {name}: {percentage:.1%} de solapamiento con el total de resultados")
         
         # Mejores resultados combinados (deduplicados y ordenados) si están disponibles
         best_combined = results.get("best_combined")
@@ -837,22 +1199,22 @@ class MasterSecurityTool:
             print(f"\n🏆 Mejores resultados combinados (todos los motores)")
             print(f"📈 Puntuación de calidad global: {total_quality_score:.2f}")
             print("-" * 80)
+            lines = []
             for i, result in enumerate(best_combined[:10], 1):  # mostrar top 10
-                title = result.get("title", "N/A")
-                link = result.get("link", "N/A")
-                snippet = result.get("snippet", "N/A")[:120]
-                quality = result.get("quality_score", 0.0)
-                print(f"\n{i}. {title}")
-                print(f"   URL: {link}")
-                print(f"   Calidad: {quality:.2f}")
-                print(f"   Resumen: {snippet}...")
+                get = result.get
+                title = get("title", "N/A")
+                link = get("link", "N/A")
+                snippet = (get("snippet", "N/A") or "")[:120]
+                quality = get("quality_score", 0.0)
+                lines.append(f"\n{i}. {title}\n   URL: {link}\n   Calidad: {quality:.2f}\n   Resumen: {snippet}...\n")
+            sys.stdout.write("".join(lines))
         
         # Resultados combinados por motor
-        combined_by_engine = results.get('combined_by_engine', {})
-        if combined_by_engine:
+        results_by_engine = results.get('results_by_engine', {})
+        if results_by_engine:
             print(f"\n📈 Resultados por motor:")
-            for engine_type, engine_results in combined_by_engine.items():
-                print(f"   {engine_type.value}: {len(engine_results)} resultados")
+            for name, count in [(e.value, len(r)) for e, r in results_by_engine.items()]:
+                print(f"   {name}: {count} resultados")
     
     def _display_detailed_engine_comparison(self, comparison_results, query):
         """Display detailed engine performance comparison"""
@@ -870,12 +1232,16 @@ class MasterSecurityTool:
             print("❌ Need at least 2 engines for comparison")
             return
         
+        # Display names and quality scores computed once per engine
+        engine_names = {e: e.value.title() for e in results_by_engine}
+        qualities = {e: self._calculate_result_quality(r) for e, r in results_by_engine.items()}
+        
         # Calculate and display performance metrics
         print(f"\n🏆 Performance Summary:")
         for engine_type, results in results_by_engine.items():
-            print(f"   {engine_type.value.title()}:")
+            print(f"   {engine_names[engine_type]}:")
             print(f"     - Results found: {len(results)}")
-            print(f"     - Quality score: {self._calculate_result_quality(results):.2f}")
+            print(f"     - Quality score: {qualities[engine_type]:.2f}")
         
         # Show overlap analysis
         total_unique = comparison_results.get('total_unique_urls', 0)
@@ -884,20 +1250,27 @@ class MasterSecurityTool:
         if total_unique > 0:
             print(f"\n🔗 Result Overlap Analysis:")
             print(f"   Total unique URLs: {total_unique}")
-            for engine_type, percentage in overlap.items():
-                print(f"   {engine_type.value}: {percentage:.1%} overlap")
+            for name, percentage in [(e.value, p) for e, p in overlap.items()]:
+                print(f"   {name}: {percentage:.1%} overlap")
         
         # Find common results
         print(f"\n🔍 Common Results (found by multiple engines):")
         common_count = sum(1 for p in overlap.values() if p > 0)
         print(f"   Common results found: {common_count}")
         
-        # Recommendations
-        best_engine = max(overlap.items(), key=lambda x: x[1])
+        # Recommendations (single pass for the best engine and its overlap)
+        best_engine = None
+        best_val = -1.0
+        for engine_type, percentage in overlap.items():
+            if percentage > best_val:
+                best_engine, best_val = engine_type, percentage
+        if best_engine is None:
+            return
+        
         print(f"\n💡 Recommendations:")
-        print(f"   Best overall coverage: {best_engine[0].value.title()}")
+        print(f"   Best overall coverage: {best_engine.value.title()}")
         
-        if max(overlap.values()) < 0.5:
+        if best_val < 0.5:
             print(f"   🔄 Consider using multiple engines for better coverage")
         else:
             print(f"   ✅ Good overlap between engines detected")
@@ -907,28 +1280,18 @@ class MasterSecurityTool:
         if not results:
             return 0.0
         
-        score = 0.0
-        factors = 4
-        
-        # Factor 1: Results with snippets
-        with_snippets = sum(1 for r in results if r.get('snippet', '').strip())
-        score += with_snippets / len(results)
-        
-        # Factor 2: HTTPS results
-        https_count = sum(1 for r in results if r.get('link', '').startswith('https://'))
-        score += https_count / len(results)
-        
-        # Factor 3: Results from known domains
-        reputable_domains = ['github.com', 'stackoverflow.com', 'docs.', 'wikipedia.org']
-        reputable_count = sum(1 for r in results 
-                            if any(domain in r.get('link', '') for domain in reputable_domains))
-        score += reputable_count / len(results)
-        
-        # Factor 4: Results with meaningful titles
-        meaningful_titles = sum(1 for r in results if len(r.get('title', '').strip()) > 10)
-        score += meaningful_titles / len(results)
+        # One pass accumulating the four factors:
+        # snippets present, HTTPS links, known domains, meaningful titles
+        with_snippets = https_count = reputable_count = meaningful_titles = 0
+        for r in results:
+            link = r.get('link', '') or ''
+            with_snippets += bool((r.get('snippet', '') or '').strip())
+            https_count += link.startswith('https://')
+            reputable_count += _REPUTABLE_RE.search(link) is not None
+            meaningful_titles += len((r.get('title', '') or '').strip()) > 10
         
-        return score / factors
+        factors = 4
+        return (with_snippets + https_count + reputable_count + meaningful_titles) / (factors * len(results))
     
     def pdf_book_search_menu(self):
         """Menu for advanced PDF book search using dork templates."""
@@ -961,16 +1324,8 @@ class MasterSecurityTool:
                 else:
                     # Para búsqueda de libros no necesitamos escanear cada URL en profundidad.
                     # Desactivamos temporalmente analyze_urls para evitar esperas largas.
-                    old_gf = getattr(self.credential_finder, "global_filters", {}) or {}
-                    gf_copy = old_gf.copy()
-                    gf_copy["analyze_urls"] = False
-                    self.credential_finder.global_filters = gf_copy
-
-                    try:
+                    with self._disable_url_analysis():
                         self.credential_finder.display_results(combined, "PDF Book Search")
-                    finally:
-                        # Restaurar configuración original de filtros globales
-                        self.credential_finder.global_filters = old_gf
                     
                     safe_title = self._sanitize_filename(title, prefix="pdf_books")
                     default_filename = f"pdf_books_{safe_title}.json"
@@ -978,8 +1333,7 @@ class MasterSecurityTool:
             except Exception as e:
                 print(f"❌ Error during PDF book search: {e}")
             
-            again = input("\n🔁 Search another book? (y/n): ").strip().lower()
-            if again != 'y':
+            if not self._yesno("\n🔁 Search another book? (y/n): "):
                 break
     
     def advanced_results_menu(self):
@@ -989,7 +1343,7 @@ class MasterSecurityTool:
         
         # Basic engine info
         try:
-            engine_info = self.credential_finder.get_search_engine_info()
+            engine_info = self._credential_engine_info()
             current_engine = engine_info.get("engine_type") or "auto-select"
             print(f"🔍 Motor actual: {current_engine}")
         except Exception:
@@ -1015,12 +1369,14 @@ class MasterSecurityTool:
                     return
                 print(f"\n🖼️  Resultados de imágenes para: {query}")
                 print("=" * 60)
+                lines = []
                 for i, r in enumerate(results[:10], 1):
-                    print(f"\n{i}. {r.get('title', 'N/A')}")
-                    print(f"   URL: {r.get('link', 'N/A')}")
-                    thumb = r.get('thumbnail') or r.get('original')
+                    get = r.get
+                    lines.append(f"\n{i}. {get('title', 'N/A')}\n   URL: {get('link', 'N/A')}\n")
+                    thumb = get('thumbnail') or get('original')
                     if thumb:
-                        print(f"   Thumbnail: {thumb}")
+                        lines.append(f"   Thumbnail: {thumb}\n")
+                sys.stdout.write("".join(lines))
             except Exception as e:
                 print(f"❌ Error al buscar imágenes: {e}")
         
@@ -1037,21 +1393,24 @@ class MasterSecurityTool:
                     return
                 print(f"\n📰 Resultados de noticias para: {query}")
                 print("=" * 60)
+                lines = []
                 for i, r in enumerate(results[:10], 1):
-                    print(f"\n{i}. {r.get('title', 'N/A')}")
-                    print(f"   URL: {r.get('link', 'N/A')}")
-                    print(f"   Fecha: {r.get('date', 'N/A')}")
-                    print(f"   Fuente: {r.get('source', 'N/A')}")
-                    snippet = r.get('snippet') or ''
+                    get = r.get
+                    lines.append(
+                        f"\n{i}. {get('title', 'N/A')}\n   URL: {get('link', 'N/A')}\n"
+                        f"   Fecha: {get('date', 'N/A')}\n   Fuente: {get('source', 'N/A')}\n"
+                    )
+                    snippet = get('snippet') or ''
                     if snippet:
-                        print(f"   Snippet: {snippet[:120]}...")
+                        lines.append(f"   Snippet: {snippet[:120]}...\n")
+                sys.stdout.write("".join(lines))
             except Exception as e:
                 print(f"❌ Error al buscar noticias: {e}")
         
         elif choice == '3':
             region = input("Región (por defecto us-en, p.ej. es-es, en-us): ").strip() or "us-en"
             try:
-                trends = self.credential_finder.search_manager.get_trending_searches(region)
+                trends = self._trending(region)
                 if not trends:
                     print("❌ No se pudieron obtener tendencias o el motor actual no las soporta.")
                     return
@@ -1067,6 +1426,34 @@ class MasterSecurityTool:
         else:
             print("❌ Opción inválida.")
     
+    def _run_api_key_search(self, emoji, label, finder_attr, filename, skip_url_analysis, num_results):
+        """Run one single-platform API key search from api_keys_search_menu."""
+        print(f"\n{emoji} Buscando {label}...")
+        # Guardar configuración anterior
+        old_num = self.credential_finder.default_num_results
+        self.credential_finder.default_num_results = num_results
+        
+        try:
+            if skip_url_analysis:
+                # Desactivar análisis profundo de URLs durante esta búsqueda
+                # para evitar cuelgues al procesar cientos de resultados.
+                with self._disable_url_analysis():
+                    results = self._unique_by_link(getattr(self.credential_finder, finder_attr)())
+                    self.credential_finder.display_results(results, label)
+            else:
+                results = self._unique_by_link(getattr(self.credential_finder, finder_attr)())
+                self.credential_finder.display_results(results, label)
+        finally:
+            # Restaurar configuración
+            self.credential_finder.default_num_results = old_num
+        
+        if results:
+            # Opción de buscar más
+            if self._yesno("\n¿Buscar más resultados? (s/n): "):
+                return
+            if self._yesno("¿Guardar resultados? (s/n): "):
+                self._save_in_background(self.credential_finder.save_results, results, filename)
+    
     def api_keys_search_menu(self):
         """Menú para búsqueda de API keys de diferentes plataformas"""
         print("\n🔑 Búsqueda de API Keys - Todas las Plataformas")
@@ -1089,188 +1476,71 @@ class MasterSecurityTool:
             print("10. 🎯 Búsqueda personalizada de API key")
             print("11. ⚙️  Configurar número de resultados por búsqueda")
             print("12. Volver al menú principal")
+            print("R. 🔄 Refrescar (vaciar caché de búsquedas)")
             print(f"\n📊 Resultados por búsqueda: {num_results}")
             
             choice = input("\nSelecciona una opción (1-12): ").strip()
             
-            if choice == '11':
-                try:
-                    new_num = input(f"Número de resultados por búsqueda (actual: {num_results}): ").strip()
-                    if new_num:
-                        num_results = max(1, min(100, int(new_num)))
-                        print(f"✅ Configurado a {num_results} resultados por búsqueda")
-                except ValueError:
-                    print("❌ Valor inválido. Debe ser un número entre 1 y 100.")
+            if choice.lower() == 'r':
+                self._clear_search_cache()
                 continue
             
-            if choice == '1':
-                print("\n🤖 Buscando API Keys de OpenAI...")
-                # Guardar configuración anterior
-                old_num = self.credential_finder.default_num_results
-                self.credential_finder.default_num_results = num_results
-                
-                results = self.credential_finder.find_openai_api_keys()
-                self.credential_finder.display_results(results, "API Keys de OpenAI")
-                
-                # Restaurar configuración
-                self.credential_finder.default_num_results = old_num
-                
-                if results:
-                    # Opción de buscar más
-                    more = input("\n¿Buscar más resultados? (s/n): ").lower()
-                    if more == 's':
-                        continue
-                    save = input("¿Guardar resultados? (s/n): ").lower()
-                    if save == 's':
-                        self.credential_finder.save_results(results, 'openai_api_keys_results.json')
-            
-            elif choice == '2':
-                print("\n🐙 Buscando Tokens de GitHub...")
-                old_num = self.credential_finder.default_num_results
-                self.credential_finder.default_num_results = num_results
-                
-                results = self.credential_finder.find_github_tokens()
-                self.credential_finder.display_results(results, "Tokens de GitHub")
-                
-                self.credential_finder.default_num_results = old_num
-                
-                if results:
-                    more = input("\n¿Buscar más resultados? (s/n): ").lower()
-                    if more == 's':
-                        continue
-                    save = input("¿Guardar resultados? (s/n): ").lower()
-                    if save == 's':
-                        self.credential_finder.save_results(results, 'github_tokens_results.json')
-            
-            elif choice == '3':
-                print("\n💬 Buscando Tokens de Slack...")
-                old_num = self.credential_finder.default_num_results
-                self.credential_finder.default_num_results = num_results
-                
-                results = self.credential_finder.find_slack_tokens()
-                self.credential_finder.display_results(results, "Tokens de Slack")
-                
-                self.credential_finder.default_num_results = old_num
-                
-                if results:
-                    more = input("\n¿Buscar más resultados? (s/n): ").lower()
-                    if more == 's':
-                        continue
-                    save = input("¿Guardar resultados? (s/n): ").lower()
-                    if save == 's':
-                        self.credential_finder.save_results(results, 'slack_tokens_results.json')
-            
-            elif choice == '4':
-                print("\n🔍 Buscando API Keys de Google...")
-                old_num = self.credential_finder.default_num_results
-                self.credential_finder.default_num_results = num_results
-
-                # Desactivar análisis profundo de URLs durante esta búsqueda
-                # para evitar cuelgues al procesar cientos de resultados.
-                old_gf = getattr(self.credential_finder, "global_filters", {}) or {}
-                gf_copy = old_gf.copy()
-                gf_copy["analyze_urls"] = False
-                self.credential_finder.global_filters = gf_copy
-
-                try:
-                    results = self.credential_finder.find_google_api_keys()
-                    self.credential_finder.display_results(results, "API Keys de Google")
-                finally:
-                    # Restaurar configuración original de filtros globales
-                    self.credential_finder.global_filters = old_gf
-
-                self.credential_finder.default_num_results = old_num
-
-                if results:
-                    more = input("\n¿Buscar más resultados? (s/n): ").lower()
-                    if more == 's':
-                        continue
-                    save = input("¿Guardar resultados? (s/n): ").lower()
-                    if save == 's':
-                        self.credential_finder.save_results(results, 'google_api_keys_results.json')
-            
-            elif choice == '5':
-                print("\n💳 Buscando Tokens de Square...")
-                old_num = self.credential_finder.default_num_results
-                self.credential_finder.default_num_results = num_results
-                
-                results = self.credential_finder.find_square_tokens()
-                self.credential_finder.display_results(results, "Tokens de Square")
-                
-                self.credential_finder.default_num_results = old_num
-                
-                if results:
-                    more = input("\n¿Buscar más resultados? (s/n): ").lower()
-                    if more == 's':
-                        continue
-                    save = input("¿Guardar resultados? (s/n): ").lower()
-                    if save == 's':
-                        self.credential_finder.save_results(results, 'square_tokens_results.json')
-            
-            elif choice == '6':
-                print("\n🛒 Buscando Secretos de Shopify...")
-                old_num = self.credential_finder.default_num_results
-                self.credential_finder.default_num_results = num_results
-                
-                results = self.credential_finder.find_shopify_secrets()
-                self.credential_finder.display_results(results, "Secretos de Shopify")
-                
-                self.credential_finder.default_num_results = old_num
-                
-                if results:
-                    more = input("\n¿Buscar más resultados? (s/n): ").lower()
-                    if more == 's':
-                        continue
-                    save = input("¿Guardar resultados? (s/n): ").lower()
-                    if save == 's':
-                        self.credential_finder.save_results(results, 'shopify_secrets_results.json')
-            
-            elif choice == '7':
-                print("\n💰 Buscando Tokens de MercadoPago...")
-                old_num = self.credential_finder.default_num_results
-                self.credential_finder.default_num_results = num_results
-                
-                results = self.credential_finder.find_mercadopago_tokens()
-                self.credential_finder.display_results(results, "Tokens de MercadoPago")
-                
-                self.credential_finder.default_num_results = old_num
-                
-                if results:
-                    more = input("\n¿Buscar más resultados? (s/n): ").lower()
-                    if more == 's':
-                        continue
-                    save = input("¿Guardar resultados? (s/n): ").lower()
-                    if save == 's':
-                        self.credential_finder.save_results(results, 'mercadopago_tokens_results.json')
+            if choice == '11':
+                try:
+                    new_num = input(f"Número de resultados por búsqueda (actual: {num_results}): ").strip()
+                    if new_num:
+                        num_results = max(1, min(100, int(new_num)))
+                        print(f"✅ Configurado a {num_results} resultados por búsqueda")
+                except ValueError:
+                    print("❌ Valor inválido. Debe ser un número entre 1 y 100.")
+                continue
+            
+            if choice in self._API_KEY_ACTIONS:
+                self._run_api_key_search(*self._API_KEY_ACTIONS[choice], num_results=num_results)
             
             elif choice == '8':
                 print("\n🌐 Buscando API Keys en TODAS las plataformas...")
                 old_num = self.credential_finder.default_num_results
                 self.credential_finder.default_num_results = num_results
                 
-                results = self.credential_finder.find_all_api_keys()
-                
-                # Mostrar resultados por plataforma
+                # Cada plataforma se muestra y se escribe a disco en cuanto termina, así
+                # nunca se mantienen en memoria los resultados de todas a la vez.
+                filename = 'all_api_keys_results.json'
+                partial = f'{filename}.part'
+                keep = False
                 total_found = 0
-                for platform, platform_results in results.items():
-                    print(f"\n{'='*60}")
-                    print(f"🔑 Resultados para {platform.upper()}: {len(platform_results)} encontrados")
-                    print('='*60)
+                try:
+                    with open(partial, 'wb') as out:
+                        sep = b'{\n'
+                        for platform, platform_results in self.credential_finder.iter_all_api_keys():
+                            # Varios dorks por plataforma devuelven las mismas URLs: deduplicar antes de mostrar
+                            platform_results = self._unique_by_link(platform_results)
+                            out.write(sep + self.credential_finder.encode_json(platform) + b': '
+                                      + self.credential_finder.encode_json(platform_results))
+                            sep = b',\n'
+                            
+                            print(f"\n{'='*60}")
+                            print(f"🔑 Resultados para {platform.upper()}: {len(platform_results)} encontrados")
+                            print('='*60)
+                            
+                            if platform_results:
+                                self.credential_finder.display_results(platform_results, f"API Keys - {platform.title()}")
+                                total_found += len(platform_results)
+                            else:
+                                print(f"❌ No se encontraron resultados para {platform.upper()}")
+                        out.write(b'\n}\n' if sep != b'{\n' else b'{}\n')
                     
-                    if platform_results:
-                        self.credential_finder.display_results(platform_results, f"API Keys - {platform.title()}")
-                        total_found += len(platform_results)
-                    else:
-                        print(f"❌ No se encontraron resultados para {platform.upper()}")
-                
-                print(f"\n📊 Total de API keys encontradas: {total_found}")
-                
-                self.credential_finder.default_num_results = old_num
-                
-                # Guardar todos los resultados
-                save = input("\n¿Guardar resultados de todas las plataformas? (s/n): ").lower()
-                if save == 's':
-                    self.credential_finder.save_results(results, 'all_api_keys_results.json')
+                    print(f"\n📊 Total de API keys encontradas: {total_found}")
+                    
+                    # Guardar todos los resultados (ya escritos en el archivo parcial)
+                    if self._yesno("\n¿Guardar resultados de todas las plataformas? (s/n): "):
+                        os.replace(partial, filename)
+                        keep = True
+                        print(f"💾 Resultados guardados en {filename}")
+                finally:
+                    self.credential_finder.default_num_results = old_num
+                    if not keep and os.path.exists(partial):
+                        os.remove(partial)
             
             elif choice == '9':
                 print("\n🔄 Búsqueda multi-motor de API Keys en TODAS las plataformas...")
@@ -1279,8 +1549,9 @@ class MasterSecurityTool:
                 
                 results = self.credential_finder.find_all_api_keys_cross_engine()
                 
-                # Mostrar resultados multi-motor por plataforma
-                total_unique = 0
+                # Mostrar resultados multi-motor por plataforma.
+                # Una URL puede aparecer en varias plataformas: se cuenta una sola vez.
+                seen_urls = set()
                 for platform, platform_results in results.items():
                     print(f"\n{'='*60}")
                     print(f"🔍 Resultados multi-motor para {platform.upper()}")
@@ -1292,18 +1563,18 @@ class MasterSecurityTool:
                             f"API Keys {platform.title()} (Multi-Motor)", 
                             is_cross_engine=True
                         )
-                        total_unique += platform_results.get('total_unique_urls', 0)
+                        for engine_results in platform_results.get('results_by_engine', {}).values():
+                            seen_urls.update(r['link'] for r in engine_results if r.get('link'))
                     else:
                         print(f"❌ No se encontraron resultados para {platform.upper()}")
                 
-                print(f"\n📊 Total de URLs únicas encontradas: {total_unique}")
+                print(f"\n📊 Total de URLs únicas encontradas: {len(seen_urls)}")
                 
                 self.credential_finder.default_num_results = old_num
                 
                 # Guardar resultados multi-motor
-                save = input("\n¿Guardar resultados multi-motor de todas las plataformas? (s/n): ").lower()
-                if save == 's':
-                    self.credential_finder.save_results(results, 'all_api_keys_cross_engine_results.json')
+                if self._yesno("\n¿Guardar resultados multi-motor de todas las plataformas? (s/n): "):
+                    self._save_in_background(self.credential_finder.save_results, results, 'all_api_keys_cross_engine_results.json')
             
             elif choice == '10':
                 print("\n🎯 Búsqueda personalizada de API key")
@@ -1322,29 +1593,28 @@ class MasterSecurityTool:
                 
                 print(f"\n🔍 Ejecutando búsqueda: {custom_query}")
                 
-                use_cross_engine = input("¿Usar búsqueda multi-motor? (s/n): ").lower() == 's'
+                use_cross_engine = self._yesno("¿Usar búsqueda multi-motor? (s/n): ")
                 
                 if use_cross_engine:
-                    results = self.credential_finder.cross_engine_search(custom_query, num=num_results)
+                    results = self._cached_search(custom_query, num_results)
                     self.credential_finder.display_results(
                         results, 
                         f"API Keys de {platform_name} (Multi-Motor)", 
                         is_cross_engine=True
                     )
                 else:
-                    results = self.credential_finder.search(custom_query, num_results)
+                    results = self._cached_search(custom_query, num_results, cross_engine=False)
                     results = self.credential_finder.apply_advanced_filters(
-                        results, 
+                        self._unique_by_link(results), 
                         [platform_name.lower(), 'api', 'key', 'secret', 'token']
                     )
                     self.credential_finder.display_results(results, f"API Keys de {platform_name}")
                 
                 if results:
-                    save = input("\n¿Guardar resultados? (s/n): ").lower()
-                    if save == 's':
+                    if self._yesno("\n¿Guardar resultados? (s/n): "):
                         safe_name = self._sanitize_filename(platform_name, prefix="api_keys")
                         filename = f'{safe_name}_api_keys_results.json'
-                        self.credential_finder.save_results(results, filename)
+                        self._save_in_background(self.credential_finder.save_results, results, filename)
             
             elif choice == '12':
                 return
@@ -1361,14 +1631,10 @@ class MasterSecurityTool:
         if not base_dir:
             base_dir = os.getcwd()
 
-        rec_input = input("¿Buscar recursivamente en subdirectorios? (s/n, Enter = s): ").strip().lower()
-        recursive = rec_input not in ("n", "no")
-
-        profile_input = input(
-            "¿Usar perfil rápido de archivos de resultados del kit? (s/n, Enter = s): "
-        ).strip().lower()
+        rec_input = input("¿Buscar recursivamente en subdirectorios? (s/n, Enter = s): ").strip().casefold()
+        recursive = rec_input not in _NO
 
-        if profile_input in ("", "s", "y", "sí", "si"):
+        if self._yesno("¿Usar perfil rápido de archivos de resultados del kit? (s/n, Enter = s): ", default=True):
             file_patterns = [
                 "*results*.json",
                 "*_results.json",
@@ -1387,8 +1653,15 @@ class MasterSecurityTool:
             print("❌ La expresión regular no puede estar vacía.")
             return
 
-        cs_input = input("¿Distinguir mayúsculas/minúsculas? (s/n, Enter = n): ").strip().lower()
-        case_sensitive = cs_input in ("s", "y", "sí", "si")
+        case_sensitive = self._yesno("¿Distinguir mayúsculas/minúsculas? (s/n, Enter = n): ")
+
+        # Compilar una sola vez (y validar antes de pedir el resto de opciones)
+        from smart_search import compile_pattern
+        try:
+            compiled_regex = compile_pattern(regex, case_sensitive=case_sensitive, multiline=True)
+        except ValueError as e:
+            print(f"❌ Error en la expresión regular: {e}")
+            return
 
         from typing import Optional
 
@@ -1409,7 +1682,10 @@ class MasterSecurityTool:
         )
 
         try:
-            searcher = SmartSearch(
+            from smart_search import HyperscanSmartSearch, SmartSearch
+            # Hyperscan (if installed) skips non-matching files in one native pass
+            searcher_cls = HyperscanSmartSearch if HyperscanSmartSearch.available() else SmartSearch
+            searcher = searcher_cls(
                 dir_path=base_dir,
                 file_patterns=file_patterns,
                 recursive=recursive,
@@ -1422,9 +1698,7 @@ class MasterSecurityTool:
 
         try:
             results = searcher.regex_search(
-                pattern=regex,
-                case_sensitive=case_sensitive,
-                multiline=True,
+                pattern=compiled_regex,
                 context_lines=context_lines or 2,
                 max_matches_per_file=max_matches_per_file,
             )
@@ -1448,47 +1722,81 @@ class MasterSecurityTool:
 
         print("\n🔍 Detalle de coincidencias:")
         print("=" * 60)
-        for file_result in matches:
-            print(f"\n📄 Archivo: {file_result.get('file')} ")
-            print(f"   Ruta: {file_result.get('path')}")
-            print(f"   Coincidencias: {file_result.get('match_count', 0)}")
-
-            for m in file_result.get("matches", []):
-                line_no = m.get("line_number")
-                context_line = m.get("context_line", "")
-                print(f"   - Línea {line_no}: {context_line}")
-                before = m.get("context_before") or []
-                after = m.get("context_after") or []
-                if before or after:
-                    print("     Contexto:")
-                    for ctx in before:
-                        print(f"       < {ctx}")
-                    print(f"       = {context_line}")
-                    for ctx in after:
-                        print(f"       > {ctx}")
-
-        # Aplanar resultados para permitir guardarlos fácilmente en JSON
+        # Mostrar y aplanar (para guardar en JSON) en una sola pasada. Con rich
+        # instalado y salida a terminal, la tabla se imprime de una vez al final.
+        use_rich = Console is not None and sys.stdout.isatty()
         flat_results = []
+        flat_append = flat_results.append
         for file_result in matches:
             file_name = file_result.get("file")
             file_path = file_result.get("path")
-            for m in file_result.get("matches", []):
-                flat_results.append(
+            # Un único write por archivo en lugar de un print por línea
+            lines = [
+                f"\n📄 Archivo: {file_name} ",
+                f"   Ruta: {file_path}",
+                f"   Coincidencias: {file_result.get('match_count', 0)}",
+            ]
+            add = lines.append
+
+            for m in file_result.get("matches") or ():
+                line_no = m.get("line_number")
+                context_line = m.get("context_line", "")
+                before = m.get("context_before")
+                after = m.get("context_after")
+                if not use_rich:
+                    add(f"   - Línea {line_no}: {context_line}")
+                    if before or after:
+                        add("     Contexto:")
+                        lines.extend(f"       < {ctx}" for ctx in before or ())
+                        add(f"       = {context_line}")
+                        lines.extend(f"       > {ctx}" for ctx in after or ())
+
+                flat_append(
                     {
                         "file": file_name,
                         "path": file_path,
-                        "line_number": m.get("line_number"),
+                        "line_number": line_no,
                         "match_text": m.get("match_text"),
-                        "context_before": m.get("context_before"),
+                        "context_before": before,
                         "context_line": m.get("context_line"),
-                        "context_after": m.get("context_after"),
+                        "context_after": after,
                     }
                 )
 
+            if not use_rich:
+                sys.stdout.write("\n".join(lines) + "\n")
+
+        if use_rich:
+            self._print_smart_search_table(flat_results)
+
         if flat_results:
             print("\n💾 Puedes guardar estos resultados en un JSON para analizarlos después.")
             self._save_generic_results(flat_results, "smart_search_results.json")
       
+    @staticmethod
+    def _print_smart_search_table(flat_results):
+        """Render SmartSearch matches as one rich Table (through the pager when long)."""
+        table = Table(title="SmartSearch Matches", show_lines=True)
+        table.add_column("Archivo", overflow="fold")
+        table.add_column("Línea", justify="right")
+        table.add_column("Coincidencia", overflow="fold")
+        table.add_column("Contexto", overflow="fold")
+        for r in flat_results:
+            # Text() so brackets in file contents are not read as rich markup
+            context = [*(r["context_before"] or ()), f"= {r['context_line'] or ''}", *(r["context_after"] or ())]
+            table.add_row(
+                Text(str(r["file"])),
+                str(r["line_number"]),
+                Text(str(r["match_text"] or "")),
+                Text("\n".join(context)),
+            )
+        console = Console()
+        if len(flat_results) > _RICH_PAGER_ROWS:
+            with console.pager():
+                console.print(table)
+        else:
+            console.print(table)
+    
     def llm_dork_assistant_menu(self):
         """Menú para interactuar con el LLM de Groq para generación y análisis de dorks."""
         print("\n🤖 Asistente LLM de Dorks (Groq)")
@@ -1497,6 +1805,7 @@ class MasterSecurityTool:
         # Inicializar el asistente solo cuando se use
         if self.llm_dork_assistant is None:
             try:
+                from llm_dork_assistant import GroqDorkAssistant
                 self.llm_dork_assistant = GroqDorkAssistant()
             except Exception as e:
                 print(f"❌ No se pudo inicializar el asistente LLM: {e}")
@@ -1539,7 +1848,7 @@ class MasterSecurityTool:
                     idx = int(run_choice)
                     if 1 <= idx <= len(dorks):
                         selected_dork = dorks[idx - 1]
-                        use_cross = input("¿Usar búsqueda multi-motor? (s/n, Enter = n): ").strip().lower() in ("s", "y")
+                        use_cross = self._yesno("¿Usar búsqueda multi-motor? (s/n, Enter = n): ")
                         print(f"\n🔍 Ejecutando dork generado:\n{selected_dork}\n")
                         try:
                             results = self.credential_finder.dork_search(selected_dork, use_cross_engine=use_cross)
@@ -1739,7 +2048,7 @@ class MasterSecurityTool:
         
         # Show current engine status
         try:
-            cred_info = self.credential_finder.get_search_engine_info()
+            cred_info = self._credential_engine_info()
             global_info = self.get_global_engine_info()
             print(f"\n🔧 Current Configuration:")
             print(f"   Global Preference: {global_info.get('global_preference', 'Unknown')}")
@@ -1754,188 +2063,34 @@ class MasterSecurityTool:
         print(f"   Query Optimizer: {'✅ Available' if self.query_optimizer else '❌ Not Available'}")
     
     def show_help(self):
-            """Mostrar ayuda y documentación en español"""
-            help_text = """
-     📚 AYUDA Y DOCUMENTACIÓN
-     =========================
-     
-     VISIÓN GENERAL
-     --------------
-     Este kit te ayuda a descubrir posibles problemas de seguridad encontrando:
-     
-     • Credenciales expuestas
-     • Archivos sensibles (.env, archivos de configuración, backups)
-     • Endpoints de API y documentación
-     • Subdominios y servicios expuestos
-     
-     Lo hace combinando:
-     • Dorking multi‑motor (Google + DuckDuckGo vía SerpAPI)
-     • Búsquedas especializadas en GitHub
-     • Descubrimiento de subdominios y generación de reportes
-     
-     HERRAMIENTAS PRINCIPALES
-     ------------------------
-     • Credential Finder
-       - Búsquedas específicas de:
-         · Archivos .env
-         · Archivos de configuración
-         · Credenciales (tokens, claves, contraseñas)
-         · Endpoints de API
-       - Soporta:
-         · Un solo motor (Google o DuckDuckGo)
-         · Búsqueda multi‑motor (cross‑engine)
-         · Comparación de motores (quality_score)
-     
-     • Dork Engine
-       - Ejecuta dorks avanzados definidos en dorks_catalog.json
-       - Permite:
-         · Ejecutar categorías completas de dorks con un solo motor
-         · Ejecutar dorks en modo multi‑motor y ver resultados combinados
-         · Buscar libros y recursos PDF mediante la categoría pdf_books
-     
-     • Subdomain Finder
-       - Descubrimiento de subdominios:
-         · Fuerza bruta DNS
-         · Búsqueda en motores
-         · Transparencia de certificados
-       - Opcionalmente, escaneo básico de puertos
-     
-     • Report Generator
-       - Crea reportes en:
-         · HTML
-         · Texto plano
-         · JSON
-       - Incluye resumen de riesgo y categorización de hallazgos.
-     
-     • Master Tool (este menú)
-       - Orquesta todas las herramientas en una sola interfaz:
-     
-         1. Buscador de credenciales (interactivo)
-         2. Descubrimiento de subdominios
-         3. Plantillas de Google Dorking
-         4. Dorks avanzados multi‑motor (Google + DuckDuckGo)
-         5. Búsqueda de libros PDF
-         6. Búsqueda cruzada entre motores (credenciales/config/API)
-         7. Generación de reportes
-         8. Escaneo rápido (todas las herramientas)
-         9. Configuración global de motores
-        10. Comparación de rendimiento entre motores
-        11. Ayuda y documentación (este texto)
-        12. Búsquedas avanzadas de imágenes / noticias / trending (DuckDuckGo)
-        13. Dorks interactivos (selección personalizada)
-        14. Modo cámaras (dorks personalizados)
-        15. Búsqueda de API Keys (OpenAI, GitHub, Slack, Google, Square, Shopify)
-        16. Asistente LLM de dorks (Groq)
-        17. SmartSearch sobre resultados locales
-        18. Salir
-     
-     INTERFAZ MULTI‑MOTOR
-     --------------------
-     Bajo el menú, la lógica de búsquedas se basa en una interfaz unificada:
-     
-     • SearchEngineInterface
-       - Define el contrato para motores de búsqueda:
-         · search(), extract_results(), display_results()
-         · search_images(), search_news(), get_trending_searches()
-         · search_with_fallback() (reintentos con parámetros reducidos)
-     
-     • UnifiedSearchManager
-       - Registra motores (Google, DuckDuckGo via SerpAPI)
-       - Permite:
-         · Seleccionar el motor actual
-         · Buscar con fallback transparente
-         · Ejecutar una misma consulta en varios motores y comparar resultados
-     
-     • QueryOptimizer / EngineAwareSearchManager
-       - Analizan cada consulta y la ajustan según el motor:
-         · Limpian operadores que DuckDuckGo no soporta o no aprovecha bien
-         · Mantienen dorks avanzados ricos para Google cuando tiene sentido
-       - Se usan tanto en CredentialFinder como en DorkEngine para las búsquedas
-         multi‑motor y las comparaciones de rendimiento.
-     
-     MÉTRICAS EN LOS RESULTADOS
-     --------------------------
-     En las listas de resultados verás, además del título/URL/snippet, varias
-     métricas numéricas:
-     
-     • quality_score
-       - Indica la “calidad” aparente de cada resultado:
-         · Tiene snippet
-         · Título con sentido
-         · URL HTTPS
-         · Dominio reputado (github, docs, wikipedia, etc.)
-     
-     • risk_score
-       - Indica de forma HEURÍSTICA cuán “sensibles” parecen los datos:
-         · Tipo de fichero asociado a configs/credenciales (.env, .config, .yml, .php, .json, etc.)
-         · Palabras clave de credenciales (password, secret, token, api_key, access_key, private key, etc.)
-         · Dominio: recursos fuera de GitHub/GitLab se consideran algo más riesgosos
-     
-       Importante:
-       - Se usa sobre todo para priorizar hallazgos de credenciales/config.
-       - Si estás buscando libros PDF, risk_score NO evalúa copyright ni legalidad;
-         simplemente aplica la misma heurística técnica, que en muchos casos será baja.
-     
-     CONSEJOS DE USO
-     ---------------
-     • Para una visión rápida de un dominio:
-       - Usa el Escaneo rápido (opción 8).
-       - Revisa luego los reportes HTML/TXT/JSON que se generan automáticamente.
-     
-     • Para investigación detallada:
-       - Empieza con Descubrimiento de subdominios (opción 2).
-       - Usa Credential Finder (opción 1) para credenciales/config/APIs.
-       - Usa Dork Engine (opción 4/5) para dorks avanzados y búsqueda de libros PDF.
-     
-     • Multi‑motor:
-       - Configura el motor global en la opción 9:
-         · Google
-         · DuckDuckGo
-         · Auto‑select (elige el mejor disponible según lo configurado)
-       - Explora la opción 6 y 10 para ver cómo se comportan los motores y qué
-         cobertura ofrece cada uno.
-     
-     REQUISITOS
-     ----------
-     • Python 3.6 o superior
-     • Clave de API de Google Custom Search (para usar Google)
-     • Clave de SerpAPI (para usar DuckDuckGo vía SerpAPI)
-     • Conexión a Internet
-     • Dependencias indicadas en requirements.txt (requests, dnspython, python-dotenv, etc.)
-     
-     AVISO LEGAL Y USO ÉTICO
-     -----------------------
-     ⚠️  IMPORTANTE:
-         Usa esta herramienta SOLO en:
-         • Sistemas que te pertenezcan, o
-         • Sistemas para los que tengas permiso explícito y por escrito.
-     
-     El uso no autorizado contra sistemas de terceros es ilegal.
-     
-     Buenas prácticas:
-     • Respeta las políticas de uso y límites de cada servicio.
-     • No explotes vulnerabilidades; limítate a identificarlas.
-     • Usa los reportes para mejorar la seguridad, no para atacar.
-     • Sigue marcos de trabajo autorizados (pentesting con contrato, programas de Bug Bounty, etc.).
-     
-     PARA SABER MÁS
-     --------------
-     Consulta también el archivo README.md del proyecto, donde se detalla:
-     
-     • Arquitectura multi‑motor
-     • Catálogo de dorks avanzados
-     • Ejemplos de uso
-     • Recomendaciones adicionales y recursos externos
-     
-     by Roska
-     
-     """
-            print(help_text)
+        """Mostrar ayuda y documentación en español"""
+        print(_HELP_TEXT)
 
 def main():
     """Bucle principal de la aplicación"""
     tool = MasterSecurityTool()
     
+    # Opción del menú principal -> acción (la 18, salir, se trata aparte)
+    dispatch = {
+        '1': tool.credential_finder_menu,
+        '2': tool.subdomain_discovery_menu,
+        '3': tool.dorking_templates_menu,
+        '4': tool.advanced_dorks_multi_engine_menu,
+        '5': tool.pdf_book_search_menu,
+        '6': tool.cross_engine_search_menu,
+        '7': tool.generate_reports_menu,
+        '8': tool.quick_scan,
+        '9': tool.global_engine_configuration_menu,
+        '10': tool.engine_performance_comparison_menu,
+        '11': tool.show_help,
+        '12': tool.advanced_results_menu,
+        '13': tool.interactive_dorks_menu,
+        '14': tool.cameras_mode_menu,
+        '15': tool.api_keys_search_menu,
+        '16': tool.llm_dork_assistant_menu,
+        '17': tool.smart_search_menu,
+    }
+    
     while True:
         try:
             tool.show_banner()
@@ -1943,58 +2098,7 @@ def main():
             
             choice = input("\nSelecciona una opción (1-18): ").strip()
             
-            if choice == '1':
-                tool.credential_finder_menu()
-            
-            elif choice == '2':
-                tool.subdomain_discovery_menu()
-            
-            elif choice == '3':
-                tool.dorking_templates_menu()
-            
-            elif choice == '4':
-                tool.advanced_dorks_multi_engine_menu()
-            
-            elif choice == '5':
-                tool.pdf_book_search_menu()
-            
-            elif choice == '6':
-                tool.cross_engine_search_menu()
-            
-            elif choice == '7':
-                tool.generate_reports_menu()
-            
-            elif choice == '8':
-                tool.quick_scan()
-            
-            elif choice == '9':
-                tool.global_engine_configuration_menu()
-            
-            elif choice == '10':
-                tool.engine_performance_comparison_menu()
-            
-            elif choice == '11':
-                tool.show_help()
-
-            elif choice == '12':
-                tool.advanced_results_menu()
-
-            elif choice == '13':
-                tool.interactive_dorks_menu()
-
-            elif choice == '14':
-                tool.cameras_mode_menu()
-
-            elif choice == '15':
-                tool.api_keys_search_menu()
-
-            elif choice == '16':
-                tool.llm_dork_assistant_menu()
-
-            elif choice == '17':
-                tool.smart_search_menu()
-
-            elif choice == '18':
+            if choice == '18':
                 print("\n👋 ¡Gracias por usar el Kit Avanzado de Descubrimiento de Credenciales!")
                 print("   by Roska")
                 print("🔒 Recuerda: utiliza esta herramienta de forma responsable y ética.")
@@ -2061,6 +2165,9 @@ def main():
 ''')
                 break
             
+            handler = dispatch.get(choice)
+            if handler is not None:
+                handler()
             else:
                 print("\n❌ Opción inválida. Por favor selecciona un número entre 1 y 18.")
             
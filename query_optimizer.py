@@ -5,6 +5,7 @@ Handles engine-specific search operator differences and optimization
 """
 
 import re
+import functools
 from typing import Dict, List, Optional, Tuple
 from search_engine_interface import SearchEngineType
 
@@ -22,6 +23,22 @@ class QueryOptimizer:
         'filetype:', 'site:', 'link:', 'related:', 'cache:'
     ]
     
+    # Static usage tips per engine (get_engine_specific_tips hands out copies)
+    GOOGLE_TIPS = (
+        "Use 'filetype:' for specific file types (pdf, txt, env, etc.)",
+        "Use 'site:' to restrict searches to specific domains",
+        "Use 'intitle:' and 'inurl:' for more targeted results",
+        "Combine operators with AND, OR, and parentheses for complex queries",
+        "Use quotation marks for exact phrase matching",
+    )
+    DDG_TIPS = (
+        "Use 'site:' to restrict searches to specific domains",
+        "Use quotation marks for exact phrase matching",
+        "Combine terms with OR for broader results",
+        "Avoid complex operator combinations",
+        "Use simple, descriptive terms for better results",
+    )
+    
     # DuckDuckGo-friendly replacements for Google operators
     DDG_OPERATOR_MAP = {
         'filetype:': 'type:',  # Partial support
@@ -176,27 +193,29 @@ class QueryOptimizer:
             Dictionary with compatibility scores for each engine
         """
         google_compatible = True
-        ddg_compatible = True
-        
-        # Check for Google-specific operators
-        google_operators_found = []
-        for op in cls.GOOGLE_ONLY_OPERATORS:
-            if op in query:
-                google_operators_found.append(op)
-        
-        # DuckDuckGo compatibility check
-        for google_op, ddg_op in cls.DDG_OPERATOR_MAP.items():
-            if google_op in query and ddg_op == '':
-                ddg_compatible = False
-                break
+        ddg_compatible, google_operators_found = cls._scan_operators(query)
         
         return {
             'google': google_compatible,
             'duckduckgo': ddg_compatible,
-            'google_operators_found': google_operators_found,
+            'google_operators_found': list(google_operators_found),
             'recommendation': cls._get_recommendation(google_compatible, ddg_compatible)
         }
     
+    @classmethod
+    @functools.lru_cache(maxsize=256)
+    def _scan_operators(cls, query: str) -> Tuple[bool, Tuple[str, ...]]:
+        """(DuckDuckGo compatible, Google-only operators found) for a query, memoized"""
+        # Check for Google-specific operators
+        google_operators_found = tuple(op for op in cls.GOOGLE_ONLY_OPERATORS if op in query)
+        
+        # DuckDuckGo compatibility check
+        ddg_compatible = not any(
+            google_op in query and ddg_op == ''
+            for google_op, ddg_op in cls.DDG_OPERATOR_MAP.items()
+        )
+        return ddg_compatible, google_operators_found
+    
     @classmethod
     def _get_recommendation(cls, google_compatible: bool, ddg_compatible: bool) -> str:
         """Get optimization recommendation based on compatibility"""
@@ -259,21 +278,9 @@ class QueryOptimizer:
             List of usage tips
         """
         if engine_type in (SearchEngineType.GOOGLE, SearchEngineType.SERPER_GOOGLE):
-            return [
-                "Use 'filetype:' for specific file types (pdf, txt, env, etc.)",
-                "Use 'site:' to restrict searches to specific domains",
-                "Use 'intitle:' and 'inurl:' for more targeted results",
-                "Combine operators with AND, OR, and parentheses for complex queries",
-                "Use quotation marks for exact phrase matching",
-            ]
+            return list(cls.GOOGLE_TIPS)
         elif engine_type == SearchEngineType.DUCKDUCKGO:
-            return [
-                "Use 'site:' to restrict searches to specific domains",
-                "Use quotation marks for exact phrase matching",
-                "Combine terms with OR for broader results",
-                "Avoid complex operator combinations",
-                "Use simple, descriptive terms for better results",
-            ]
+            return list(cls.DDG_TIPS)
         else:
             return []
 
@@ -333,9 +340,11 @@ class EngineAwareSearchManager:
         for engine_type in self.search_manager.get_available_engines():
             try:
                 print(f"🔍 Searching with {engine_type.value}...")
-                self.search_manager.set_engine(engine_type)
+                # Address the engine directly: switching the shared current
+                # engine would race with concurrent callers
+                engine = self.search_manager.get_engine(engine_type)
                 query_to_use = optimized_queries[engine_type]
-                engine_results = self.search_manager.search(query_to_use, num)
+                engine_results = engine.search_with_fallback(query_to_use, num)
                 results[engine_type] = engine_results
             except Exception as e:
                 print(f"❌ Error with {engine_type.value}: {e}")
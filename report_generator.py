@@ -13,6 +13,12 @@ import hashlib
 from urllib.parse import urlparse
 import re
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
 class ReportGenerator:
     def __init__(self):
         self.reports_dir = "reports"
@@ -369,6 +375,16 @@ Generated: {timestamp}
         
         return results
     
+    @staticmethod
+    def _write_json(data, filepath):
+        """Write data as indented UTF-8 JSON, using orjson when it is installed"""
+        if orjson is not None:
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+    
     def generate_comprehensive_report(self, input_data=None, title=None):
         """Generate comprehensive report from input data"""
         timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
@@ -400,8 +416,7 @@ Generated: {timestamp}
         # JSON Report
         json_report = self.create_json_report(input_data, title, timestamp)
         json_file = os.path.join(self.reports_dir, f"{filename_base}.json")
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(json_report, f, indent=2, ensure_ascii=False)
+        self._write_json(json_report, json_file)
         
         print(f"\n📊 Report Generated Successfully!")
         print(f"📁 Files created:")
@@ -4,6 +4,7 @@ Search Engine Interface
 Abstract base class for unified search functionality across multiple engines
 """
 
+import concurrent.futures
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Any
 from enum import Enum
@@ -182,6 +183,8 @@ class UnifiedSearchManager:
     def __init__(self):
         self.engines: Dict[SearchEngineType, SearchEngineInterface] = {}
         self.current_engine: Optional[SearchEngineType] = None
+        # Optional long-lived pool owned by the caller; a per-call pool is used otherwise
+        self.executor: Optional[concurrent.futures.Executor] = None
     
     def register_engine(self, engine_type: SearchEngineType, engine: SearchEngineInterface):
         """
@@ -258,19 +261,35 @@ class UnifiedSearchManager:
         """
         if engines is None:
             engines = list(self.engines.keys())
+        engines = [engine_type for engine_type in engines if engine_type in self.engines]
+        if not engines:
+            return {}
+        
+        # Engines are independent network calls: query them all at once so the
+        # total latency is the slowest engine instead of the sum of all of them.
+        def _submit_all(executor):
+            futures = {}
+            for engine_type in engines:
+                print(f"🔍 Searching with {engine_type.value}...")
+                # Use fallback-aware search for each engine
+                futures[engine_type] = executor.submit(self.engines[engine_type].search_with_fallback, query, num)
+            concurrent.futures.wait(futures.values())
+            return futures
+        
+        if self.executor is not None:
+            futures = _submit_all(self.executor)
+        else:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=len(engines)) as executor:
+                futures = _submit_all(executor)
         
+        # Keep the requested engine order in the result
         results = {}
-        
-        for engine_type in engines:
-            if engine_type in self.engines:
-                try:
-                    print(f"🔍 Searching with {engine_type.value}...")
-                    engine = self.engines[engine_type]
-                    # Use fallback-aware search for each engine
-                    results[engine_type] = engine.search_with_fallback(query, num)
-                except Exception as e:
-                    print(f"❌ Error searching with {engine_type.value}: {e}")
-                    results[engine_type] = []
+        for engine_type, future in futures.items():
+            try:
+                results[engine_type] = future.result()
+            except Exception as e:
+                print(f"❌ Error searching with {engine_type.value}: {e}")
+                results[engine_type] = []
         
         return results
     
@@ -296,10 +315,10 @@ class UnifiedSearchManager:
             engine_urls[engine_type] = urls
             all_urls.update(urls)
         
-        # Calculate overlaps
+        # Calculate overlaps (engine URL sets are subsets of all_urls)
         overlaps = {}
-        for engine_type in engine_urls:
-            overlaps[engine_type] = len(all_urls.intersection(engine_urls[engine_type])) / len(all_urls) if all_urls else 0
+        for engine_type, urls in engine_urls.items():
+            overlaps[engine_type] = len(urls) / len(all_urls) if all_urls else 0
         
         return {
             'query': query,
@@ -471,6 +490,45 @@ class SearchResultComparator:
         return scored_results[:top_n]
 
 # Factory function for creating search managers
+_shared_adapter = None
+
+def shared_http_adapter():
+    """
+    Process-wide requests HTTPAdapter shared by every engine session.
+
+    Mounting the same adapter on several sessions makes them share one
+    keep-alive connection pool (no repeated TCP/TLS handshakes) and one
+    retry policy for transient errors and 429s, while each session keeps
+    its own headers (API keys never leak between engines).
+    """
+    global _shared_adapter
+    if _shared_adapter is None:
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset({"GET", "POST"}),
+            raise_on_status=False,  # let callers' raise_for_status() report it
+        )
+        # Sized for the busiest fan-out: concurrent platforms x engines plus the menu's worker pool
+        _shared_adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry)
+    return _shared_adapter
+
+def mount_shared_adapter(session):
+    """Route all HTTP(S) traffic of ``session`` through the shared adapter."""
+    adapter = shared_http_adapter()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+def create_http_session():
+    """New requests.Session wired to the shared connection pool."""
+    import requests
+    return mount_shared_adapter(requests.Session())
+
 def create_search_manager() -> UnifiedSearchManager:
     """
     Factory function to create a configured search manager
@@ -10,7 +10,7 @@ from typing import Dict, List, Optional, Any
 import requests
 from dotenv import load_dotenv
 
-from search_engine_interface import SearchEngineInterface, SearchEngineType
+from search_engine_interface import SearchEngineInterface, SearchEngineType, create_http_session
 
 load_dotenv()
 
@@ -32,7 +32,7 @@ class SerperGoogleSearch(SearchEngineInterface):
         if not self.api_key:
             raise ValueError("SERPER_API_KEY not found in environment variables")
 
-        self.session = requests.Session()
+        self.session = create_http_session()
         self.session.headers.update(
             {
                 "X-API-KEY": self.api_key,
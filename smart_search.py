@@ -10,9 +10,195 @@ from __future__ import annotations
 
 import os
 import re
+import mmap
 import fnmatch
+import functools
+import concurrent.futures
+import multiprocessing
 from dataclasses import dataclass
-from typing import Dict, List, Iterable, Optional, Any
+from typing import Callable, Dict, List, Iterable, Iterator, Optional, Any, NamedTuple, Tuple
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# Required literals shorter than this rarely let a file be skipped
+_MIN_NEEDLE_LEN = 3
+# Counted repetition ({n}, {n,}, {,m}, {n,m}); any other '{' is a literal
+_QUANTIFIER_RE = re.compile(r"\{\d*(?:,\d*)?\}")
+# Fixed-width escapes: how many characters follow the escape letter
+_ESCAPE_DIGITS = {"x": 2, "u": 4, "U": 8}
+
+
+def _skip_class(pattern: str, i: int) -> int:
+    """Index just past the character class starting at ``pattern[i] == '['``."""
+    i += 1
+    if i < len(pattern) and pattern[i] == "^":
+        i += 1
+    if i < len(pattern) and pattern[i] == "]":  # leading ']' is literal
+        i += 1
+    while i < len(pattern) and pattern[i] != "]":
+        i += 2 if pattern[i] == "\\" else 1
+    return i + 1
+
+
+def _escape_end(pattern: str, i: int) -> int:
+    """Index just past the escape starting at ``pattern[i] == '\\'`` (\\x41, \\u00e9, \\N{...}, \\12 ...)."""
+    kind = pattern[i + 1 : i + 2]
+    if kind in _ESCAPE_DIGITS:
+        return i + 2 + _ESCAPE_DIGITS[kind]
+    if kind == "N" and pattern[i + 2 : i + 3] == "{":
+        end = pattern.find("}", i + 3)
+        return len(pattern) if end == -1 else end + 1
+    if kind.isdigit():
+        j = i + 2
+        while j < len(pattern) and j < i + 4 and pattern[j].isdigit():
+            j += 1
+        return j
+    return i + 2
+
+
+def _skip_group(pattern: str, i: int) -> int:
+    """Index just past the group starting at ``pattern[i] == '('``."""
+    depth = 0
+    while i < len(pattern):
+        c = pattern[i]
+        if c == "\\":
+            i += 2
+            continue
+        if c == "[":
+            i = _skip_class(pattern, i)
+            continue
+        if c == "(":
+            depth += 1
+        elif c == ")":
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return i
+
+
+def _required_literal_runs(pattern: str) -> Optional[List[str]]:
+    """
+    Runs of literal characters at the top level of ``pattern`` (each one is
+    part of every match), or None when the pattern has top-level alternation.
+
+    A deliberately small, conservative scanner: groups, classes, anchors,
+    ``.``, letter/digit escapes (``\\d``, ``\\b``, ``\\1``, ``\\x41`` ...) and
+    quantified characters all end a run, so anything it is unsure about is
+    simply not required. Punctuation escapes (``\\.``, ``\\-``) are literal.
+    """
+    runs: List[str] = []
+    run: List[str] = []
+
+    def close():
+        if run:
+            runs.append("".join(run))
+            run.clear()
+
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if c == "|":
+            return None
+        if c == "\\":
+            nxt = pattern[i + 1 : i + 2]
+            if nxt and not nxt.isalnum() and nxt != "\ufffd":
+                run.append(nxt)
+            else:
+                close()
+            i = _escape_end(pattern, i)
+            continue
+        if c in "*+?":
+            if run:
+                run.pop()  # the quantified character is optional/repeated
+            close()
+            i += 1
+            continue
+        if c == "{":
+            m = _QUANTIFIER_RE.match(pattern, i)
+            if m:
+                if run:
+                    run.pop()
+                close()
+                i = m.end()
+                continue
+            run.append(c)
+            i += 1
+            continue
+        if c == "[":
+            close()
+            i = _skip_class(pattern, i)
+            continue
+        if c == "(":
+            if pattern.startswith("(?#", i):
+                # A comment is invisible: a following quantifier applies to the run's last char
+                end = pattern.find(")", i)
+                i = n if end == -1 else end + 1
+                continue
+            close()
+            i = _skip_group(pattern, i)
+            continue
+        if c in ".^$" or c == "\ufffd":
+            close()
+        else:
+            run.append(c)
+        i += 1
+    close()
+    return runs
+
+
+@functools.lru_cache(maxsize=32)
+def _compile(pattern: str, flags: int) -> "re.Pattern[str]":
+    """Compile (and memoize) a search pattern; re-entering the menu with the same regex is free."""
+    try:
+        return re.compile(pattern, flags)
+    except re.error as e:
+        raise ValueError(f"Invalid regular expression: {e}") from e
+
+
+def compile_pattern(pattern: str, case_sensitive: bool = False, multiline: bool = True) -> "re.Pattern[str]":
+    """Compile a SmartSearch pattern with the same flags regex_search() would use."""
+    flags = 0
+    if not case_sensitive:
+        flags |= re.IGNORECASE
+    if multiline:
+        flags |= re.MULTILINE
+    return _compile(pattern, flags)
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_globs(patterns: tuple) -> "re.Pattern[str]":
+    """One regex for a set of fnmatch globs, so a filename is tested in a single match."""
+    return re.compile("|".join(fnmatch.translate(os.path.normcase(p)) for p in patterns))
+
+
+# Below this much data (total bytes of the selected files) starting a process
+# pool costs more than it saves; small trees are always scanned in-process
+PARALLEL_MIN_BYTES = 16 * 1024 * 1024
+
+
+class _Matchers(NamedTuple):
+    """Per-search helpers derived once from the compiled pattern."""
+    may_match: Optional[Callable[[List[str]], bool]]
+    line_matches: Callable[[str], Iterable[str]]
+    needle: Optional[bytes]
+
+
+# Matchers built inside a worker process, so each pool process prepares a pattern once
+_WORKER_MATCHERS: Dict[Tuple[type, str, int], _Matchers] = {}
+
+
+def _scan_one(searcher: "SmartSearch", pattern: str, flags: int, path: str,
+              context_lines: int, max_matches_per_file: Optional[int]) -> Optional["FileMatches"]:
+    """Process-pool entry point: scan a single file (top-level so it can be pickled)."""
+    key = (type(searcher), pattern, flags)
+    matchers = _WORKER_MATCHERS.get(key)
+    if matchers is None:
+        matchers = _WORKER_MATCHERS[key] = searcher._prepare(_compile(pattern, flags))
+    return searcher._scan_file(path, matchers, context_lines, max_matches_per_file)
 
 
 @dataclass
@@ -60,38 +246,50 @@ class SmartSearch:
         """
         Yield full paths of files that match the configuration.
         """
+        for path, _ in self._iter_sized_files():
+            yield path
+
+    def _iter_sized_files(self) -> Iterator[Tuple[str, int]]:
+        """Yield (path, size in bytes) of files that match the configuration."""
         if not os.path.isdir(self.dir_path):
             return
 
         max_bytes = self.max_file_size_mb * 1024 * 1024 if self.max_file_size_mb > 0 else None
+        yield from self._scan_dir(self.dir_path, max_bytes)
 
-        if self.recursive:
-            walker: Iterable[Any] = os.walk(self.dir_path)
-            for root, _dirs, files in walker:
-                for name in files:
-                    full_path = os.path.join(root, name)
-                    if not self._matches_patterns(name):
-                        continue
-                    if max_bytes is not None and not self._within_size_limit(full_path, max_bytes):
-                        continue
-                    if self.ignore_binary and self._looks_binary(full_path):
-                        continue
-                    yield full_path
-        else:
-            try:
-                for name in os.listdir(self.dir_path):
-                    full_path = os.path.join(self.dir_path, name)
-                    if not os.path.isfile(full_path):
-                        continue
-                    if not self._matches_patterns(name):
-                        continue
-                    if max_bytes is not None and not self._within_size_limit(full_path, max_bytes):
+    def _scan_dir(self, dir_path: str, max_bytes: Optional[int]) -> Iterator[Tuple[str, int]]:
+        """
+        os.scandir-based walk: entry type checks come from the directory
+        listing and the size needs a single stat per candidate file.
+        Files of a directory are yielded before its subdirectories (top-down,
+        like os.walk); symlinked directories are not followed.
+        """
+        subdirs: List[str] = []
+        try:
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir():
+                            if self.recursive and not entry.is_symlink():
+                                subdirs.append(entry.path)
+                            continue
+                        if not entry.is_file():
+                            continue
+                        if not self._matches_patterns(entry.name):
+                            continue
+                        size = entry.stat().st_size
+                        if max_bytes is not None and size > max_bytes:
+                            continue
+                    except OSError:
                         continue
-                    if self.ignore_binary and self._looks_binary(full_path):
+                    if self.ignore_binary and self._looks_binary(entry.path):
                         continue
-                    yield full_path
-            except OSError:
-                return
+                    yield entry.path, size
+        except OSError:
+            return
+
+        for sub in subdirs:
+            yield from self._scan_dir(sub, max_bytes)
 
     def _matches_patterns(self, name: str) -> bool:
         """
@@ -101,17 +299,8 @@ class SmartSearch:
         """
         if not self.file_patterns:
             return True
-        for pattern in self.file_patterns:
-            if fnmatch.fnmatch(name, pattern):
-                return True
-        return False
-
-    @staticmethod
-    def _within_size_limit(path: str, max_bytes: int) -> bool:
-        try:
-            return os.path.getsize(path) <= max_bytes
-        except OSError:
-            return False
+        # Same semantics as fnmatch.fnmatch against each pattern
+        return _compile_globs(tuple(self.file_patterns)).match(os.path.normcase(name)) is not None
 
     @staticmethod
     def _looks_binary(path: str, sample_size: int = 1024) -> bool:
@@ -141,87 +330,94 @@ class SmartSearch:
         except OSError:
             return None
 
+    @staticmethod
+    def _literal_needle(regex: "re.Pattern[str]") -> Optional[bytes]:
+        """
+        UTF-8 bytes of the longest literal every match must contain (``AKIA`` in
+        ``AKIA[0-9A-Z]{16}``, the whole pattern for a plain literal), or None.
+        Such a literal occurs in the decoded text only if its bytes occur in the
+        raw file, so files can be rejected without decoding them.
+
+        Only top-level literals of a case-sensitive, non-verbose pattern without
+        top-level alternation are used (see _required_literal_runs); quantified
+        or grouped parts are never required.
+        """
+        if regex.flags & (re.IGNORECASE | re.VERBOSE):
+            return None
+        runs = _required_literal_runs(regex.pattern)
+        if not runs:
+            return None
+        best = max(runs, key=len)
+        if len(best) < _MIN_NEEDLE_LEN and best != regex.pattern.lstrip("^"):
+            return None
+        return best.encode("utf-8") if best else None
+
+    @staticmethod
+    def _file_contains(path: str, needle: bytes) -> bool:
+        """Search the raw bytes through a read-only mmap (no read()/decode of the whole file)."""
+        try:
+            with open(path, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return False
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return mm.find(needle) != -1
+        except (OSError, ValueError):
+            # Fall back to the normal read path
+            return True
+
     def regex_search(
         self,
-        pattern: str,
+        pattern: "str | re.Pattern[str]",
         case_sensitive: bool = False,
         multiline: bool = True,
         context_lines: int = 2,
         max_matches_per_file: Optional[int] = None,
+        workers: Optional[int] = None,
     ) -> Dict[str, Any]:
         """
         Execute a regex search across all selected files.
 
+        Files are scanned in a process pool of ``workers`` processes (default:
+        CPU count) when they add up to at least PARALLEL_MIN_BYTES; pass
+        ``workers=1`` to stay in-process. Result order follows file order.
+
         Returns a structure:
 
         {
             "summary": {...},
             "matches": [FileMatches, ...]  # serializable dicts
         }
+
+        ``pattern`` may also be an already compiled ``re.Pattern``; its own
+        flags are used and ``case_sensitive``/``multiline`` are ignored.
         """
-        if not pattern:
+        if isinstance(pattern, re.Pattern):
+            regex = pattern
+            case_sensitive = not (regex.flags & re.IGNORECASE)
+        else:
+            if not pattern:
+                raise ValueError("Regex pattern must not be empty")
+            regex = compile_pattern(pattern, case_sensitive, multiline)
+        if not regex.pattern:
             raise ValueError("Regex pattern must not be empty")
 
-        flags = 0
-        if not case_sensitive:
-            flags |= re.IGNORECASE
-        if multiline:
-            flags |= re.MULTILINE
-
-        try:
-            regex = re.compile(pattern, flags)
-        except re.error as e:
-            raise ValueError(f"Invalid regular expression: {e}") from e
-
-        all_file_matches: List[FileMatches] = []
-        total_files_scanned = 0
-        total_files_with_matches = 0
-        total_matches = 0
-
-        for path in self._iter_files():
-            total_files_scanned += 1
-            text = self._read_text_file(path)
-            if text is None:
-                continue
-
-            lines = text.splitlines()
-            file_matches: List[MatchContext] = []
+        sized = list(self._iter_sized_files())
+        paths = [path for path, _ in sized]
+        if workers is None:
+            workers = os.cpu_count() or 1
+        workers = min(workers, len(paths))
 
-            for idx, line in enumerate(lines, start=1):
-                for m in regex.finditer(line):
-                    before_start = max(0, idx - 1 - context_lines)
-                    before = lines[before_start : idx - 1]
-                    after_end = min(len(lines), idx - 1 + 1 + context_lines)
-                    after = lines[idx : after_end]
-
-                    file_matches.append(
-                        MatchContext(
-                            file=os.path.basename(path),
-                            path=path,
-                            line_number=idx,
-                            match_text=m.group(0),
-                            context_before=before,
-                            context_line=line,
-                            context_after=after,
-                        )
-                    )
-
-                    if max_matches_per_file is not None and len(file_matches) >= max_matches_per_file:
-                        break
-                if max_matches_per_file is not None and len(file_matches) >= max_matches_per_file:
-                    break
+        scanned: Optional[List[Optional[FileMatches]]] = None
+        if workers > 1 and sum(size for _, size in sized) >= PARALLEL_MIN_BYTES:
+            scanned = self._scan_parallel(paths, regex, workers, context_lines, max_matches_per_file)
+        if scanned is None:
+            matchers = self._prepare(regex)
+            scanned = [self._scan_file(path, matchers, context_lines, max_matches_per_file) for path in paths]
 
-            if file_matches:
-                total_files_with_matches += 1
-                total_matches += len(file_matches)
-                all_file_matches.append(
-                    FileMatches(
-                        file=os.path.basename(path),
-                        path=path,
-                        match_count=len(file_matches),
-                        matches=file_matches,
-                    )
-                )
+        all_file_matches = [fm for fm in scanned if fm is not None]
+        total_files_scanned = len(paths)
+        total_files_with_matches = len(all_file_matches)
+        total_matches = sum(fm.match_count for fm in all_file_matches)
 
         return {
             "summary": {
@@ -232,6 +428,177 @@ class SmartSearch:
             "matches": [self._file_matches_to_dict(fm) for fm in all_file_matches],
         }
 
+    def _scan_parallel(
+        self,
+        paths: List[str],
+        regex: "re.Pattern[str]",
+        workers: int,
+        context_lines: int,
+        max_matches_per_file: Optional[int],
+    ) -> Optional[List[Optional[FileMatches]]]:
+        """Scan files in a process pool; None if the pool cannot be used (caller falls back)."""
+        chunksize = max(1, len(paths) // (workers * 4))
+        n = len(paths)
+        try:
+            # Never fork: the caller (e.g. the MasterSecurityTool menu) may have
+            # live threads, and forking a threaded process can deadlock the child.
+            method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context(method)
+            ) as pool:
+                # map() keeps the input order, so output is deterministic
+                return list(pool.map(
+                    _scan_one,
+                    [self] * n, [regex.pattern] * n, [regex.flags] * n, paths,
+                    [context_lines] * n, [max_matches_per_file] * n,
+                    chunksize=chunksize,
+                ))
+        except (OSError, concurrent.futures.process.BrokenProcessPool):
+            return None
+
+    def _prepare(self, regex: "re.Pattern[str]") -> _Matchers:
+        """Derive the prefilter, per-line matcher and literal needle for a pattern."""
+        return _Matchers(
+            may_match=self._compile_prefilter(regex.pattern, not (regex.flags & re.IGNORECASE)),
+            line_matches=self._fastpath(regex) or (lambda line: (m.group(0) for m in regex.finditer(line))),
+            needle=self._literal_needle(regex),
+        )
+
+    def _scan_file(
+        self,
+        path: str,
+        matchers: _Matchers,
+        context_lines: int,
+        max_matches_per_file: Optional[int],
+    ) -> Optional[FileMatches]:
+        """Scan one file; None when it has no matches (or cannot be read)."""
+        if matchers.needle is not None and not self._file_contains(path, matchers.needle):
+            return None
+        text = self._read_text_file(path)
+        if text is None:
+            return None
+
+        lines = text.splitlines()
+        if matchers.may_match is not None and not matchers.may_match(lines):
+            return None
+        line_matches = matchers.line_matches
+        file_matches: List[MatchContext] = []
+
+        for idx, line in enumerate(lines, start=1):
+            for match_text in line_matches(line):
+                before_start = max(0, idx - 1 - context_lines)
+                before = lines[before_start : idx - 1]
+                after_end = min(len(lines), idx - 1 + 1 + context_lines)
+                after = lines[idx : after_end]
+
+                file_matches.append(
+                    MatchContext(
+                        file=os.path.basename(path),
+                        path=path,
+                        line_number=idx,
+                        match_text=match_text,
+                        context_before=before,
+                        context_line=line,
+                        context_after=after,
+                    )
+                )
+
+                if max_matches_per_file is not None and len(file_matches) >= max_matches_per_file:
+                    break
+            if max_matches_per_file is not None and len(file_matches) >= max_matches_per_file:
+                break
+
+        if not file_matches:
+            return None
+        return FileMatches(
+            file=os.path.basename(path),
+            path=path,
+            match_count=len(file_matches),
+            matches=file_matches,
+        )
+
+    # ^.{n}$ / ^.{n,}$ / ^.{n,m}$ : a pure line-length check
+    _LENGTH_ONLY_RE = re.compile(r"\^\.\{(\d+)(,(\d*))?\}\$")
+    # Flags that do not change what the fast paths below match on a single line
+    _FASTPATH_FLAGS = re.IGNORECASE | re.MULTILINE | re.UNICODE
+
+    @classmethod
+    def _fastpath(cls, regex: "re.Pattern[str]") -> Optional[Callable[[str], Iterable[str]]]:
+        """
+        Recognize trivial pattern shapes and return a ``line -> match texts``
+        callable built on plain ``str`` operations, or None to use the regex.
+
+        Each fast path yields exactly what ``regex.finditer(line)`` would for a
+        single line (lines never contain a newline).
+        """
+        if regex.flags & ~cls._FASTPATH_FLAGS:
+            return None
+        pattern = regex.pattern
+
+        if pattern == ".+":
+            return lambda line: (line,) if line else ()
+        if pattern == ".*":
+            # finditer also reports the empty match at the end of a non-empty line
+            return lambda line: (line, "") if line else ("",)
+
+        length = cls._LENGTH_ONLY_RE.fullmatch(pattern)
+        if length:
+            low = int(length.group(1))
+            high = low if length.group(2) is None else (int(length.group(3)) if length.group(3) else None)
+            return lambda line: (line,) if len(line) >= low and (high is None or len(line) <= high) else ()
+
+        anchored = pattern.startswith("^")
+        literal = pattern[1:] if anchored else pattern
+        if not literal or re.escape(literal) != literal:
+            return None
+        step = len(literal)
+
+        if not regex.flags & re.IGNORECASE:
+            if anchored:
+                return lambda line: (literal,) if line.startswith(literal) else ()
+
+            def find_all(line: str) -> Iterable[str]:
+                pos = line.find(literal)
+                while pos != -1:
+                    yield literal
+                    pos = line.find(literal, pos + step)
+
+            return find_all
+
+        # Case-insensitive: lower() keeps offsets only for ASCII, so the
+        # original text can be sliced back out; other lines use the regex.
+        if not literal.isascii():
+            return None
+        folded = literal.lower()
+
+        def find_all_caseless(line: str) -> Iterable[str]:
+            if not line.isascii():
+                for m in regex.finditer(line):
+                    yield m.group(0)
+                return
+            lowered = line.lower()
+            if anchored:
+                if lowered.startswith(folded):
+                    yield line[:step]
+                return
+            pos = lowered.find(folded)
+            while pos != -1:
+                yield line[pos : pos + step]
+                pos = lowered.find(folded, pos + step)
+
+        return find_all_caseless
+
+    def _compile_prefilter(
+        self, pattern: str, case_sensitive: bool
+    ) -> Optional[Callable[[List[str]], bool]]:
+        """
+        Optional cheap whole-file check run before the per-line regex pass.
+
+        Returns a callable that gets the file's lines and answers False only
+        when no line can match, or None when there is no prefilter.
+        """
+        return None
+
     @staticmethod
     def _file_matches_to_dict(fm: FileMatches) -> Dict[str, Any]:
         return {
@@ -253,6 +620,66 @@ class SmartSearch:
         }
 
 
+class HyperscanSmartSearch(SmartSearch):
+    """
+    SmartSearch that uses Hyperscan (optional dependency) to discard files
+    with no match in a single native pass.
+
+    Files that do match still go through the regular per-line ``re`` scan,
+    so the result structure (line numbers, context, match text) is identical.
+    Patterns Hyperscan cannot compile (backreferences, lookarounds, ...)
+    silently fall back to plain SmartSearch behaviour.
+    """
+
+    # Buffer anchors mean "start/end of line" in the per-line scan but
+    # "start/end of file" for a whole-buffer scan, so they are not prefiltered.
+    _BUFFER_ANCHOR_RE = re.compile(r"\\[AZz]")
+
+    @staticmethod
+    def available() -> bool:
+        return hyperscan is not None
+
+    def _compile_prefilter(
+        self, pattern: str, case_sensitive: bool
+    ) -> Optional[Callable[[List[str]], bool]]:
+        if hyperscan is None or self._BUFFER_ANCHOR_RE.search(pattern):
+            return None
+
+        # Always multiline: the per-line scan lets ^/$ match at every line
+        flags = (
+            hyperscan.HS_FLAG_MULTILINE
+            | hyperscan.HS_FLAG_UTF8
+            | hyperscan.HS_FLAG_UCP
+            | hyperscan.HS_FLAG_ALLOWEMPTY
+        )
+        if not case_sensitive:
+            flags |= hyperscan.HS_FLAG_CASELESS
+
+        db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+        try:
+            db.compile(expressions=[pattern.encode("utf-8")], ids=[0], flags=[flags])
+        except hyperscan.error:
+            return None
+
+        def may_match(lines: List[str]) -> bool:
+            found: List[bool] = []
+
+            def on_match(_id, _start, _end, _flags, _ctx):
+                found.append(True)
+                return True  # first hit is enough; stop scanning
+
+            try:
+                # Re-joined with "\n" so line boundaries match the splitlines() view
+                db.scan("\n".join(lines).encode("utf-8"), match_event_handler=on_match)
+            except hyperscan.error:
+                # Raised when the callback stops the scan (or on a scan error):
+                # in the latter case fall back to scanning the file normally
+                return True
+            return bool(found)
+
+        return may_match
+
+
 if __name__ == "__main__":
     import argparse
     import json
@@ -5,6 +5,7 @@ Discovers subdomains using various techniques including DNS, search engines, and
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import socket
 import dns.resolver
 import ssl
@@ -25,6 +26,12 @@ class SubdomainFinder:
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
+        # Liveness probes: one pool per host, and a dead host is never retried
+        self.probe_session = requests.Session()
+        self.probe_session.headers.update(self.session.headers)
+        probe_adapter = HTTPAdapter(pool_connections=32, max_retries=0)
+        self.probe_session.mount('https://', probe_adapter)
+        self.probe_session.mount('http://', probe_adapter)
         
     def dns_bruteforce(self, domain, wordlist=None):
         """DNS bruteforce for subdomain discovery"""
@@ -162,6 +169,51 @@ class SubdomainFinder:
         
         return open_ports
     
+    def probe_subdomains(self, subdomains, max_workers=20, timeout=5, executor=None):
+        """Probe each subdomain over HTTPS/HTTP with a bounded thread pool.
+
+        Pass ``executor`` to reuse a long-lived pool instead of creating one
+        per call (``max_workers`` is then ignored).
+
+        Returns a dict mapping each subdomain to its probe result
+        (``url``, ``status``, ``server``), or None when unreachable.
+        """
+        def probe(subdomain):
+            for scheme in ('https', 'http'):
+                url = f"{scheme}://{subdomain}"
+                try:
+                    # Pooled, no-retry session: an unreachable host fails fast
+                    response = self.probe_session.get(url, timeout=timeout, allow_redirects=True, stream=True)
+                    response.close()
+                    return {
+                        'url': response.url,
+                        'status': response.status_code,
+                        'server': response.headers.get('Server', ''),
+                    }
+                except requests.RequestException:
+                    continue
+            return None
+
+        results = {}
+        if not subdomains:
+            return results
+
+        def collect(executor):
+            futures = {executor.submit(probe, sub): sub for sub in subdomains}
+            for future in concurrent.futures.as_completed(futures):
+                subdomain = futures[future]
+                results[subdomain] = future.result()
+                if results[subdomain]:
+                    print(f"  ✅ {subdomain}: HTTP {results[subdomain]['status']}")
+
+        if executor is not None:
+            collect(executor)
+        else:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(max_workers, len(subdomains))) as pool:
+                collect(pool)
+
+        return results
+    
     def save_results(self, results, filename):
         """Save results to JSON file"""
         with open(filename, 'w', encoding='utf-8') as f: